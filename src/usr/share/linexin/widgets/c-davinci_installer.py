@@ -5,15 +5,31 @@ import threading
 import gettext
 import locale
 import os
-import shutil
 import shlex
-import re
+import sqlite3
+import sys
 import glob
-import tempfile
+import json
+import time
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gtk, Adw, GLib, Gio, Gdk
+from gi.repository import Gtk, Adw, GLib, Gio, Gdk, Pango
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from davinci_installer import (
+    artifacts, config, deps, diagnose, history, locking, logarchive, opencl, pkgdb, priority,
+    privhelper, profiling, removal, verify, versions,
+)
+from davinci_installer.engine import (
+    INSTALL_STAGES, STEP_STAGES, InstallEngine, PreflightError, format_plan,
+)
+from davinci_installer.logchannel import LogChannel
+from davinci_installer.logview import CSS as LOG_VIEW_CSS, LogView
+from davinci_installer.watcher import InstallerWatcher
+
+# Idle and timeout callbacks are timed while DAVINCI_INSTALLER_PROFILE is set
+GLib = profiling.instrument(GLib)
 
 APP_NAME = "davinci-installer"
 LOCALE_DIR = "/usr/share/locale"
@@ -54,14 +70,48 @@ class DaVinciInstallerWidget(Gtk.Box):
         self.hide_sidebar = hide_sidebar
         self.install_started = False
         self.error_message = None
+        self.error_heading = None
         self.user_password = None
         self.progress_data = ""
         self.total_steps = 3
         self.current_product = "DaVinci Resolve"
-        self.tmp_build_dir = None
-        self.original_run_file_path = None
+        self.pending_fingerprint = None
+        self.ready_candidate = None
+        self.watcher = None
+        self.settings = config.load()
         self.current_screenshot_idx = 0
         self.screenshots = self._load_screenshots()
+        self.gpu_report = None
+        self._removal_poll_id = None
+        self.last_diagnosis = None
+        self._eta_medians = {}
+        self._eta_stage = None
+        self._eta_stage_started = 0
+        self._eta_timer_id = None
+        # Held from _start_helper to _stop_helper so removals queue behind installs
+        self._session_lock = None
+        # Step label hidden while a "waiting for..." message is shown
+        self._label_before_wait = None
+        self.log_channel = LogChannel(lambda flush: GLib.timeout_add(100, flush))
+        self.log_channel.connect(self._on_log_batch)
+        self.install_engine = None
+        self.last_log_path = None
+        # Archive of the running removal-style run, shown by the progress view
+        self.removal_log = None
+
+        self._actions = Gio.SimpleActionGroup()
+        self.insert_action_group("davinci", self._actions)
+        self._add_action("check-gpu", self._on_check_gpu)
+        self._add_action("prune-versions", self._on_prune_versions)
+        self._add_action("reclaim-space", self._on_reclaim_space)
+        self._add_action("view-logs", self._on_view_logs)
+        self._add_action("verify-install", self._on_verify_install)
+        priority_action = Gio.SimpleAction.new_stateful(
+            "install-priority", GLib.VariantType.new("s"),
+            GLib.Variant("s", priority.from_settings(self.settings)),
+        )
+        priority_action.connect("change-state", self._on_priority_changed)
+        self._actions.add_action(priority_action)
 
         self._apply_css()
         self._build_header()
@@ -90,6 +140,19 @@ class DaVinciInstallerWidget(Gtk.Box):
         pattern = os.path.join(SCREENSHOTS_DIR, "davinci*.png")
         return sorted(glob.glob(pattern))
 
+    def _add_action(self, name, callback):
+        action = Gio.SimpleAction.new(name, None)
+        action.connect("activate", lambda _a, _p: callback())
+        self._actions.add_action(action)
+
+    def _on_priority_changed(self, action, value):
+        action.set_state(value)
+        self.settings["install_priority"] = value.get_string()
+        try:
+            config.save(self.settings)
+        except OSError as e:
+            print(f"Could not save settings: {e}", flush=True)
+
     def _apply_css(self):
         css = b"""
 .screenshot-bg-davinci {
@@ -100,7 +163,7 @@ class DaVinciInstallerWidget(Gtk.Box):
 }
 """
         provider = Gtk.CssProvider()
-        provider.load_from_data(css)
+        provider.load_from_data(css + LOG_VIEW_CSS.encode())
         Gtk.StyleContext.add_provider_for_display(
             Gdk.Display.get_default(),
             provider,
@@ -156,8 +219,55 @@ class DaVinciInstallerWidget(Gtk.Box):
         self._build_carousel()
         self._build_progress()
 
+        self._build_ready_card()
         self.append(self.content_stack)
 
+    def _build_ready_card(self):
+        self.ready_revealer = Gtk.Revealer()
+        self.ready_revealer.set_transition_type(Gtk.RevealerTransitionType.SLIDE_DOWN)
+
+        card = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        card.add_css_class("card")
+        card.set_margin_top(12)
+
+        icon = Gtk.Image.new_from_icon_name("folder-download-symbolic")
+        icon.set_pixel_size(32)
+        icon.set_margin_start(12)
+        card.append(icon)
+
+        text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
+        text_box.set_hexpand(True)
+        text_box.set_valign(Gtk.Align.CENTER)
+        text_box.set_margin_top(12)
+        text_box.set_margin_bottom(12)
+        self.ready_title = Gtk.Label()
+        self.ready_title.add_css_class("heading")
+        self.ready_title.set_halign(Gtk.Align.START)
+        text_box.append(self.ready_title)
+        self.ready_subtitle = Gtk.Label()
+        self.ready_subtitle.add_css_class("dim-label")
+        self.ready_subtitle.add_css_class("caption")
+        self.ready_subtitle.set_halign(Gtk.Align.START)
+        self.ready_subtitle.set_ellipsize(Pango.EllipsizeMode.END)
+        text_box.append(self.ready_subtitle)
+        card.append(text_box)
+
+        btn_install = Gtk.Button(label=_("Install"))
+        btn_install.add_css_class("suggested-action")
+        btn_install.set_valign(Gtk.Align.CENTER)
+        btn_install.connect("clicked", self._on_install_candidate)
+        card.append(btn_install)
+
+        btn_dismiss = Gtk.Button.new_from_icon_name("window-close-symbolic")
+        btn_dismiss.add_css_class("flat")
+        btn_dismiss.set_valign(Gtk.Align.CENTER)
+        btn_dismiss.set_margin_end(12)
+        btn_dismiss.connect("clicked", lambda _b: self.ready_revealer.set_reveal_child(False))
+        card.append(btn_dismiss)
+
+        self.ready_revealer.set_child(card)
+        self.append(self.ready_revealer)
+
     def _build_carousel(self):
         box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
         box.set_valign(Gtk.Align.FILL)
@@ -219,12 +329,28 @@ class DaVinciInstallerWidget(Gtk.Box):
         self.progress_bar.set_hexpand(True)
         box.append(self.progress_bar)
 
+        self.eta_label = Gtk.Label()
+        self.eta_label.add_css_class("dim-label")
+        self.eta_label.set_visible(False)
+        box.append(self.eta_label)
+
         self.warning_label = Gtk.Label(
             label=_("Installation in progress. Do NOT close the app.")
         )
         self.warning_label.add_css_class("title-3")
         box.append(self.warning_label)
 
+        self.btn_toggle_output = Gtk.ToggleButton(label=_("Show progress"))
+        self.btn_toggle_output.set_halign(Gtk.Align.CENTER)
+        self.btn_toggle_output.connect("toggled", self._on_toggle_output)
+        box.append(self.btn_toggle_output)
+
+        self.log_view = LogView()
+        self.log_view.set_size_request(640, 320)
+        self.output_revealer = Gtk.Revealer()
+        self.output_revealer.set_child(self.log_view)
+        box.append(self.output_revealer)
+
         spacer = Gtk.Box()
         spacer.set_vexpand(True)
         box.append(spacer)
@@ -274,15 +400,33 @@ class DaVinciInstallerWidget(Gtk.Box):
         btn.add_css_class("suggested-action")
         btn.connect("clicked", self._on_select_run)
         self.action_box.append(btn)
+        self.action_box.append(self._build_tools_menu())
 
         self.content_stack.set_visible_child_name("carousel")
+        self._start_watcher()
 
     def _set_state_installing(self):
         self._clear_actions()
         btn = Gtk.Button(label=_("Installing..."))
         btn.set_sensitive(False)
         self.action_box.append(btn)
+        self.warning_label.set_label(_("Installation in progress. Do NOT close the app."))
+        self.btn_toggle_output.set_visible(True)
+        self.content_stack.set_visible_child_name("progress")
+        self._stop_watcher()
+
+    def _set_state_removing(self):
+        self._clear_actions()
+        btn = Gtk.Button(label=_("Removing..."))
+        btn.set_sensitive(False)
+        self.action_box.append(btn)
+        self.warning_label.set_label(_("Removal in progress. Do NOT close the app."))
+        self.step_label.set_label(_("Removing {}...").format(self.current_product))
+        self.progress_bar.set_fraction(0)
+        self.eta_label.set_visible(False)
+        self.btn_toggle_output.set_visible(True)
         self.content_stack.set_visible_child_name("progress")
+        self._stop_watcher()
 
     def _set_state_post_install(self):
         self._clear_actions()
@@ -297,7 +441,96 @@ class DaVinciInstallerWidget(Gtk.Box):
         self.btn_launch.connect("clicked", self._on_launch)
         self.action_box.append(self.btn_launch)
 
+        installed = versions.installed_versions()
+        if len(installed) > 1:
+            self.action_box.prepend(self._build_version_picker(installed))
+
+        self.action_box.append(self._build_tools_menu(installed))
+
         self.content_stack.set_visible_child_name("carousel")
+        self._start_watcher()
+
+    def _build_version_picker(self, installed):
+        self.installed_versions = installed
+        picker = Gtk.DropDown.new_from_strings([versions.label(i) for i in installed])
+        picker.set_tooltip_text(_("Active version"))
+        active = [i for i, info in enumerate(installed) if info["active"]]
+        if active:
+            picker.set_selected(active[0])
+        picker.connect("notify::selected", self._on_version_selected)
+        self.version_picker = picker
+        return picker
+
+    def _build_tools_menu(self, installed=()):
+        menu = Gio.Menu()
+        menu.append(_("Check GPU readiness"), "davinci.check-gpu")
+        if installed:
+            menu.append(_("Verify installation"), "davinci.verify-install")
+        if any(not info["active"] for info in installed):
+            menu.append(_("Remove old versions"), "davinci.prune-versions")
+        menu.append(_("Reclaim space"), "davinci.reclaim-space")
+        menu.append(_("View previous logs"), "davinci.view-logs")
+
+        # Takes effect for the next install or removal
+        profiles = Gio.Menu()
+        for profile, label in (
+            (priority.FOREGROUND, _("Full speed")),
+            (priority.BACKGROUND, _("In the background")),
+            (priority.IDLE, _("Only when idle")),
+        ):
+            profiles.append(label, f"davinci.install-priority::{profile}")
+        menu.append_section(_("Install priority"), profiles)
+
+        btn = Gtk.MenuButton()
+        btn.set_icon_name("open-menu-symbolic")
+        btn.set_menu_model(menu)
+        return btn
+
+    # ── Download watcher ────────────────────────────────────────────
+
+    def _start_watcher(self):
+        if self.watcher:
+            return
+        dirs = InstallerWatcher.default_directories(self.settings)
+        if not dirs:
+            return
+        self.watcher = InstallerWatcher(dirs, self._on_installer_ready, kinds=("run", "zip"))
+        self.watcher.start()
+
+    def _stop_watcher(self):
+        if self.watcher:
+            self.watcher.stop()
+            self.watcher = None
+        self.ready_revealer.set_reveal_child(False)
+
+    def _on_installer_ready(self, candidate):
+        if not self.watcher or not candidate["validation"]["ok"]:
+            return False
+        root = versions.root_name(candidate["version"], candidate["studio"])
+        if any(info["name"] == root for info in versions.installed_versions()):
+            return False
+
+        self.ready_candidate = candidate
+        product = "DaVinci Resolve Studio" if candidate["studio"] else "DaVinci Resolve"
+        self.ready_title.set_label(
+            _("{} {} is ready to install").format(product, candidate["version"])
+        )
+        self.ready_subtitle.set_label("{}  ·  {}  ·  SHA-256 {}".format(
+            os.path.basename(candidate["path"]),
+            pkgdb.format_size(candidate["size"]),
+            candidate["sha256"][:16],
+        ))
+        self.ready_revealer.set_reveal_child(True)
+        return False
+
+    def _on_install_candidate(self, _btn):
+        candidate = self.ready_candidate
+        if not candidate or not os.path.exists(candidate["path"]):
+            self.ready_revealer.set_reveal_child(False)
+            return
+        self.pending_run_file_path = candidate["path"]
+        self.pending_fingerprint = candidate.get("sha256")
+        self._prompt_password()
 
     # ── Installation detection ──────────────────────────────────────
 
@@ -319,8 +552,9 @@ class DaVinciInstallerWidget(Gtk.Box):
         dlg.add_button(_("Open"), Gtk.ResponseType.OK)
 
         flt = Gtk.FileFilter()
-        flt.set_name(_("DaVinci Resolve Installer (*.run)"))
+        flt.set_name(_("DaVinci Resolve Installer (*.run, *.zip)"))
         flt.add_pattern("*.run")
+        flt.add_pattern("*.zip")
         dlg.add_filter(flt)
 
         def on_resp(d, r):
@@ -328,6 +562,7 @@ class DaVinciInstallerWidget(Gtk.Box):
                 f = d.get_file()
                 if f:
                     self.pending_run_file_path = f.get_path()
+                    self.pending_fingerprint = None
                     self._prompt_password()
             d.destroy()
 
@@ -360,6 +595,19 @@ class DaVinciInstallerWidget(Gtk.Box):
     def _is_kde_plasma():
         return os.environ.get("XDG_CURRENT_DESKTOP", "").lower().find("kde") != -1
 
+    @staticmethod
+    def _wait_for_process_group(pgid, timeout=10):
+        """Wait until every process Resolve left in its group (crash reporter, panels daemon) is gone."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                os.killpg(pgid, 0)
+            except ProcessLookupError:
+                return
+            except PermissionError:
+                pass
+            time.sleep(0.2)
+
     def _on_launch(self, _btn):
         self._set_buttons_launching()
 
@@ -375,7 +623,8 @@ class DaVinciInstallerWidget(Gtk.Box):
                         [RESOLVE_BIN], start_new_session=True,
                     )
                     proc.wait()
-                    import time; time.sleep(2)
+                    # The menu module comes back once nothing of Resolve's is left
+                    self._wait_for_process_group(proc.pid)
                     subprocess.run(
                         ["qdbus", "org.kde.kded6", "/kded",
                          "org.kde.kded6.loadModule", "appmenu"],
@@ -404,8 +653,370 @@ class DaVinciInstallerWidget(Gtk.Box):
         self.btn_launch.set_sensitive(True)
         self.btn_remove.set_sensitive(True)
 
+    # ── GPU readiness ───────────────────────────────────────────────
+
+    def _gpu_readiness(self):
+        expected = self._detect_opencl_package().split()
+        return opencl.check_readiness(expected)
+
+    def _on_check_gpu(self):
+        def _check():
+            report = self._gpu_readiness()
+            GLib.idle_add(self._show_gpu_report, report)
+
+        threading.Thread(target=_check, daemon=True).start()
+
+    def _show_gpu_report(self, report):
+        if report["ready"]:
+            heading = _("Resolve is ready to launch")
+        else:
+            heading = _("OpenCL setup needs attention")
+        dlg = Adw.MessageDialog(
+            heading=heading,
+            body=opencl.format_summary(report),
+            transient_for=self.get_root() or self.window,
+        )
+        dlg.add_response("ok", _("OK"))
+        try:
+            translate_dialog(dlg)
+        except NameError:
+            pass
+        dlg.present()
+        return False
+
+    # ── Verification ────────────────────────────────────────────────
+
+    def _on_verify_install(self):
+        dlg = Adw.MessageDialog(
+            heading=_("Verifying installation"),
+            body=_("Checking the installed files against the package..."),
+            transient_for=self.get_root() or self.window,
+        )
+        bar = Gtk.ProgressBar()
+        bar.set_show_text(True)
+        dlg.set_extra_child(bar)
+        dlg.add_response("close", _("Close"))
+        dlg.set_response_enabled("close", False)
+        try:
+            translate_dialog(dlg)
+        except NameError:
+            pass
+        dlg.present()
+
+        def _progress(done, total):
+            GLib.idle_add(bar.set_fraction, done / total if total else 1.0)
+
+        def _verify():
+            report = None
+            error = None
+            try:
+                found = verify.installed_package()
+                if not found:
+                    raise RuntimeError(_("DaVinci Resolve is not installed as a package."))
+                report = verify.verify(*found, on_progress=_progress)
+            except (OSError, RuntimeError) as e:
+                error = str(e)
+            GLib.idle_add(self._show_verify_report, dlg, report, error)
+
+        threading.Thread(target=_verify, daemon=True).start()
+
+    def _show_verify_report(self, dlg, report, error):
+        dlg.set_extra_child(None)
+        dlg.set_response_enabled("close", True)
+        if error:
+            dlg.set_heading(_("Verification failed"))
+            dlg.set_body(error)
+        elif report["problems"]:
+            dlg.set_heading(_("{} files don't match the package").format(len(report["problems"])))
+            dlg.set_body(verify.format_report(report) + "\n\n" + _("Reinstall DaVinci Resolve to repair them."))
+        else:
+            dlg.set_heading(_("All installed files are intact"))
+            dlg.set_body(verify.format_report(report))
+        return False
+
+    # ── Logs ────────────────────────────────────────────────────────
+
+    def _on_toggle_output(self, button):
+        shown = button.get_active()
+        button.set_label(_("Hide progress") if shown else _("Show progress"))
+        self.output_revealer.set_reveal_child(shown)
+        if shown:
+            self._sync_log_view()
+
+    def _on_log_batch(self, _lines):
+        if self.output_revealer.get_reveal_child():
+            self._sync_log_view()
+
+    def _sync_log_view(self):
+        writer = self.removal_log
+        if writer is None and self.install_engine:
+            writer = self.install_engine.log_writer
+        if writer is not self.log_view.source:
+            self.log_view.set_source(writer)
+        else:
+            self.log_view.refresh()
+
+    def _on_view_logs(self, path=None):
+        def _load():
+            try:
+                runs = [r for r in history.recent(50) if r["log"] and os.path.exists(r["log"])]
+            except (sqlite3.Error, OSError):
+                runs = []
+            GLib.idle_add(self._show_log_window, runs, path)
+
+        threading.Thread(target=_load, daemon=True).start()
+
+    @staticmethod
+    def _run_label(run):
+        kinds = {
+            "install": _("Installation"),
+            "build": _("Build"),
+            "remove": _("Removal"),
+            "prune": _("Remove old versions"),
+            "reclaim": _("Reclaim space"),
+        }
+        outcomes = {
+            history.SUCCESS: _("succeeded"),
+            history.FAILED: _("failed"),
+            history.RUNNING: _("interrupted"),
+        }
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(run["started"]))
+        what = " ".join(
+            p for p in (kinds.get(run["kind"], run["kind"]), run["version"]) if p
+        )
+        return "{}  {}  ({})".format(when, what, outcomes.get(run["outcome"], run["outcome"]))
+
+    def _show_log_window(self, runs, path=None):
+        if not runs:
+            dlg = Adw.MessageDialog(
+                heading=_("No logs yet"),
+                body=_("Logs are kept for every install and removal from now on."),
+                transient_for=self.get_root() or self.window,
+            )
+            dlg.add_response("ok", _("OK"))
+            try:
+                translate_dialog(dlg)
+            except NameError:
+                pass
+            dlg.present()
+            return False
+
+        win = Adw.Window(transient_for=self.get_root() or self.window)
+        win.set_title(_("Install logs"))
+        win.set_default_size(900, 600)
+
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        header = Adw.HeaderBar()
+        picker = Gtk.DropDown.new_from_strings([self._run_label(r) for r in runs])
+        header.set_title_widget(picker)
+        box.append(header)
+
+        view = LogView()
+        view.set_follow(False)
+        view.set_margin_start(12)
+        view.set_margin_end(12)
+        view.set_margin_top(12)
+        view.set_margin_bottom(12)
+        box.append(view)
+        win.set_content(box)
+
+        readers = []
+
+        def _close_readers():
+            for reader in readers:
+                reader.close()
+            readers.clear()
+
+        def _select(*_args):
+            run = runs[picker.get_selected()]
+            _close_readers()
+            try:
+                readers.append(logarchive.LogReader(run["log"]))
+            except OSError:
+                pass
+            view.set_source(readers[0] if readers else None)
+            # Failures are at the end
+            GLib.idle_add(view.scroll_to_end)
+
+        def _on_close(_win):
+            _close_readers()
+            return False
+
+        selected = [i for i, r in enumerate(runs) if r["log"] == path]
+        picker.set_selected(selected[0] if selected else 0)
+        picker.connect("notify::selected", _select)
+        win.connect("close-request", _on_close)
+        _select()
+        win.present()
+        return False
+
+    # ── Versions ────────────────────────────────────────────────────
+
+    def _on_version_selected(self, picker, _pspec):
+        info = self.installed_versions[picker.get_selected()]
+        if info["active"]:
+            return
+        try:
+            versions.switch(info["name"])
+        except OSError as e:
+            self._show_install_error(str(e), heading=_("Could not switch version"))
+        self._set_state_post_install()
+
+    def _on_prune_versions(self):
+        keep = {versions.active_root(), versions.package_root()}
+        stale = [i for i in versions.installed_versions() if i["name"] not in keep]
+        if not stale:
+            return
+
+        def _measure():
+            sizes = {i["name"]: versions.reclaimable_size(i["path"]) for i in stale}
+            GLib.idle_add(self._confirm_prune, stale, sizes)
+
+        threading.Thread(target=_measure, daemon=True).start()
+
+    def _confirm_prune(self, stale, sizes):
+        lines = [
+            "{}  ({})".format(versions.label(i), pkgdb.format_size(sizes[i["name"]]))
+            for i in stale
+        ]
+        dlg = Adw.MessageDialog(
+            heading=_("Remove old versions?"),
+            body="\n".join(lines),
+            transient_for=self.get_root() or self.window,
+        )
+        dlg.add_response("cancel", _("Cancel"))
+        dlg.add_response("remove", _("Remove"))
+        dlg.set_response_appearance("remove", Adw.ResponseAppearance.DESTRUCTIVE)
+
+        def on_resp(d, r):
+            d.close()
+            if r == "remove":
+                self._prompt_password_for_removal(
+                    lambda: self._perform_prune([i["name"] for i in stale], sum(sizes.values()))
+                )
+
+        dlg.connect("response", on_resp)
+        try:
+            translate_dialog(dlg)
+        except NameError:
+            pass
+        dlg.present()
+        return False
+
+    def _perform_prune(self, names, reclaimable):
+        self._set_state_removing()
+        label = _("Removing old versions...")
+        self.step_label.set_label(label)
+        self._start_removal_log("prune")
+
+        def _prune():
+            report = None
+            error = None
+            run_started = time.time()
+            started = time.monotonic()
+            helper = None
+            try:
+                helper = self._start_helper("prune")
+                free_before = removal.free_bytes(versions.OPT_DIR)
+                GLib.idle_add(
+                    self._start_removal_progress, versions.OPT_DIR, free_before, reclaimable, label
+                )
+                self._privileged(helper, privhelper.script(versions.prune_script(names)))
+                report = {
+                    "heading": _("Old versions removed"),
+                    "packages": names,
+                    "reclaimed": reclaimable,
+                    "seconds": time.monotonic() - started,
+                }
+            except Exception as e:
+                error = str(e)
+            finally:
+                self._stop_helper(helper)
+            self._record_run("prune", run_started, error)
+            GLib.idle_add(self._finish_removal, report, error)
+
+        threading.Thread(target=_prune, daemon=True).start()
+
+    def _on_reclaim_space(self):
+        def _scan():
+            stale = artifacts.scan()
+            GLib.idle_add(self._confirm_reclaim, stale)
+
+        threading.Thread(target=_scan, daemon=True).start()
+
+    def _confirm_reclaim(self, stale):
+        total = sum(a["size"] for a in stale)
+        dlg = Adw.MessageDialog(
+            heading=_("Reclaim space") if stale else _("Nothing to reclaim"),
+            transient_for=self.get_root() or self.window,
+        )
+        if stale:
+            lines = [
+                "{}  ({})".format(a["path"], pkgdb.format_size(a["size"])) for a in stale
+            ]
+            lines.append(_("Total: {}").format(pkgdb.format_size(total)))
+            dlg.set_body("\n".join(lines))
+            dlg.add_response("cancel", _("Cancel"))
+            dlg.add_response("remove", _("Remove"))
+            dlg.set_response_appearance("remove", Adw.ResponseAppearance.DESTRUCTIVE)
+        else:
+            dlg.set_body(_("No old DaVinci Resolve or opencl-amd packages were found."))
+            dlg.add_response("ok", _("OK"))
+
+        def on_resp(d, r):
+            d.close()
+            if r == "remove":
+                self._prompt_password_for_removal(
+                    lambda: self._perform_reclaim([a["path"] for a in stale], total)
+                )
+
+        dlg.connect("response", on_resp)
+        try:
+            translate_dialog(dlg)
+        except NameError:
+            pass
+        dlg.present()
+        return False
+
+    def _perform_reclaim(self, paths, reclaimable):
+        self._set_state_removing()
+        label = _("Removing old packages...")
+        self.step_label.set_label(label)
+        self._start_removal_log("reclaim")
+
+        def _reclaim():
+            report = None
+            error = None
+            run_started = time.time()
+            started = time.monotonic()
+            helper = None
+            try:
+                helper = self._start_helper("reclaim")
+                mount = os.path.dirname(paths[0])
+                GLib.idle_add(
+                    self._start_removal_progress, mount, removal.free_bytes(mount), reclaimable, label
+                )
+                cmd = " ".join(shlex.quote(a) for a in artifacts.remove_command(paths))
+                self._privileged(helper, privhelper.script(cmd))
+                artifacts.forget(paths)
+                report = {
+                    "heading": _("Old packages removed"),
+                    "packages": [os.path.basename(p) for p in paths],
+                    "reclaimed": reclaimable,
+                    "seconds": time.monotonic() - started,
+                }
+            except Exception as e:
+                error = str(e)
+            finally:
+                self._stop_helper(helper)
+            self._record_run("reclaim", run_started, error)
+            GLib.idle_add(self._finish_removal, report, error)
+
+        threading.Thread(target=_reclaim, daemon=True).start()
+
     # ── Remove helper ───────────────────────────────────────────────
-    def _prompt_password_for_removal(self):
+    def _prompt_password_for_removal(self, on_unlock=None):
+        on_unlock = on_unlock or self._perform_removal
         dlg = Adw.MessageDialog(
             heading=_("Authentication Required"),
             body=_("Please enter your password to proceed with the removal."),
@@ -429,11 +1040,11 @@ class DaVinciInstallerWidget(Gtk.Box):
                     try:
                         if sudo_manager.validate_password(pwd):
                             sudo_manager.set_password(pwd)
-                            self._perform_removal()
+                            on_unlock()
                         else:
                             self._show_auth_error()
                     except NameError:
-                        self._perform_removal()
+                        on_unlock()
             else:
                 self._set_state_post_install()
 
@@ -444,39 +1055,153 @@ class DaVinciInstallerWidget(Gtk.Box):
         except NameError:
             pass
         dlg.present()
+
     def _perform_removal(self):
-        self._clear_actions()
-        btn = Gtk.Button(label=_("Removing..."))
-        btn.set_sensitive(False)
-        self.action_box.append(btn)
+        self._set_state_removing()
+        self._start_removal_log("remove")
 
         def _remove():
+            report = None
+            error = None
+            run_started = time.time()
+            edition = None
+            helper = None
             try:
-                sudo_manager.start_privileged_session()
-                env = sudo_manager.get_env()
-                sudo_wrap = sudo_manager.wrapper_path
-
-                # Try removing both package variants
-                subprocess.run(
-                    f"{sudo_wrap} pacman -Rns --noconfirm davinci-resolve davinci-resolve-studio 2>/dev/null; true",
-                    shell=True, env=env,
-                )
-            except NameError:
-                subprocess.run(
-                    "sudo pacman -Rns --noconfirm davinci-resolve davinci-resolve-studio 2>/dev/null; true",
-                    shell=True,
-                )
+                helper = self._start_helper("remove")
+
+                # Only remove the edition that is actually installed
+                packages = removal.installed_packages()
+                if not packages:
+                    raise RuntimeError(_("DaVinci Resolve is not installed as a package."))
+                edition = history.edition("davinci-resolve-studio" in packages)
+                if "davinci-resolve-studio" in packages:
+                    self.current_product = "DaVinci Resolve Studio"
+                else:
+                    self.current_product = "DaVinci Resolve"
+
+                expected = sum(pkgdb.installed_size(p) or 0 for p in packages)
+                mount = os.path.dirname(RESOLVE_DIR)
+                free_before = removal.free_bytes(mount)
+                started = time.monotonic()
+                GLib.idle_add(self._start_removal_progress, mount, free_before, expected)
+
+                self._privileged(helper, privhelper.remove(packages))
+
+                # Fall back to a retained version, which still needs the pinned
+                # libraries; otherwise drop the dangling links and our IgnorePkg entries
+                retained = versions.installed_versions()
+                if retained:
+                    versions.switch(retained[0]["name"])
+                else:
+                    ops = [privhelper.script(versions.deactivate_script())]
+                    added = removal.added_ignores()
+                    if added:
+                        ops.append(privhelper.ignore("remove", added, optional=True))
+                    results = self._privileged(helper, *ops)
+                    removal.forget_ignores(privhelper.ignore_changes(ops, results, "remove"))
+
+                freed = removal.free_bytes(mount) - free_before
+                report = {
+                    "packages": packages,
+                    # Measured: retained roots share inodes with what was removed
+                    "reclaimed": max(freed, 0),
+                    "expected": expected,
+                    "seconds": time.monotonic() - started,
+                }
+            except Exception as e:
+                error = str(e)
+                print(f"Removal error: {e}", flush=True)
             finally:
-                try:
-                    sudo_manager.stop_privileged_session()
-                    sudo_manager.forget_password()
-                except NameError:
-                    pass
+                self._stop_helper(helper)
 
-            GLib.idle_add(self._set_state_pre_install)
+            self._record_run("remove", run_started, error, edition)
+            GLib.idle_add(self._finish_removal, report, error)
 
         threading.Thread(target=_remove, daemon=True).start()
 
+    def _start_removal_log(self, kind):
+        """Archive a removal-style run's output as it arrives, for the progress view."""
+        self.progress_data = ""
+        self.log_view.set_source(None)
+        self.log_view.set_follow(True)
+        try:
+            self.removal_log = logarchive.LogWriter(logarchive.log_path(f"{kind}-{int(time.time())}"))
+        except OSError as e:
+            print(f"Could not archive the log: {e}", flush=True)
+            self.removal_log = None
+        self._sync_log_view()
+
+    def _record_run(self, kind, run_started, error, edition=None):
+        """Store a removal-style run in the install history."""
+        self.last_log_path = None
+        log = None
+        if self.removal_log:
+            try:
+                self.removal_log.close()
+                log = self.removal_log.path
+            except OSError:
+                pass
+        try:
+            run_id = history.start_run(
+                kind, edition, started=run_started, priority=priority.from_settings(self.settings)
+            )
+            diagnosis = self.last_diagnosis if error else None
+            history.finish_run(
+                run_id,
+                history.FAILED if error else history.SUCCESS,
+                time.time() - run_started,
+                diagnosis=diagnosis["rule"] if diagnosis else None,
+                error=error.strip().splitlines()[0] if error and error.strip() else None,
+                log=log or logarchive.write_text(logarchive.log_path(f"run-{run_id}"), self.progress_data),
+            )
+            self.last_log_path = log or logarchive.log_path(f"run-{run_id}")
+            logarchive.prune(logarchive.retention_bytes(self.settings), keep=(self.last_log_path,))
+        except (sqlite3.Error, OSError) as e:
+            print(f"Could not record install history: {e}", flush=True)
+
+    def _start_removal_progress(self, mount, free_before, expected, label=None):
+        self.step_label.set_label(label or _("Removing {}...").format(self.current_product))
+
+        def _poll():
+            fraction = removal.removal_fraction(
+                free_before, removal.free_bytes(mount), expected
+            )
+            self.progress_bar.set_fraction(fraction)
+            return True
+
+        self._removal_poll_id = GLib.timeout_add(500, _poll)
+        return False
+
+    def _finish_removal(self, report, error):
+        if self._removal_poll_id:
+            GLib.source_remove(self._removal_poll_id)
+            self._removal_poll_id = None
+        self.log_channel.flush()
+
+        if error:
+            self._show_install_error(error, heading=_("Removal failed"), log_path=self.last_log_path)
+        else:
+            self.progress_bar.set_fraction(1.0)
+            dlg = Adw.MessageDialog(
+                heading=report.get("heading") or _("{} removed").format(self.current_product),
+                body=_("Reclaimed {} in {:.0f} s.").format(
+                    pkgdb.format_size(report["reclaimed"]), report["seconds"]
+                ),
+                transient_for=self.get_root() or self.window,
+            )
+            dlg.add_response("ok", _("OK"))
+            try:
+                translate_dialog(dlg)
+            except NameError:
+                pass
+            dlg.present()
+
+        if self._is_installed():
+            self._set_state_post_install()
+        else:
+            self._set_state_pre_install()
+        return False
+
     # ── Password prompt ─────────────────────────────────────────────
 
     def _prompt_password(self):
@@ -486,6 +1211,7 @@ class DaVinciInstallerWidget(Gtk.Box):
             transient_for=self.get_root() or self.window,
         )
         dlg.add_response("cancel", _("Cancel"))
+        dlg.add_response("preview", _("Preview"))
         dlg.add_response("unlock", _("Unlock"))
         dlg.set_response_appearance("unlock", Adw.ResponseAppearance.SUGGESTED)
 
@@ -510,6 +1236,8 @@ class DaVinciInstallerWidget(Gtk.Box):
                     except NameError:
                         self.user_password = pwd
                         self._attempt_installation()
+            elif r == "preview":
+                self._on_preview_install()
 
         dlg.connect("response", on_resp)
         entry.connect("activate", lambda _w: dlg.response("unlock"))
@@ -519,6 +1247,68 @@ class DaVinciInstallerWidget(Gtk.Box):
             pass
         dlg.present()
 
+    def _on_preview_install(self):
+        """Show what the install would do; nothing runs and no password is needed."""
+        installer_path = self.pending_run_file_path
+        is_studio = "_Studio_" in os.path.basename(installer_path)
+        dlg = Adw.MessageDialog(
+            heading=_("Install plan"),
+            body=_("Working out the install plan..."),
+            transient_for=self.get_root() or self.window,
+        )
+        dlg.add_response("back", _("Back"))
+        dlg.add_response("copy", _("Copy as JSON"))
+        dlg.set_response_enabled("copy", False)
+        try:
+            translate_dialog(dlg)
+        except NameError:
+            pass
+        result = {}
+
+        def on_resp(d, r):
+            d.close()
+            if r == "copy" and result.get("plan"):
+                data = GLib.Bytes.new(json.dumps(result["plan"], indent=2).encode())
+                self.get_clipboard().set_content(
+                    Gdk.ContentProvider.new_for_bytes("text/plain;charset=utf-8", data)
+                )
+            self._prompt_password()
+
+        dlg.connect("response", on_resp)
+        dlg.present()
+
+        def _plan():
+            plan = None
+            error = None
+            try:
+                _env, sudo_wrap = self._privileged_env()
+                plan = InstallEngine(self.settings, sudo_wrap=sudo_wrap, echo=False).plan(
+                    installer_path, is_studio
+                )
+            except Exception as e:
+                # Whatever went wrong, the dialog must not wait forever
+                error = str(e) or type(e).__name__
+            GLib.idle_add(self._show_install_plan, dlg, result, plan, error)
+
+        threading.Thread(target=_plan, daemon=True).start()
+
+    def _show_install_plan(self, dlg, result, plan, error):
+        if error:
+            dlg.set_heading(_("Could not plan the install"))
+            dlg.set_body(error)
+            return False
+        result["plan"] = plan
+        dlg.set_response_enabled("copy", True)
+        dlg.set_body("")
+        label = Gtk.Label(label=format_plan(plan), xalign=0, selectable=True)
+        label.add_css_class("monospace")
+        scroller = Gtk.ScrolledWindow()
+        scroller.set_min_content_height(320)
+        scroller.set_min_content_width(560)
+        scroller.set_child(label)
+        dlg.set_extra_child(scroller)
+        return False
+
     def _show_auth_error(self):
         dlg = Adw.MessageDialog(
             heading=_("Authentication Failed"),
@@ -535,183 +1325,7 @@ class DaVinciInstallerWidget(Gtk.Box):
     # ── GPU / OpenCL detection ──────────────────────────────────────
 
     def _detect_opencl_package(self):
-        try:
-            lspci = subprocess.run(
-                ["lspci", "-nn"],
-                capture_output=True, text=True, timeout=5,
-            )
-            output = lspci.stdout.lower()
-            # Check VGA and 3D controller lines for GPU vendor
-            has_nvidia = bool(re.search(r"(?:vga|3d).*\bnvidia\b", output))
-            has_amd = bool(re.search(r"(?:vga|3d).*\b(?:amd|ati|radeon)\b", output))
-            if has_nvidia and not has_amd:
-                return "opencl-nvidia"
-            elif has_amd and not has_nvidia:
-                return "opencl-amd"
-            elif has_nvidia and has_amd:
-                # Hybrid GPU — install both
-                return "opencl-amd opencl-nvidia"
-        except Exception:
-            pass
-        # Fallback: check what's already installed
-        for pkg in ("opencl-amd", "opencl-mesa", "opencl-nvidia", "intel-compute-runtime", "rocm-opencl-runtime"):
-            r = subprocess.run(
-                ["pacman", "-Qq", pkg],
-                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-            )
-            if r.returncode == 0:
-                return pkg
-        return "opencl-mesa"
-
-    _OPENCL_AMD_COMMIT = "42c9eb7"
-
-    def _install_opencl_amd(self, sudo_wrap, env, on_line=None):
-        """Build and install opencl-amd from AUR at a known-good commit."""
-        # Skip if already installed at the pinned version
-        r = subprocess.run(
-            ["pacman", "-Qq", "opencl-amd"],
-            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-        )
-        if r.returncode == 0:
-            return
-        tmpdir = tempfile.mkdtemp(prefix="opencl-amd-")
-        try:
-            clone_cmd = (
-                f"git clone https://aur.archlinux.org/opencl-amd.git {shlex.quote(tmpdir)}/opencl-amd "
-                f"&& cd {shlex.quote(tmpdir)}/opencl-amd "
-                f"&& git checkout {self._OPENCL_AMD_COMMIT} "
-                f"&& PACMAN_AUTH='{sudo_wrap}' makepkg -si --noconfirm --needed"
-            )
-            self._run_cmd(clone_cmd, env=env, on_line=on_line)
-        finally:
-            shutil.rmtree(tmpdir, ignore_errors=True)
-
-    # ── Build environment ───────────────────────────────────────────
-
-    def _prepare_build_environment(self, run_file_path, is_studio):
-        original_dir = os.path.dirname(run_file_path)
-        self.tmp_build_dir = os.path.join(original_dir, "davinci_tmp")
-        os.makedirs(self.tmp_build_dir, exist_ok=True)
-        self.original_run_file_path = run_file_path
-
-        if is_studio:
-            source_dir = "/usr/share/linexin/davincistudio"
-            install_file_name = "davinci-resolve-studio.install"
-        else:
-            source_dir = "/usr/share/linexin/davinci"
-            install_file_name = "davinci-resolve.install"
-
-        source_pkgbuild = os.path.join(source_dir, "PKGBUILD")
-        source_panels_script = os.path.join(source_dir, "davinci-control-panels-setup.sh")
-        source_install_file = os.path.join(source_dir, install_file_name)
-
-        for f in [source_pkgbuild, source_panels_script, source_install_file]:
-            if not os.path.exists(f):
-                raise FileNotFoundError(_("Required file not found at {}").format(f))
-
-        src_dir = os.path.join(self.tmp_build_dir, "src")
-        os.makedirs(src_dir, exist_ok=True)
-
-        shutil.copy2(source_pkgbuild, os.path.join(self.tmp_build_dir, "PKGBUILD"))
-        shutil.copy2(source_install_file, os.path.join(self.tmp_build_dir, install_file_name))
-        shutil.copy2(source_panels_script, os.path.join(self.tmp_build_dir, "davinci-control-panels-setup.sh"))
-
-        dest_pkgbuild = os.path.join(self.tmp_build_dir, "PKGBUILD")
-        filename = os.path.basename(run_file_path)
-        match = re.search(r"DaVinci_Resolve(?:_Studio)?_([\d\.]+)_Linux\.run", filename)
-        if not match:
-            raise ValueError(_("Could not extract version number from filename: {}").format(filename))
-
-        new_version = match.group(1)
-        opencl_pkg = self._detect_opencl_package()
-        opencl_deps = " ".join(f"'{p}'" for p in opencl_pkg.split())
-        with open(dest_pkgbuild, "r") as f:
-            content = f.read()
-        content = re.sub(r"(?m)^(pkgver=).*", f"pkgver={new_version}", content)
-        content = content.replace("'opencl-driver'", opencl_deps)
-        with open(dest_pkgbuild, "w") as f:
-            f.write(content)
-
-        shutil.move(run_file_path, os.path.join(src_dir, filename))
-
-    def _cleanup_build_environment(self):
-        if not self.tmp_build_dir or not self.original_run_file_path:
-            return
-        try:
-            tmp_run = os.path.join(
-                self.tmp_build_dir, "src", os.path.basename(self.original_run_file_path)
-            )
-            if os.path.exists(tmp_run):
-                shutil.move(tmp_run, self.original_run_file_path)
-            if os.path.exists(self.tmp_build_dir):
-                shutil.rmtree(self.tmp_build_dir)
-        except Exception:
-            pass
-        finally:
-            self.tmp_build_dir = None
-            self.original_run_file_path = None
-
-    def _configure_pacman_ignore(self, app_package_name, extra_ignore=None):
-        all_packages = [app_package_name] if app_package_name else []
-        if extra_ignore:
-            for p in extra_ignore:
-                if p not in all_packages:
-                    all_packages.append(p)
-        pkg_list_str = " ".join(all_packages)
-        script_content = r"""
-import sys, re, os
-conf_path = '/etc/pacman.conf'
-extra_pkgs = '%s'.split()
-try:
-    with open(conf_path, 'r') as f:
-        lines = f.readlines()
-    new_lines = []
-    ignore_pkg_found = False
-    packages = ['libc++', 'libc++abi'] + extra_pkgs
-    for line in lines:
-        if re.match(r'^\s*#?\s*IgnorePkg\s*=', line):
-            ignore_pkg_found = True
-            content = line.strip().lstrip('#').strip()
-            existing_pkgs = []
-            if '=' in content:
-                parts = content.split('=', 1)
-                if len(parts) > 1:
-                    existing_pkgs = parts[1].strip().split()
-            for pkg in packages:
-                if pkg not in existing_pkgs:
-                    existing_pkgs.append(pkg)
-            new_lines.append(f"IgnorePkg = {' '.join(existing_pkgs)}\n")
-        else:
-            new_lines.append(line)
-    if not ignore_pkg_found:
-        final_lines = []
-        inserted = False
-        for line in new_lines:
-            final_lines.append(line)
-            if line.strip() == '[options]' and not inserted:
-                final_lines.append(f"IgnorePkg = {' '.join(packages)}\n")
-                inserted = True
-        if not inserted:
-            final_lines.append(f"IgnorePkg = {' '.join(packages)}\n")
-        new_lines = final_lines
-    with open(conf_path, 'w') as f:
-        f.writelines(new_lines)
-except Exception as e:
-    print(f"Error updating pacman.conf: {e}")
-    sys.exit(1)
-""" % (pkg_list_str)
-        script_path = None
-        try:
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.py') as tf:
-                tf.write(script_content)
-                script_path = tf.name
-            env = sudo_manager.get_env()
-            sudo_manager.run_privileged(["python3", script_path], check=True, env=env)
-        except Exception:
-            pass
-        finally:
-            if script_path and os.path.exists(script_path):
-                os.remove(script_path)
+        return deps.detect_opencl_package()
 
     # ── Installation flow ───────────────────────────────────────────
 
@@ -719,159 +1333,191 @@ except Exception as e:
         if not hasattr(self, 'pending_run_file_path') or not self.pending_run_file_path:
             return
 
-        run_file_path = self.pending_run_file_path
-        filename = os.path.basename(run_file_path)
+        installer_path = self.pending_run_file_path
+        filename = os.path.basename(installer_path)
         is_studio = "_Studio_" in filename
         self.current_product = "DaVinci Resolve Studio" if is_studio else "DaVinci Resolve"
 
-        try:
-            self._prepare_build_environment(run_file_path, is_studio)
-        except Exception as e:
-            self._show_install_error(str(e))
-            self._cleanup_build_environment()
-            return
-
         self.install_started = True
         self.error_message = None
+        self.error_heading = None
         self.progress_data = ""
         self.total_steps = 3
+        self.install_engine = None
+        self.removal_log = None
+        self.last_log_path = None
+        self.log_view.set_source(None)
+        self.log_view.set_follow(True)
+        self._eta_medians = {}
+        self._eta_stage = None
 
         self._set_state_installing()
         self._update_step(0, _("Preparing..."))
+        self._eta_timer_id = GLib.timeout_add_seconds(5, self._refresh_eta)
 
-        threading.Thread(target=self._run_install, daemon=True).start()
+        threading.Thread(
+            target=self._run_install, args=(installer_path, is_studio), daemon=True
+        ).start()
 
     def _update_step(self, step, label):
+        self._label_before_wait = None
         self.step_label.set_label(label)
         self.progress_bar.set_fraction(step / self.total_steps)
+        stage = STEP_STAGES.get(int(step))
+        if stage != self._eta_stage:
+            self._eta_stage = stage
+            self._eta_stage_started = time.monotonic()
+        self._refresh_eta()
+
+    def _refresh_eta(self):
+        """Remaining time from the median stage times of earlier installs."""
+        remaining = history.estimate_remaining(
+            self._eta_medians, INSTALL_STAGES, self._eta_stage,
+            time.monotonic() - self._eta_stage_started,
+        )
+        if remaining is None:
+            self.eta_label.set_visible(False)
+        else:
+            self.eta_label.set_label(
+                _("About {} left, based on earlier installs").format(history.format_duration(remaining))
+            )
+            self.eta_label.set_visible(True)
+        return True
+
+    def _load_eta_medians(self, is_studio):
+        edition = history.edition(is_studio)
+        try:
+            # Background runs take longer; fall back to any profile's timings
+            medians = history.stage_medians(
+                "install", edition, priority.from_settings(self.settings)
+            ) or history.stage_medians("install", edition)
+        except (sqlite3.Error, OSError):
+            medians = {}
+        GLib.idle_add(self._set_eta_medians, medians)
+
+    def _set_eta_medians(self, medians):
+        self._eta_medians = medians
+        self._refresh_eta()
+        return False
+
+    def _wait_on_main(self, message):
+        GLib.idle_add(self._show_waiting, message)
+
+    def _show_waiting(self, message):
+        if message:
+            if self._label_before_wait is None:
+                self._label_before_wait = self.step_label.get_label()
+            self.step_label.set_label(message)
+        elif self._label_before_wait is not None:
+            self.step_label.set_label(self._label_before_wait)
+            self._label_before_wait = None
+        return False
 
     def _step_on_main(self, step, label):
         GLib.idle_add(self._update_step, step, label)
 
-    def _run_install(self):
+    def _run_install(self, installer_path, is_studio):
         try:
             sudo_manager.start_privileged_session()
         except NameError:
             pass
 
-        step = 0
-        try:
-            try:
-                env = sudo_manager.get_env()
-                sudo_wrap = sudo_manager.wrapper_path
-            except NameError:
-                env = os.environ.copy()
-                sudo_wrap = "sudo"
-
-            # ── Step 1: Install dependencies ──
-            step += 1
-            self._step_on_main(
-                step, _("Step {}: Installing dependencies...").format(step)
-            )
-
-            # AUR-only deps must be installed first so pacman can resolve them later
-            aur_deps = "qt5-location"
-            opencl_pkg = self._detect_opencl_package()
-
-            # opencl-amd needs to be built from AUR at a pinned commit;
-            # install it separately and exclude from the regular dep list
-            needs_opencl_amd = "opencl-amd" in opencl_pkg
-            regular_opencl = opencl_pkg.replace("opencl-amd", "").strip()
-
-            dep_list = (
-                "glu gtk2 libpng12 fuse2 qt5-x11extras qt5-svg "
-                "qt5-webengine qt5-websockets qt5-quickcontrols2 qt5-multimedia libxcrypt-compat "
-                "xmlsec java-runtime ffmpeg4.4 gst-plugins-bad-libs python-numpy tbb apr-util luajit"
-            )
-            if regular_opencl:
-                dep_list = f"{regular_opencl} {dep_list}"
-            davinci_deps = dep_list
-            aur_cmd = f"paru -Sy --noconfirm --needed --skipreview --removemake {aur_deps} --sudo '{sudo_wrap}'"
-            paru_cmd = f"paru -Sy --noconfirm --needed --skipreview --removemake {davinci_deps} --sudo '{sudo_wrap}'"
-            libs_cmd = f"{sudo_wrap} pacman -Sy --noconfirm --overwrite '*' linexin-repo/libc++ linexin-repo/libc++abi"
-
-            _building_re = re.compile(r"^==> Making package:\s+(\S+)")
-            _installing_re = re.compile(r"^installing\s+(\S+)")
-
-            def _on_dep_line(line):
-                m = _building_re.match(line) or _installing_re.match(line)
-                if m:
-                    pkg = m.group(1).rstrip(".")
-                    GLib.idle_add(
-                        self.step_label.set_label,
-                        _("Step {}: Installing dependencies...").format(step) + f"  ({pkg})",
-                    )
-
-            self._run_cmd(f"{aur_cmd} && {paru_cmd} && {libs_cmd}", env=env, on_line=_on_dep_line)
-
-            if needs_opencl_amd:
-                self._step_on_main(
-                    step, _("Step {}: Installing dependencies...").format(step) + "  (opencl-amd)",
-                )
-                self._install_opencl_amd(sudo_wrap, env, on_line=_on_dep_line)
-
-            # ── Step 2: Building and installing ──
-            step += 1
-            self._step_on_main(
-                step, _("Step {}: Installing DaVinci Resolve...").format(step)
-            )
-
-            quoted_tmp = shlex.quote(self.tmp_build_dir)
-            build_cmd = f"cd {quoted_tmp} && export PACMAN_AUTH='{sudo_wrap}' && makepkg -si --noconfirm --skipinteg --needed"
-            self._run_cmd(build_cmd, env=env)
-
-            # ── Step 3: Finishing up ──
-            step += 1
-            self._step_on_main(
-                step, _("Step {}: Finishing up...").format(step)
-            )
-
-            fix_cmd = f"{sudo_wrap} chown -R $USER:$(id -gn) /opt/resolve"
-            self._run_cmd(fix_cmd, env=env)
-
-            pkg_name = "davinci-resolve-studio" if "Studio" in self.current_product else "davinci-resolve"
-            try:
-                ignore_pkgs = [pkg_name]
-                if needs_opencl_amd:
-                    ignore_pkgs.append("opencl-amd")
-                self._configure_pacman_ignore(pkg_name, extra_ignore=ignore_pkgs)
-            except Exception:
-                pass
+        env, sudo_wrap = self._privileged_env()
 
+        self._load_eta_medians(is_studio)
+        # The engine starts the privileged helper on first use and stops it
+        # when the run ends
+        installer = InstallEngine(
+            self.settings, sudo_wrap=sudo_wrap, env=env, log=self.log_channel,
+            on_step=self._step_on_main, on_wait=self._wait_on_main,
+        )
+        self.install_engine = installer
+        try:
+            installer.install(installer_path, is_studio)
+            self.gpu_report = installer.gpu_report
+        except PreflightError as e:
+            self.error_heading = _("Not enough disk space")
+            self.error_message = str(e)
         except Exception as e:
             self.error_message = str(e)
             print(f"Installation error: {e}", flush=True)
+        if installer.log_writer:
+            self.last_log_path = installer.log_writer.path
 
-        self._cleanup_build_environment()
         GLib.idle_add(self._finish_install)
 
-    def _run_cmd(self, command, env=None, on_line=None):
-        proc = subprocess.Popen(
-            command,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            env=env,
+    def _push_output(self, line):
+        self.progress_data += line
+        if self.removal_log and not self.removal_log.closed:
+            self.removal_log.write(line)
+        self.log_channel.push(line)
+        print(line, end="", flush=True)
+
+    # ── Privileged helper ───────────────────────────────────────────
+
+    def _privileged_env(self):
+        try:
+            return sudo_manager.get_env(), sudo_manager.wrapper_path
+        except NameError:
+            return os.environ.copy(), "sudo"
+
+    def _start_helper(self, kind):
+        """Wait for other installs, then open the privileged session and start its root helper."""
+        self._session_lock = locking.InstallLock(kind)
+        if self._session_lock.acquire(
+            on_wait=lambda ahead: self._wait_on_main(locking.waiting_message(ahead))
+        ):
+            self._wait_on_main(None)
+        try:
+            sudo_manager.start_privileged_session()
+        except NameError:
+            pass
+        env, sudo_wrap = self._privileged_env()
+        return privhelper.PrivilegedHelper.spawn(
+            sudo_wrap, env=env, launcher=priority.launcher(priority.from_settings(self.settings))
         )
-        for line in iter(proc.stdout.readline, ""):
-            if line:
-                self.progress_data += line
-                print(line, end="", flush=True)
-                if on_line:
-                    on_line(line)
-        proc.stdout.close()
-        rc = proc.wait()
-        if rc != 0:
-            # Extract last meaningful lines from output for the error message
-            tail = [l for l in self.progress_data.strip().splitlines() if l.strip()][-15:]
-            detail = "\n".join(tail) if tail else _("No output captured.")
-            raise RuntimeError(detail)
+
+    def _stop_helper(self, helper):
+        if helper:
+            helper.close()
+        try:
+            sudo_manager.stop_privileged_session()
+            sudo_manager.forget_password()
+        except NameError:
+            pass
+        if self._session_lock:
+            self._session_lock.release()
+            self._session_lock = None
+
+    def _privileged(self, helper, *ops):
+        """Run a batch of root operations; return their results or raise with a diagnosis."""
+        self.last_diagnosis = None
+        if privhelper.uses_database(ops):
+            try:
+                waited = locking.wait_for_pacman(
+                    on_wait=lambda _s: self._wait_on_main(_("Waiting for the package manager..."))
+                )
+            except locking.StaleLockError as e:
+                self._wait_on_main(None)
+                self._push_output(e.text)
+                self.last_diagnosis = diagnose.diagnose(e.text)
+                raise RuntimeError(str(e))
+            if waited:
+                self._wait_on_main(None)
+        start = len(self.progress_data)
+        result = helper.run(ops, on_line=self._push_output)
+        if not result["ok"]:
+            text = self.progress_data[start:] + f"{result['error']}\n"
+            self.last_diagnosis = diagnose.diagnose_run(text, self.progress_data)
+            raise RuntimeError(diagnose.failure_message(text, diagnosis=self.last_diagnosis))
+        return result["results"]
 
     def _finish_install(self):
         self.install_started = False
+        if self._eta_timer_id:
+            GLib.source_remove(self._eta_timer_id)
+            self._eta_timer_id = None
+        self.eta_label.set_visible(False)
         try:
             sudo_manager.stop_privileged_session()
             sudo_manager.forget_password()
@@ -880,19 +1526,27 @@ except Exception as e:
         self.user_password = None
 
         if self.error_message:
-            self._show_install_error(self.error_message)
+            self._show_install_error(
+                self.error_message, heading=self.error_heading, log_path=self.last_log_path
+            )
             self._set_state_pre_install()
         else:
             self._set_state_post_install()
+            if self.gpu_report and not self.gpu_report["ready"]:
+                self._show_gpu_report(self.gpu_report)
+        self.gpu_report = None
 
         return False
 
-    def _show_install_error(self, message):
+    def _show_install_error(self, message, heading=None, log_path=None):
         dlg = Adw.MessageDialog(
-            heading=_("Installation failed"),
+            heading=heading or _("Installation failed"),
             body=message,
             transient_for=self.get_root() or self.window,
         )
+        if log_path:
+            dlg.add_response("log", _("View log"))
+            dlg.connect("response", lambda _d, r: r == "log" and self._on_view_logs(log_path))
         dlg.add_response("ok", _("OK"))
         try:
             translate_dialog(dlg)
@@ -0,0 +1 @@
+"""Support modules for the DaVinci Installer widget."""
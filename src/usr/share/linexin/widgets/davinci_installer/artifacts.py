@@ -0,0 +1,169 @@
+"""Built package files left behind by installs, and reclaiming their space.
+
+Only files whose names are exactly a Resolve or opencl-amd package are ever
+considered, so unrelated cache entries are never touched.
+"""
+import json
+import os
+import re
+import subprocess
+import time
+
+from davinci_installer import config, pkgdb
+
+PACKAGES = ("davinci-resolve", "davinci-resolve-studio", "opencl-amd")
+PACMAN_CONF = "/etc/pacman.conf"
+DEFAULT_CACHE_DIR = "/var/cache/pacman/pkg"
+
+# <name>-<pkgver>-<pkgrel>-<arch>.pkg.tar[.<compression>][.sig]
+ARTIFACT_RE = re.compile(
+    r"^(?P<package>davinci-resolve(?:-studio)?|opencl-amd)"
+    r"-(?P<version>(?:\d+:)?[^-/:]+-[^-/]+)"
+    r"-(?P<arch>x86_64|any)"
+    r"\.pkg\.tar(?:\.(?:zst|xz|gz|bz2|lz4|lzo|lrz|Z))?(?:\.sig)?$"
+)
+
+
+def parse_artifact(filename):
+    m = ARTIFACT_RE.match(filename)
+    if not m:
+        return None
+    return {"package": m.group("package"), "version": m.group("version")}
+
+
+# ── Manifest of what the installer built ────────────────────────────
+
+def manifest_path():
+    return os.path.join(config.state_dir(), "artifacts.json")
+
+
+def load_manifest(path=None):
+    try:
+        with open(path or manifest_path(), "r") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(entries, path=None):
+    path = path or manifest_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + ".tmp", "w") as f:
+        json.dump(entries, f, indent=2, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def record(directory, path=None):
+    """Remember every package file the build put into ``directory``."""
+    entries = load_manifest(path)
+    found = []
+    for name in sorted(os.listdir(directory)):
+        info = parse_artifact(name)
+        if not info:
+            continue
+        full = os.path.abspath(os.path.join(directory, name))
+        info.update(size=os.path.getsize(full), recorded=int(time.time()))
+        entries[full] = info
+        found.append(full)
+    _save_manifest(entries, path)
+    return found
+
+
+def forget(paths, path=None):
+    """Drop ``paths`` and any entries whose files are gone."""
+    gone = set(paths)
+    entries = {
+        p: e for p, e in load_manifest(path).items()
+        if p not in gone and os.path.exists(p)
+    }
+    _save_manifest(entries, path)
+
+
+# ── Where stale artifacts collect ───────────────────────────────────
+
+def pacman_cache_dirs(conf=PACMAN_CONF):
+    dirs = []
+    try:
+        with open(conf, "r") as f:
+            for line in f:
+                key, sep, value = line.partition("=")
+                if sep and key.strip() == "CacheDir":
+                    dirs.extend(value.split())
+    except OSError:
+        pass
+    return dirs or [DEFAULT_CACHE_DIR]
+
+
+def makepkg_pkgdest():
+    """PKGDEST as configured for makepkg, or None when it builds in place."""
+    script = (
+        'for f in /etc/makepkg.conf "${XDG_CONFIG_HOME:-$HOME/.config}/pacman/makepkg.conf" '
+        '"$HOME/.makepkg.conf"; do [ -r "$f" ] && . "$f"; done; printf %s "$PKGDEST"'
+    )
+    try:
+        r = subprocess.run(["bash", "-c", script], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return r.stdout.strip() or None
+
+
+def paru_clone_dirs():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return [os.path.join(base, "paru", "clone", pkg) for pkg in PACKAGES]
+
+
+def search_dirs():
+    dirs = pacman_cache_dirs()
+    pkgdest = makepkg_pkgdest()
+    if pkgdest:
+        dirs.append(pkgdest)
+    dirs.extend(paru_clone_dirs())
+    return dirs
+
+
+def installed_versions(query_info=pkgdb.query_info):
+    found = {}
+    for pkg in PACKAGES:
+        version = query_info(pkg).get("Version")
+        if version:
+            found[pkg] = version
+    return found
+
+
+def scan(dirs=None, installed=None, manifest=None):
+    """Return stale artifacts as dicts with path, package, version and size.
+
+    Files for the exact version that is installed are kept so pacman can
+    still reinstall it from cache.
+    """
+    dirs = search_dirs() if dirs is None else dirs
+    installed = installed_versions() if installed is None else installed
+    manifest = load_manifest() if manifest is None else manifest
+
+    candidates = set(manifest)
+    for directory in dirs:
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            continue
+        candidates.update(os.path.join(os.path.abspath(directory), n) for n in names)
+
+    stale = []
+    for path in sorted(candidates):
+        info = parse_artifact(os.path.basename(path))
+        if not info or installed.get(info["package"]) == info["version"]:
+            continue
+        try:
+            st = os.lstat(path)
+        except OSError:
+            continue
+        if not os.path.isfile(path) or os.path.islink(path):
+            continue
+        info.update(path=path, size=st.st_size)
+        stale.append(info)
+    return stale
+
+
+def remove_command(paths):
+    return ["rm", "-f", "--"] + list(paths)
@@ -0,0 +1,220 @@
+"""Offline dependency bundles: a local pacman repo with Resolve's full closure.
+
+``export`` runs on a connected machine and fills a directory with every
+package Step 1 would install (repo packages with all their dependencies,
+AUR builds, libc++) plus a repo database. On a firewalled machine the
+installer finds that directory and installs from it through a generated
+pacman.conf that lists no other repository.
+"""
+import glob
+import json
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import tarfile
+import tempfile
+import time
+
+from davinci_installer import deps, privhelper
+
+try:
+    _
+except NameError:
+    from gettext import gettext as _
+
+REPO_NAME = "davinci-offline"
+# Auto-detected next to the installer file
+BUNDLE_DIRNAME = "davinci-offline-repo"
+MANIFEST = "bundle.json"
+SYNC_DIR = "/var/lib/pacman/sync"
+
+
+def db_path(repo_dir):
+    return os.path.join(repo_dir, REPO_NAME + ".db")
+
+
+def is_bundle(path):
+    return bool(path) and os.path.exists(db_path(path))
+
+
+def find_bundle(installer_path, settings):
+    """The bundle to install from: configured, beside the installer, or None."""
+    configured = settings.get("bundle_dir")
+    if configured:
+        configured = os.path.expanduser(configured)
+        return configured if is_bundle(configured) else None
+    base = os.path.dirname(os.path.abspath(installer_path))
+    for candidate in (os.path.join(base, BUNDLE_DIRNAME), base):
+        if is_bundle(candidate):
+            return candidate
+    return None
+
+
+def load_manifest(repo_dir):
+    try:
+        with open(os.path.join(repo_dir, MANIFEST), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def package_names(repo_dir):
+    """Names and provides of every package in the bundle's repo db."""
+    names = set()
+    try:
+        with tarfile.open(db_path(repo_dir)) as db:
+            for member in db.getmembers():
+                if not member.name.endswith("/desc"):
+                    continue
+                section = None
+                for line in db.extractfile(member).read().decode("utf-8", "replace").splitlines():
+                    if line.startswith("%") and line.endswith("%"):
+                        section = line
+                    elif line and section in ("%NAME%", "%PROVIDES%"):
+                        names.add(re.split(r"[<>=]", line, maxsplit=1)[0])
+    except (OSError, tarfile.TarError):
+        pass
+    return names
+
+
+def missing_packages(repo_dir, packages):
+    have = package_names(repo_dir)
+    return [p for p in packages if p not in have]
+
+
+# ── Import ──────────────────────────────────────────────────────────
+
+def pacman_conf(repo_dir):
+    """pacman.conf text that only knows about the bundle's repo."""
+    return "\n".join([
+        "[options]",
+        "Architecture = auto",
+        "CheckSpace",
+        "",
+        f"[{REPO_NAME}]",
+        "SigLevel = Optional TrustAll",
+        f"Server = file://{os.path.abspath(repo_dir)}",
+        "",
+    ])
+
+
+def install_command(conf_path, opencl, sudo_wrap):
+    """Shell command installing Step 1's packages from the bundle."""
+    conf = shlex.quote(conf_path)
+    pkgs = " ".join(shlex.quote(p) for p in deps.AUR_DEPS + deps.REPO_DEPS + tuple(opencl))
+    libs = " ".join(deps.LIBCXX)
+    sync_db = shlex.quote(os.path.join(SYNC_DIR, REPO_NAME + ".db"))
+    return (
+        f"{sudo_wrap} pacman --config {conf} -Sy --noconfirm --needed {pkgs}"
+        f" && {sudo_wrap} pacman --config {conf} -S --noconfirm --overwrite '*' {libs}"
+        f" && {sudo_wrap} rm -f {sync_db}"
+    )
+
+
+def install_ops(conf_path, opencl):
+    """The same as ``install_command``, as operations for the privileged helper."""
+    return [
+        privhelper.install_repo(deps.AUR_DEPS + deps.REPO_DEPS + tuple(opencl), config=conf_path),
+        privhelper.install_repo(
+            deps.LIBCXX, config=conf_path, refresh=False, needed=False, overwrite=["*"],
+        ),
+        privhelper.script(
+            f"rm -f {shlex.quote(os.path.join(SYNC_DIR, REPO_NAME + '.db'))}", "forget " + REPO_NAME,
+        ),
+    ]
+
+
+# ── Export ──────────────────────────────────────────────────────────
+
+def _run(argv, env=None, cwd=None, on_line=print):
+    proc = subprocess.Popen(
+        argv, cwd=cwd, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        text=True, errors="replace",
+    )
+    tail = []
+    for line in iter(proc.stdout.readline, ""):
+        on_line(line.rstrip("\n"))
+        tail = (tail + [line.rstrip("\n")])[-15:]
+    proc.stdout.close()
+    if proc.wait() != 0:
+        raise RuntimeError(_("Command failed: {}").format(" ".join(argv)) + "\n" + "\n".join(tail))
+
+
+def srcinfo_depends(text):
+    """Runtime dependency names from a .SRCINFO, without version constraints."""
+    found = []
+    for line in text.splitlines():
+        key, sep, value = line.strip().partition(" = ")
+        if sep and (key == "depends" or key.startswith("depends_")):
+            name = re.split(r"[<>=]", value.strip(), maxsplit=1)[0]
+            if name and name not in found:
+                found.append(name)
+    return found
+
+
+def export(dest, opencl, sudo="sudo", on_line=print, run=_run):
+    """Resolve and download the dependency closure into ``dest``.
+
+    ``opencl`` lists the OpenCL packages the target machines need.
+    """
+    dest = os.path.abspath(dest)
+    os.makedirs(dest, exist_ok=True)
+    work = tempfile.mkdtemp(prefix="davinci-bundle-")
+    try:
+        aur = list(deps.AUR_DEPS)
+        if deps.OPENCL_AMD in opencl:
+            aur.append(deps.OPENCL_AMD)
+        repo = list(deps.REPO_DEPS) + [p for p in opencl if p not in aur]
+
+        # AUR packages first, so their runtime deps join the repo download
+        for pkg in aur:
+            path = os.path.join(work, pkg)
+            run(["git", "clone", deps.aur_url(pkg), path], on_line=on_line)
+            if pkg == deps.OPENCL_AMD:
+                run(["git", "checkout", deps.OPENCL_AMD_COMMIT], cwd=path, on_line=on_line)
+            try:
+                with open(os.path.join(path, ".SRCINFO"), "r") as f:
+                    srcinfo = f.read()
+            except OSError:
+                srcinfo = ""
+            repo.extend(d for d in srcinfo_depends(srcinfo) if d not in aur and d not in repo)
+
+        # An empty database makes pacman download the whole closure
+        dbpath = os.path.join(work, "db")
+        os.makedirs(dbpath)
+        libs = [f"{deps.LIBCXX_REPO}/{p}" for p in deps.LIBCXX]
+        sudo_argv = shlex.split(sudo)
+        run(sudo_argv + ["pacman", "-Syw", "--noconfirm", "--dbpath", dbpath, "--cachedir", dest,
+                         "--logfile", "/dev/null"] + repo + libs, on_line=on_line)
+        run(sudo_argv + ["chown", "-R", f"{os.getuid()}:{os.getgid()}", dest], on_line=on_line)
+        run(sudo_argv + ["rm", "-rf", dbpath], on_line=on_line)
+
+        env = dict(os.environ, PKGDEST=dest, PACMAN_AUTH=sudo)
+        for pkg in aur:
+            run(["makepkg", "-s", "--noconfirm", "--needed"], env=env,
+                cwd=os.path.join(work, pkg), on_line=on_line)
+
+        files = sorted(
+            f for f in glob.glob(os.path.join(dest, "*.pkg.tar*")) if not f.endswith(".sig")
+        )
+        for stale in glob.glob(os.path.join(dest, REPO_NAME + ".*")):
+            os.remove(stale)
+        run(["repo-add", "-q", os.path.join(dest, REPO_NAME + ".db.tar.gz")] + files,
+            on_line=on_line)
+
+        manifest = {
+            "created": int(time.time()),
+            "aur": aur,
+            "repo": repo,
+            "libs": list(deps.LIBCXX),
+            "opencl": list(opencl),
+            "packages": [os.path.basename(f) for f in files],
+        }
+        with open(os.path.join(dest, MANIFEST), "w") as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
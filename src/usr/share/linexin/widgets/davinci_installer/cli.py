@@ -0,0 +1,340 @@
+"""Command-line entry points for tasks that don't need the GUI."""
+import argparse
+import json
+import os
+import shlex
+import sqlite3
+import sys
+import time
+
+from davinci_installer import (
+    bundle, config, deps, fleet, history, logarchive, pkgdb, priority, profiling, verify,
+)
+from davinci_installer.engine import BUILD_STAGES, INSTALL_STAGES, InstallEngine, format_plan
+
+try:
+    _
+except NameError:
+    from gettext import gettext as _
+
+
+def _export_bundle(args):
+    opencl = args.opencl or deps.detect_opencl_package().split()
+    try:
+        manifest = bundle.export(args.dest, opencl, sudo=args.sudo)
+    except Exception as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(_("{} packages written to {}").format(len(manifest["packages"]), args.dest))
+    return 0
+
+
+def _read_hosts(args):
+    hosts = []
+    for item in args.hosts or ():
+        hosts.extend(h for h in item.split(",") if h)
+    if args.hosts_file:
+        with open(args.hosts_file, "r") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    hosts.append(line)
+    return hosts
+
+
+def _fleet(args):
+    hosts = _read_hosts(args)
+    if not hosts:
+        print(_("No hosts given"), file=sys.stderr)
+        return 2
+
+    package = args.installer
+    if ".pkg.tar" not in os.path.basename(package):
+        # Build once, without tying the package to this machine's GPU
+        is_studio = "_Studio_" in os.path.basename(package)
+        dest = args.output_dir or os.path.dirname(os.path.abspath(package))
+        try:
+            package = InstallEngine(
+                config.load(), sudo_wrap=args.local_sudo, priority_profile=args.priority
+            ).build(package, is_studio, dest)
+        except Exception as e:
+            print(e, file=sys.stderr)
+            return 1
+        print(_("Built {}").format(package))
+
+    def on_event(event):
+        if event["status"] == "output":
+            if args.verbose:
+                print(f"[{event['host']}] {event['line']}")
+        elif event["status"] == "failed":
+            print(f"[{event['host']}] {event['stage']}: " + _("failed"), flush=True)
+        else:
+            print(f"[{event['host']}] {event['stage']}: {event['status']}", flush=True)
+
+    try:
+        driver = fleet.FleetDriver(
+            hosts, package, args.bundle,
+            parallel=args.parallel,
+            ssh=shlex.split(args.ssh) if args.ssh else fleet.DEFAULT_SSH,
+            scp=shlex.split(args.scp) if args.scp else fleet.DEFAULT_SCP,
+            sudo=args.sudo,
+            remote_tmp=args.remote_tmp,
+            opencl=args.opencl,
+            on_event=on_event,
+        )
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    summary = driver.run()
+
+    print()
+    for r in summary["hosts"]:
+        stages = ", ".join(f"{s} {t:.0f} s" for s, t in r["timings"].items())
+        if r["ok"]:
+            print(_("{}: installed in {:.0f} s ({}), {} sent").format(
+                r["host"], r["seconds"], stages, pkgdb.format_size(r["bytes"])))
+        else:
+            reason = (r["error"] or "").strip().splitlines()[-1:] or [""]
+            print(_("{}: failed during {}: {}").format(r["host"], r["failed_stage"], reason[0]))
+    print(_("{} of {} hosts installed in {:.0f} s").format(
+        summary["succeeded"], len(summary["hosts"]), summary["seconds"]))
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(summary, f, indent=2)
+    return 0 if not summary["failed"] else 1
+
+
+def _install(args):
+    is_studio = "_Studio_" in os.path.basename(args.installer)
+    engine = InstallEngine(config.load(), sudo_wrap=args.sudo, priority_profile=args.priority)
+    if args.dry_run:
+        try:
+            plan = engine.plan(args.installer, is_studio)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            print(e, file=sys.stderr)
+            return 1
+        if args.json:
+            json.dump(plan, sys.stdout, indent=2)
+            print()
+        else:
+            print(format_plan(plan))
+        return 0
+    try:
+        engine.install(args.installer, is_studio)
+    except Exception as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+
+def _history(args):
+    try:
+        if args.stats:
+            return _history_stats(args)
+        runs = history.recent(args.limit, args.kind)
+    except sqlite3.Error as e:
+        print(e, file=sys.stderr)
+        return 1
+    if args.json:
+        json.dump(runs, sys.stdout, indent=2)
+        print()
+        return 0
+    for run in runs:
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(run["started"]))
+        took = history.format_duration(run["seconds"]) if run["seconds"] is not None else "-"
+        print(f"{run['id']:>4}  {when}  {run['kind']:<8} {run['edition'] or '-':<7} "
+              f"{run['version'] or '-':<10} {run['priority'] or '-':<10} {run['outcome']:<8} "
+              f"{took:>13}  {run['diagnosis'] or ''}".rstrip())
+        if args.verbose:
+            for stage, seconds in run["stages"].items():
+                print(f"{'':6}{stage:<14}{history.format_duration(seconds):>13}")
+            if run["error"]:
+                print(f"{'':6}{run['error']}")
+            if run["log"]:
+                print(f"{'':6}{run['log']}")
+    return 0
+
+
+def _history_stats(args):
+    kinds = [args.kind] if args.kind else ["install", "build"]
+    stats = {}
+    for kind in kinds:
+        stages = BUILD_STAGES if kind == "build" else INSTALL_STAGES
+        for edition in ("free", "studio"):
+            medians = history.stage_medians(kind, edition)
+            if not medians:
+                continue
+            by_priority = {}
+            for profile in priority.PROFILES:
+                total = history.median_seconds(kind, edition, priority=profile)
+                if total is not None:
+                    by_priority[profile] = total
+            stats.setdefault(kind, {})[edition] = {
+                "stages": {s: medians[s] for s in stages if s in medians},
+                "total": history.median_seconds(kind, edition),
+                "priorities": by_priority,
+            }
+    if args.json:
+        json.dump(stats, sys.stdout, indent=2)
+        print()
+        return 0
+    if not stats:
+        print(_("No successful runs recorded yet"))
+    for kind, editions in stats.items():
+        for edition, entry in editions.items():
+            print(_("Median {} ({}), last {} successful runs:").format(
+                kind, edition, history.MEDIAN_WINDOW))
+            for stage, seconds in entry["stages"].items():
+                print(f"  {stage:<14}{history.format_duration(seconds):>13}")
+            if entry["total"] is not None:
+                print(f"  {_('total'):<14}{history.format_duration(entry['total']):>13}")
+            # Only worth showing once more than one profile was used
+            if len(entry["priorities"]) > 1:
+                for profile, seconds in entry["priorities"].items():
+                    print(f"  {_('at') + ' ' + profile:<14}{history.format_duration(seconds):>13}")
+    return 0
+
+
+def _log(args):
+    try:
+        run = history.get_run(args.run) if args.run else (history.recent(1) or [None])[0]
+    except sqlite3.Error as e:
+        print(e, file=sys.stderr)
+        return 1
+    if not run or not run["log"]:
+        print(_("No log recorded for this run"), file=sys.stderr)
+        return 1
+    try:
+        reader = logarchive.LogReader(run["log"])
+    except OSError:
+        print(_("The log of run {} was deleted").format(run["id"]), file=sys.stderr)
+        return 1
+    start = args.start
+    if args.grep:
+        start = reader.find(args.grep, args.start)
+        if start is None:
+            return 1
+    elif args.tail:
+        start = max(reader.line_count() - args.lines, 0)
+    for line in reader.lines(start, args.lines):
+        print(line.rsplit("\r", 1)[-1])
+    reader.close()
+    return 0
+
+
+def _verify(args):
+    found = verify.installed_package()
+    if not found:
+        print(_("DaVinci Resolve is not installed as a package."), file=sys.stderr)
+        return 1
+    try:
+        report = verify.verify(*found, workers=args.workers, full=args.full)
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return 1
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print(verify.format_report(report))
+    return 1 if report["problems"] else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="davinci-installer-cli",
+        description=_("DaVinci Resolve installer tools"),
+    )
+    parser.add_argument(
+        "--profile", metavar="MODES",
+        help=_("profile install and build runs: timing, cprofile, tracemalloc or all, "
+               "comma-separated (same as {})").format(profiling.ENV),
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser(
+        "export-bundle",
+        help=_("download every dependency into a local repo for offline installs"),
+    )
+    p.add_argument("dest", help=_("directory for the repo, e.g. a USB drive"))
+    p.add_argument(
+        "--opencl", action="append", metavar="PKG",
+        help=_("OpenCL package the target machines need; repeatable "
+               "(default: the one detected on this machine)"),
+    )
+    p.add_argument("--sudo", default="sudo", help=_("privilege wrapper (default: sudo)"))
+    p.set_defaults(func=_export_bundle)
+
+    p = sub.add_parser(
+        "fleet",
+        help=_("build once and install on many machines over SSH"),
+    )
+    p.add_argument("installer", help=_("DaVinci Resolve .run/.zip, or an already built package"))
+    p.add_argument("--hosts", action="append", metavar="HOST[,HOST...]",
+                   help=_("target hosts (user@host), repeatable"))
+    p.add_argument("--hosts-file", help=_("file with one host per line"))
+    p.add_argument("--bundle", required=True,
+                   help=_("offline bundle from export-bundle, pushed to every host"))
+    p.add_argument("--parallel", type=int, default=4,
+                   help=_("hosts installed at the same time (default: 4)"))
+    p.add_argument("--ssh", help=_("ssh command (default: {})").format(" ".join(fleet.DEFAULT_SSH)))
+    p.add_argument("--scp", help=_("scp command (default: {})").format(" ".join(fleet.DEFAULT_SCP)))
+    p.add_argument("--sudo", default=fleet.DEFAULT_SUDO,
+                   help=_("privilege command on the hosts (default: {})").format(fleet.DEFAULT_SUDO))
+    p.add_argument("--local-sudo", default="sudo", help=_("privilege wrapper for the local build"))
+    p.add_argument("--priority", choices=priority.PROFILES,
+                   help=_("priority of the local build (default: install_priority from the config)"))
+    p.add_argument("--remote-tmp", default=fleet.REMOTE_TMP,
+                   help=_("where the private staging directory is made on the hosts (default: {})").format(
+                       fleet.REMOTE_TMP))
+    p.add_argument("--opencl", action="append", metavar="PKG",
+                   help=_("OpenCL package for every host (default: detected per host)"))
+    p.add_argument("--output-dir", help=_("where the built package is kept"))
+    p.add_argument("--report", metavar="FILE", help=_("write per-host results as JSON"))
+    p.add_argument("-v", "--verbose", action="store_true", help=_("show remote command output"))
+    p.set_defaults(func=_fleet)
+
+    p = sub.add_parser("install", help=_("install DaVinci Resolve from a .run or .zip"))
+    p.add_argument("installer", help=_("DaVinci Resolve .run or .zip"))
+    p.add_argument("--dry-run", action="store_true",
+                   help=_("only show the stages, packages, space and expected duration"))
+    p.add_argument("--json", action="store_true", help=_("print the dry-run plan as JSON"))
+    p.add_argument("--sudo", default="sudo", help=_("privilege wrapper (default: sudo)"))
+    p.add_argument("--priority", choices=priority.PROFILES,
+                   help=_("priority of the install (default: install_priority from the config)"))
+    p.set_defaults(func=_install)
+
+    p = sub.add_parser("history", help=_("show earlier installs, builds and removals"))
+    p.add_argument("--limit", type=int, default=20, help=_("runs to show (default: 20)"))
+    p.add_argument("--kind", choices=("install", "build", "remove", "prune", "reclaim"),
+                   help=_("only runs of this kind"))
+    p.add_argument("--stats", action="store_true",
+                   help=_("median time of every stage over the last successful runs"))
+    p.add_argument("--json", action="store_true", help=_("print JSON"))
+    p.add_argument("-v", "--verbose", action="store_true",
+                   help=_("show stage timings, errors and log paths"))
+    p.set_defaults(func=_history)
+
+    p = sub.add_parser("log", help=_("page through the archived output of a run"))
+    p.add_argument("run", type=int, nargs="?", help=_("run number from 'history' (default: the latest)"))
+    p.add_argument("--start", type=int, default=0, help=_("first line to show"))
+    p.add_argument("--lines", type=int, default=200, help=_("lines to show (default: 200)"))
+    p.add_argument("--tail", action="store_true", help=_("show the last lines"))
+    p.add_argument("--grep", metavar="TEXT", help=_("start at the first line containing TEXT"))
+    p.set_defaults(func=_log)
+
+    p = sub.add_parser("verify", help=_("check the installed files against the package"))
+    p.add_argument("--full", action="store_true",
+                   help=_("read every file, even those unchanged since the last check"))
+    p.add_argument("--workers", type=int,
+                   help=_("files checked at the same time (default: {})").format(verify.default_workers()))
+    p.add_argument("--json", action="store_true", help=_("print JSON"))
+    p.set_defaults(func=_verify)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.profile:
+        os.environ[profiling.ENV] = args.profile
+    return args.func(args)
@@ -0,0 +1,68 @@
+"""User settings and XDG locations for the installer."""
+import json
+import os
+
+APP_DIR = "davinci-installer"
+
+DEFAULTS = {
+    # Look for freshly downloaded installers in the XDG download directory
+    "watch_downloads": True,
+    # Extra directories to watch
+    "watch_dirs": [],
+    # Where davinci_tmp is created; None puts it next to the installer
+    "build_dir": None,
+    # makepkg compression profile: default, fast or none
+    "compression": "default",
+    # Offline dependency repo; None looks for davinci-offline-repo next to the installer
+    "bundle_dir": None,
+    # Archived install logs are deleted oldest first beyond this size
+    "log_retention_mb": 256,
+    # Reuse unchanged files of an installed version when upgrading
+    "delta_upgrade": True,
+    # Check the installed files against the package after every install
+    "verify_install": True,
+    # Install priority profile: foreground, background or idle
+    "install_priority": "foreground",
+}
+
+
+def _xdg(var, fallback):
+    base = os.environ.get(var) or os.path.join(os.path.expanduser("~"), fallback)
+    return os.path.join(base, APP_DIR)
+
+
+def config_dir():
+    return _xdg("XDG_CONFIG_HOME", ".config")
+
+
+def state_dir():
+    return _xdg("XDG_STATE_HOME", os.path.join(".local", "state"))
+
+
+def cache_dir():
+    return _xdg("XDG_CACHE_HOME", ".cache")
+
+
+def config_path():
+    return os.path.join(config_dir(), "config.json")
+
+
+def load(path=None):
+    settings = dict(DEFAULTS)
+    try:
+        with open(path or config_path(), "r") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            settings.update(data)
+    except (OSError, ValueError):
+        pass
+    return settings
+
+
+def save(settings, path=None):
+    path = path or config_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(settings, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
@@ -0,0 +1,180 @@
+"""Delta upgrades: reuse the files an installed version already has.
+
+Point releases of Resolve change a small part of a multi-GB tree. After
+makepkg's ``prepare()`` has patched the staged payload (so both sides
+carry the same rpaths and desktop entries) every staged file is compared
+with the same path under an installed root, by size first and then by a
+content hash computed on a thread pool. Identical files are replaced by a
+reflink of the installed copy, or a hardlink where the filesystem can't
+share extents, so the staging tree only keeps the data that changed.
+"""
+import errno
+import fcntl
+import hashlib
+import os
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from davinci_installer import pkgdb, versions
+
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+HASH_CHUNK = 1024 * 1024
+# Below this, replacing a file costs more than it saves
+MIN_BYTES = 64 * 1024
+
+REFLINK = "reflink"
+HARDLINK = "hardlink"
+# The filesystem (or protected_hardlinks) doesn't allow a method at all
+_UNSUPPORTED = (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.EPERM)
+
+
+def default_workers():
+    return min(8, os.cpu_count() or 2)
+
+
+def reference_root(new_root, studio, opt_dir=versions.OPT_DIR):
+    """Path of the installed root to compare against: the newest of the same edition."""
+    roots = [r for r in versions.installed_versions(opt_dir) if r["name"] != new_root]
+    roots.sort(key=lambda r: r["studio"] != studio)
+    return roots[0]["path"] if roots else None
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(HASH_CHUNK)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.digest()
+
+
+def _scan(staging, reference):
+    """Bytes staged, and (relative path, staged stat, reference stat) of same-size files."""
+    total = 0
+    candidates = []
+    for dirpath, _dirnames, filenames in os.walk(staging):
+        rel_dir = os.path.relpath(dirpath, staging)
+        for name in filenames:
+            rel = os.path.normpath(os.path.join(rel_dir, name))
+            try:
+                st = os.lstat(os.path.join(staging, rel))
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            total += st.st_size
+            if st.st_size < MIN_BYTES:
+                continue
+            try:
+                ref = os.lstat(os.path.join(reference, rel))
+            except OSError:
+                continue
+            if stat.S_ISREG(ref.st_mode) and ref.st_size == st.st_size:
+                candidates.append((rel, st, ref))
+    return total, candidates
+
+
+def _reflink(src, tmp, mode):
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    try:
+        with open(src, "rb") as f:
+            fcntl.ioctl(fd, FICLONE, f.fileno())
+    finally:
+        os.close(fd)
+
+
+def _replace(staged, ref, st, ref_st, methods):
+    """Swap ``staged`` for a copy sharing ``ref``'s data; return the method used."""
+    tmp = staged + ".dvdelta"
+    for method in list(methods):
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        try:
+            if method == REFLINK:
+                _reflink(ref, tmp, stat.S_IMODE(st.st_mode))
+                os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+            else:
+                # A hardlink shares the mode too, so it must already match
+                if stat.S_IMODE(st.st_mode) != stat.S_IMODE(ref_st.st_mode):
+                    continue
+                os.link(ref, tmp)
+            os.replace(tmp, staged)
+            return method
+        except OSError as e:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            if e.errno not in _UNSUPPORTED:
+                raise
+            # Don't try it again for the remaining files
+            methods.remove(method)
+    return None
+
+
+def dedup(staging, reference, workers=None, hardlinks=True):
+    """Share unchanged files between ``staging`` and the installed ``reference``.
+
+    Returns a report: files compared, files and bytes reused, by which
+    method, and the bytes the staged tree holds in total.
+    """
+    started = time.monotonic()
+    report = {
+        "reference": reference, "total_bytes": 0, "compared": 0, "reused_files": 0,
+        "reused_bytes": 0, "methods": {}, "seconds": 0.0, "skipped": None,
+    }
+    if os.stat(staging).st_dev != os.stat(reference).st_dev:
+        # Neither reflinks nor hardlinks cross filesystems
+        report["skipped"] = "different filesystems"
+        return report
+
+    methods = [REFLINK] + ([HARDLINK] if hardlinks else [])
+    report["total_bytes"], candidates = _scan(staging, reference)
+    report["compared"] = len(candidates)
+
+    def _compare(item):
+        rel, st, ref_st = item
+        if (st.st_dev, st.st_ino) == (ref_st.st_dev, ref_st.st_ino):
+            return item, True  # linked by an earlier attempt
+        staged = os.path.join(staging, rel)
+        ref = os.path.join(reference, rel)
+        try:
+            return item, file_digest(staged) == file_digest(ref)
+        except OSError:
+            return item, False
+
+    with ThreadPoolExecutor(max_workers=workers or default_workers()) as pool:
+        for (rel, st, ref_st), same in pool.map(_compare, candidates):
+            if not same:
+                continue
+            if (st.st_dev, st.st_ino) == (ref_st.st_dev, ref_st.st_ino):
+                method = HARDLINK
+            else:
+                method = _replace(
+                    os.path.join(staging, rel), os.path.join(reference, rel), st, ref_st, methods
+                )
+            if method:
+                report["reused_files"] += 1
+                report["reused_bytes"] += st.st_size
+                report["methods"][method] = report["methods"].get(method, 0) + 1
+    report["seconds"] = time.monotonic() - started
+    return report
+
+
+def format_report(report):
+    name = os.path.basename(report["reference"])
+    if report["skipped"]:
+        return f"Delta upgrade against {name} skipped: {report['skipped']}"
+    methods = ", ".join(f"{n} by {m}" for m, n in sorted(report["methods"].items()))
+    return (
+        f"Reused {pkgdb.format_size(report['reused_bytes'])} of {pkgdb.format_size(report['total_bytes'])}"
+        f" from {name}: {report['reused_files']} of {report['compared']} compared files"
+        + (f" ({methods})" if methods else "")
+        + f" in {report['seconds']:.1f} s"
+    )
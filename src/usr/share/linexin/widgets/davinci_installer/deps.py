@@ -0,0 +1,65 @@
+"""Packages Resolve needs besides itself, and OpenCL driver detection."""
+import re
+import subprocess
+
+# AUR-only deps; installed first so pacman can resolve the rest
+AUR_DEPS = ("qt5-location",)
+
+REPO_DEPS = (
+    "glu", "gtk2", "libpng12", "fuse2", "qt5-x11extras", "qt5-svg",
+    "qt5-webengine", "qt5-websockets", "qt5-quickcontrols2", "qt5-multimedia",
+    "libxcrypt-compat", "xmlsec", "java-runtime", "ffmpeg4.4", "gst-plugins-bad-libs",
+    "python-numpy", "tbb", "apr-util", "luajit",
+)
+
+# Resolve needs Linexin's libc++ builds, installed over whatever is present
+LIBCXX_REPO = "linexin-repo"
+LIBCXX = ("libc++", "libc++abi")
+
+# opencl-amd is built from AUR at a known-good commit
+OPENCL_AMD = "opencl-amd"
+OPENCL_AMD_URL = "https://aur.archlinux.org/opencl-amd.git"
+OPENCL_AMD_COMMIT = "42c9eb7"
+
+
+def aur_url(pkg):
+    return f"https://aur.archlinux.org/{pkg}.git"
+
+
+def opencl_for_lspci(output):
+    """OpenCL package(s) for the GPUs in ``lspci -nn`` output, or None."""
+    output = output.lower()
+    # Check VGA and 3D controller lines for GPU vendor
+    has_nvidia = bool(re.search(r"(?:vga|3d).*\bnvidia\b", output))
+    has_amd = bool(re.search(r"(?:vga|3d).*\b(?:amd|ati|radeon)\b", output))
+    if has_nvidia and not has_amd:
+        return "opencl-nvidia"
+    elif has_amd and not has_nvidia:
+        return "opencl-amd"
+    elif has_nvidia and has_amd:
+        # Hybrid GPU — install both
+        return "opencl-amd opencl-nvidia"
+    return None
+
+
+def detect_opencl_package():
+    """Space-separated OpenCL package(s) for the GPUs in this machine."""
+    try:
+        lspci = subprocess.run(
+            ["lspci", "-nn"],
+            capture_output=True, text=True, timeout=5,
+        )
+        found = opencl_for_lspci(lspci.stdout)
+        if found:
+            return found
+    except Exception:
+        pass
+    # Fallback: check what's already installed
+    for pkg in ("opencl-amd", "opencl-mesa", "opencl-nvidia", "intel-compute-runtime", "rocm-opencl-runtime"):
+        r = subprocess.run(
+            ["pacman", "-Qq", pkg],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        if r.returncode == 0:
+            return pkg
+    return "opencl-mesa"
@@ -0,0 +1,179 @@
+"""Classify a failed command from its full output.
+
+Every rule is indexed by literal anchors that any match must contain. The
+log is scanned once for all anchors with a single precompiled pattern, and
+a rule's full regex only runs on the lines where one of its anchors
+occurs, so the cost stays linear in the size of the log. Rules are listed
+most specific first; the first rule (by that order) that matched anywhere
+wins, and its earliest match is used for the excerpt.
+"""
+import re
+
+try:
+    _
+except NameError:
+    from gettext import gettext as _
+
+EXCERPT_BEFORE = 3
+EXCERPT_AFTER = 3
+
+# (name, anchors, pattern, title, suggestion); ``{0}`` in the texts is the
+# first capture group of the pattern, if any
+RULES = (
+    ("no-space",
+     ("No space left", "free disk space", "Disk quota"),
+     r"No space left on device|not enough free disk space|Disk quota exceeded",
+     "The disk ran out of space",
+     "Free up space or choose a build directory on a larger drive, then try again."),
+    ("db-locked",
+     ("lock database",),
+     r"unable to lock database",
+     "The package database is locked",
+     "Another package manager is running. Wait for it to finish; if none is running, remove /var/lib/pacman/db.lck."),
+    ("pgp-key",
+     ("unknown public key",),
+     r"unknown public key (\w+)",
+     "A PGP signature could not be verified",
+     "Import the missing key with 'gpg --recv-keys {0}' and try again."),
+    # The same failure when the log doesn't name the key
+    ("pgp-key",
+     ("PGP signatures could not",),
+     r"One or more PGP signatures could not be verified",
+     "A PGP signature could not be verified",
+     "Import the missing key with 'gpg --recv-keys' (makepkg lists its ID above the error) and try again."),
+    ("keyring",
+     ("signature from", "(PGP signature)", "could not be looked up"),
+     r"signature from .{1,200}? is (?:unknown trust|invalid|marginal trust)"
+     r"|invalid or corrupted package \(PGP signature\)|key .{1,80}? could not be looked up remotely",
+     "A package signature is not trusted",
+     "Update the keyring with 'sudo pacman -Sy archlinux-keyring' and run 'sudo pacman-key --populate'."),
+    ("file-conflict",
+     ("exists in filesystem",),
+     r"([\w@.+-]+): /\S.* exists in filesystem",
+     "Files of {0} already exist on the system",
+     "Another package owns these files. Remove the conflicting package or, if the files are leftovers, delete them and try again."),
+    ("package-conflict",
+     ("are in conflict",),
+     r":: ([\w@.+-]+?)(?:-[^\s-]+-[^\s-]+)? and [\w@.+-]+ are in conflict",
+     "{0} conflicts with an installed package",
+     "Remove the conflicting package, then run the installation again."),
+    ("missing-package",
+     ("target not found", "satisfy dependency"),
+     r"target not found: (\S+)|unable to satisfy dependency '([^'<>=]+)",
+     "The package {0} could not be found",
+     "Update the package databases with 'sudo pacman -Syu' and check that the [extra] repository is enabled in /etc/pacman.conf."),
+    ("network",
+     ("resolve host", "retrieving file", "Failed to connect", "timed out", "too slow"),
+     r"Could not resolve host|failed retrieving file|Failed to connect to|Connection timed out"
+     r"|Operation too slow",
+     "A download failed",
+     "Check the network connection, or install from an offline bundle."),
+    ("corrupt-package",
+     ("corrupted",),
+     r"([\w@.+-]+\.pkg\.tar\S*) is corrupted|invalid or corrupted package",
+     "A downloaded package is corrupted",
+     "Remove it from /var/cache/pacman/pkg and try again."),
+    ("auth",
+     ("sudo: ", "Authentication failure"),
+     r"sudo: (?:a password is required|\d+ incorrect password attempts?)|Authentication failure",
+     "Administrator authentication failed",
+     "Check the password and try again."),
+    ("build-failed",
+     ("A failure occurred",),
+     r"==> ERROR: A failure occurred in (\w+)\(\)",
+     "Building the package failed in {0}()",
+     "See the log excerpt below; the installer file may be incomplete or damaged."),
+)
+
+_PATTERNS = [re.compile(rule[2]) for rule in RULES]
+# anchor -> indices of the rules it can start
+_ANCHORS = {}
+for _idx, _rule in enumerate(RULES):
+    for _anchor in _rule[1]:
+        _ANCHORS.setdefault(_anchor, []).append(_idx)
+# Longest first so overlapping anchors resolve to the most specific one
+_ANCHOR_RE = re.compile("|".join(
+    re.escape(a) for a in sorted(_ANCHORS, key=len, reverse=True)
+))
+
+
+def _scan(text):
+    """Earliest match of every rule: {rule index: (start, end, first capture)}."""
+    found = {}
+    checked = set()
+    for hit in _ANCHOR_RE.finditer(text):
+        line_start = text.rfind("\n", 0, hit.start()) + 1
+        line_end = text.find("\n", hit.end())
+        if line_end < 0:
+            line_end = len(text)
+        for idx in _ANCHORS[hit.group(0)]:
+            if idx in found or (idx, line_start) in checked:
+                continue
+            checked.add((idx, line_start))
+            m = _PATTERNS[idx].search(text, line_start, line_end)
+            if m:
+                capture = next((g for g in m.groups() if g), "")
+                found[idx] = (m.start(), m.end(), capture)
+        if len(found) == len(RULES):
+            break
+    return found
+
+
+def _excerpt(text, start, end):
+    """The matched lines plus a few around them, without splitting the whole log."""
+    first = start
+    for _i in range(EXCERPT_BEFORE + 1):
+        first = text.rfind("\n", 0, first)
+        if first < 0:
+            break
+    last = end
+    for _i in range(EXCERPT_AFTER + 1):
+        last = text.find("\n", last)
+        if last < 0:
+            last = len(text)
+            break
+        last += 1
+    return text[first + 1:last].splitlines()
+
+
+def diagnose(text):
+    """Return the diagnosis for a failure log, or None if no rule matched."""
+    found = _scan(text)
+    if not found:
+        return None
+    idx = min(found)
+    start, end, capture = found[idx]
+    name, _anchors, _pattern, title, suggestion = RULES[idx]
+
+    return {
+        "rule": name,
+        "title": _(title).format(capture),
+        "suggestion": _(suggestion).format(capture),
+        "line": text.count("\n", 0, start) + 1,
+        "excerpt": _excerpt(text, start, end),
+    }
+
+
+def diagnose_run(step_text, run_text=None):
+    """Diagnosis of a failed step.
+
+    The step's own output decides when a rule matches there; otherwise the
+    whole run's log (``run_text``) is scanned, since the cause may have been
+    printed by an earlier command.
+    """
+    return diagnose(step_text) or (diagnose(run_text) if run_text else None)
+
+
+def format_diagnosis(diagnosis):
+    return "{}\n{}\n\n{}".format(
+        diagnosis["title"], diagnosis["suggestion"], "\n".join(diagnosis["excerpt"])
+    )
+
+
+def failure_message(text, tail_lines=15, diagnosis=None):
+    """Diagnosis if one applies, otherwise the last non-blank lines."""
+    diagnosis = diagnosis or diagnose(text)
+    if diagnosis:
+        return format_diagnosis(diagnosis)
+    tail = [l for l in text.strip().splitlines() if l.strip()][-tail_lines:]
+    return "\n".join(tail) if tail else _("No output captured.")
@@ -0,0 +1,1051 @@
+"""The install pipeline, without any UI.
+
+The widget and the command-line tools drive the same ``InstallEngine``;
+progress is reported through ``on_step(step, label)``, command output
+through a ``LogChannel`` and parsed output through ``connect_events``.
+While a run waits for another install or for pacman, ``on_wait(message)``
+is called with what it is waiting for, and with None once it goes on.
+"""
+import glob
+import os
+import shlex
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import time
+from contextlib import nullcontext
+
+from davinci_installer import (
+    artifacts, bundle, delta, deps, diagnose, history, locking, logarchive, logparse, makepkg_conf,
+    opencl, pkgdb, preflight, priority, privhelper, profiling, recipe, removal, runfile, verify,
+    versions,
+)
+from davinci_installer.logchannel import LogChannel
+
+try:
+    _
+except NameError:
+    from gettext import gettext as _
+
+# Stages timed and stored in the install history, in pipeline order
+INSTALL_STAGES = ("preflight", "prepare", "dependencies", "build", "finish")
+BUILD_STAGES = ("preflight", "prepare", "build")
+# The stage each progress step belongs to
+STEP_STAGES = {0: "prepare", 1: "dependencies", 2: "build", 3: "finish"}
+
+
+class PreflightError(RuntimeError):
+    """Not enough space for the install; the message is the per-mount report."""
+
+
+def package_name(is_studio):
+    return "davinci-resolve-studio" if is_studio else "davinci-resolve"
+
+
+# ── Root operations, shared with fleet installs ─────────────────────
+
+def snapshot_op(root):
+    return privhelper.script(versions.snapshot_script(root), "snapshot " + root)
+
+
+def discard_op(root):
+    return privhelper.script(versions.discard_script(root), "discard " + root)
+
+
+def install_ops(packages, keep_root=None):
+    """Install the built packages and put the kept root back, in one round trip."""
+    ops = [privhelper.install_files(packages)]
+    if keep_root:
+        ops.append(privhelper.script(versions.restore_script(keep_root), "restore " + keep_root))
+    return ops
+
+
+def ignore_packages(is_studio, opencl_packages):
+    """Packages added to pacman's IgnorePkg so a system upgrade leaves them alone."""
+    pkgs = list(deps.LIBCXX) + [package_name(is_studio)]
+    if deps.OPENCL_AMD in opencl_packages:
+        pkgs.append(deps.OPENCL_AMD)
+    return pkgs
+
+
+def finish_ops(new_root, is_studio, uid, gid, opencl_packages):
+    """Give the new root to ``uid``, activate it and pin the packages; only the last may fail."""
+    return [
+        privhelper.chown(os.path.join(versions.OPT_DIR, new_root), uid, gid),
+        privhelper.script(versions.activate_script(new_root, f"{uid}:{gid}"), "activate " + new_root),
+        privhelper.ignore("add", ignore_packages(is_studio, opencl_packages), optional=True),
+    ]
+
+
+def run_command(command, env=None, on_line=None, launcher=None):
+    """Run a shell command, handing every output line to ``on_line``; return its status.
+
+    ``launcher`` comes from ``priority.launcher`` and lowers the command's priority.
+    """
+    if launcher and launcher["prefix"]:
+        command = shlex.join(launcher["prefix"] + ["sh", "-c", command])
+    proc = subprocess.Popen(
+        command,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        env=env,
+    )
+    for line in iter(proc.stdout.readline, ""):
+        if line and on_line:
+            on_line(line)
+    proc.stdout.close()
+    return proc.wait()
+
+
+def format_plan(plan):
+    """Readable summary of ``InstallEngine.plan``."""
+    inst = plan["installer"]
+    dep = plan["dependencies"]
+    staging = plan["staging"]
+    lines = [
+        _("Install {} {} ({}) from {}").format(inst["package"], inst["version"], inst["edition"], inst["path"]),
+        _("Priority: {}").format(plan["priority"]["profile"]),
+        "",
+        _("Space:"),
+        preflight.format_report(plan["space"]),
+        "",
+        _("Staging in {}").format(staging["build_dir"]),
+        "  " + {
+            "move": _("The installer is moved there"),
+            "reuse-staged": _("The installer extracted by an earlier attempt is reused"),
+            "reuse-extracted": _("The installer extracted next to the zip is reused"),
+            "extract-zip": _("The installer is extracted from the zip"),
+        }[staging["installer_source"]],
+        "  " + _("Payload unpacked with {}").format(staging["payload"]),
+    ]
+    if staging["delta_reference"]:
+        lines.append("  " + _("Unchanged files are shared with {}").format(staging["delta_reference"]))
+    if staging["keep_root"]:
+        lines.append("  " + _("{} is kept next to the new version").format(staging["keep_root"]))
+    lines += ["", _("Dependencies:")]
+    if dep["bundle_dir"]:
+        lines.append("  " + _("From the offline bundle in {}").format(dep["bundle_dir"]))
+        if dep["bundle_missing"]:
+            lines.append("  " + _("Missing from the bundle: {}").format(" ".join(dep["bundle_missing"])))
+    if dep["missing"] is None:
+        lines.append("  " + _("Could not ask pacman which are installed"))
+    elif dep["missing"]:
+        lines.append("  " + _("To install: {}").format(" ".join(dep["missing"])))
+    else:
+        lines.append("  " + _("All installed already"))
+    if dep["opencl_amd_build"]:
+        lines.append("  " + _("opencl-amd is built from AUR"))
+    lines += ["", _("Added to IgnorePkg: {}").format(" ".join(plan["ignore_pkg"])), "", _("Stages:")]
+    for stage in plan["stages"]:
+        took = stage["predicted_seconds"]
+        lines.append(f"  {stage['name']:<14}{history.format_duration(took) if took is not None else '?':>13}")
+    if plan["predicted_seconds"] is not None:
+        lines.append(f"  {_('total'):<14}{history.format_duration(plan['predicted_seconds']):>13}")
+    else:
+        lines.append("  " + _("No earlier install to predict the duration from"))
+    return "\n".join(lines)
+
+
+class InstallEngine:
+    """One install (or build) of a Resolve installer file."""
+
+    total_steps = 3
+
+    def __init__(self, settings, sudo_wrap="sudo", env=None, log=None, on_step=None,
+                 helper=None, echo=True, record_history=True, priority_profile=None, on_wait=None):
+        self.settings = settings
+        self.sudo_wrap = sudo_wrap
+        self.env = env if env is not None else os.environ.copy()
+        # Headless callers get listeners called synchronously
+        self.log = log or LogChannel(lambda flush: flush())
+        self.on_step = on_step or (lambda step, label: None)
+        self.on_wait = on_wait or (lambda message: None)
+        # Every root operation of a run goes through one helper process;
+        # started on first use unless the caller owns one already
+        self.helper = helper
+        self._own_helper = False
+        self.launcher = priority.launcher(priority_profile or priority.from_settings(settings))
+        self.echo = echo
+        self.record_history = record_history
+        # Whole-run output goes to the archive; only the running command's is kept
+        self.log_writer = None
+        self.parser = logparse.LogParser()
+        self.events = []
+        self._event_listeners = []
+        self.tmp_build_dir = None
+        self.original_run_file_path = None
+        self.install_version = None
+        self.install_is_studio = False
+        self.run_extracted = False
+        self.built_artifacts = []
+        self.opencl_pkg = None
+        self.bundle_dir = None
+        self.gpu_report = None
+        self.delta_report = None
+        self.verify_report = None
+        self.run_id = None
+        self.timings = {}
+        self.diagnosis = None
+        # Of the failing step alone; decides whether a locked database is retried
+        self.step_diagnosis = None
+        # Set for a run while DAVINCI_INSTALLER_PROFILE is on
+        self.profiler = None
+
+    # ── Commands ────────────────────────────────────────────────────
+
+    def connect_events(self, callback):
+        self._event_listeners.append(callback)
+        return callback
+
+    def disconnect_events(self, callback):
+        if callback in self._event_listeners:
+            self._event_listeners.remove(callback)
+
+    def _on_output(self, line):
+        started = time.perf_counter() if self.profiler else None
+        if self.log_writer:
+            self.log_writer.write(line)
+        self.log.push(line)
+        if self.echo:
+            print(line, end="", flush=True)
+        for event in self.parser.feed(line):
+            self.events.append(event)
+            for callback in list(self._event_listeners):
+                callback(event)
+        if started is not None:
+            self.profiler.add("output lines", time.perf_counter() - started)
+
+    def run_cmd(self, command, on_line=None):
+        captured = []
+
+        def _line(line):
+            captured.append(line)
+            self._on_output(line)
+            if on_line:
+                on_line(line)
+
+        if run_command(command, env=self.env, on_line=_line, launcher=self.launcher) != 0:
+            raise RuntimeError(self._failure("".join(captured)))
+
+    def _run_log(self):
+        """Everything this run has logged so far, or None without an archive."""
+        if not self.log_writer:
+            return None
+        try:
+            return self.log_writer.text()
+        except OSError:
+            return None
+
+    def _failure(self, text):
+        """Diagnose a failed step from its output and the run's log; return the error message."""
+        self.step_diagnosis = diagnose.diagnose(text)
+        self.diagnosis = self.step_diagnosis or diagnose.diagnose(self._run_log() or "")
+        return diagnose.failure_message(text, diagnosis=self.diagnosis)
+
+    def _privileged_helper(self):
+        if self.helper is None:
+            self.helper = privhelper.PrivilegedHelper.spawn(
+                self.sudo_wrap, env=self.env, launcher=self.launcher
+            )
+            self._own_helper = True
+        return self.helper
+
+    def close_helper(self):
+        if self.helper and self._own_helper:
+            self.helper.close()
+            self.helper = None
+            self._own_helper = False
+
+    def privileged(self, *ops):
+        """Run ``privhelper`` operations as one batch; raise like ``run_cmd``.
+
+        If pacman's database was locked under it, the batch goes on from
+        the failed operation once the lock is gone. Returns the result of
+        every operation, in order.
+        """
+        ops = list(ops)
+        results = [None] * len(ops)
+        offset = 0
+        for attempt in range(locking.LOCKED_RETRIES + 1):
+            if privhelper.uses_database(ops):
+                self.wait_for_pacman()
+            captured = []
+
+            def _line(line):
+                captured.append(line)
+                self._on_output(line)
+
+            result = self._privileged_helper().run(ops, on_line=_line)
+            for r in result["results"]:
+                results[offset + r["index"]] = r
+            if result["ok"]:
+                return results
+            message = self._failure("".join(captured) + f"{result['error']}\n")
+            failed = next(
+                (r["index"] for r in result["results"]
+                 if not r["ok"] and not r.get("skipped") and not ops[r["index"]].get("optional")),
+                None,
+            )
+            if (attempt == locking.LOCKED_RETRIES or failed is None or not self._db_locked()
+                    or ops[failed]["op"] not in privhelper.DATABASE_OPS):
+                raise RuntimeError(message)
+            self._on_output("The package database was locked; trying again when it is free\n")
+            ops = ops[failed:]
+            offset += failed
+
+    def _db_locked(self):
+        return bool(self.step_diagnosis) and self.step_diagnosis["rule"] == "db-locked"
+
+    def pacman_step(self, command):
+        """``run_cmd`` for a command that runs pacman; waits out and retries a locked database."""
+        for attempt in range(locking.LOCKED_RETRIES + 1):
+            self.wait_for_pacman()
+            try:
+                return self.run_cmd(command)
+            except RuntimeError:
+                if attempt == locking.LOCKED_RETRIES or not self._db_locked():
+                    raise
+                self._on_output("The package database was locked; trying again when it is free\n")
+
+    def wait_for_pacman(self):
+        """Hold the next pacman step back while another package manager has the database."""
+        def _waiting(seconds):
+            if not seconds:
+                self._on_output(f"Waiting for {locking.DB_LOCK} to go away\n")
+            self.on_wait(_("Waiting for the package manager..."))
+
+        try:
+            waited = locking.wait_for_pacman(on_wait=_waiting)
+        except locking.StaleLockError as e:
+            self.on_wait(None)
+            self._on_output(e.text)
+            raise RuntimeError(self._failure(e.text))
+        if waited:
+            self.on_wait(None)
+
+    def _queue(self, installer_path):
+        """Wait for earlier installs of this user; return the held ``InstallLock``."""
+        lock = locking.InstallLock(os.path.basename(installer_path))
+        if lock.acquire(on_wait=lambda ahead: self.on_wait(locking.waiting_message(ahead))):
+            self.on_wait(None)
+        return lock
+
+    # ── Preparation ─────────────────────────────────────────────────
+
+    def _measure(self, section):
+        return self.profiler.measure(section) if self.profiler else nullcontext()
+
+    def detect_opencl_package(self):
+        if self.opencl_pkg is None:
+            with self._measure("detect OpenCL"):
+                self.opencl_pkg = deps.detect_opencl_package()
+        return self.opencl_pkg
+
+    def build_dir_for(self, installer_path):
+        base = self.settings.get("build_dir") or os.path.dirname(installer_path)
+        return os.path.join(os.path.expanduser(base), "davinci_tmp")
+
+    def space_report(self, installer_path, is_studio, install=True):
+        parsed = runfile.parse_installer_name(os.path.basename(installer_path))
+        is_zip = bool(parsed) and parsed["kind"] == "zip"
+        if is_zip:
+            run_size = runfile.zip_member(installer_path).file_size
+        else:
+            run_size = os.path.getsize(installer_path)
+        stages = preflight.plan_stages(
+            installer_path, run_size, self.build_dir_for(installer_path),
+            compression=self.settings.get("compression"),
+            is_zip=is_zip,
+            install_dir=versions.OPT_DIR if install else None,
+            installed_size=pkgdb.installed_size(package_name(is_studio)),
+        )
+        return preflight.check(stages)
+
+    def preflight(self, installer_path, is_studio, install=True):
+        """Refuse before anything is moved if a filesystem can't hold the install."""
+        report = self.space_report(installer_path, is_studio, install)
+        print(preflight.format_report(report), flush=True)
+        if not report["ok"]:
+            raise PreflightError(preflight.format_report(report))
+        return report
+
+    def prepare(self, installer_path, is_studio, opencl_deps=True):
+        """Stage the recipe and the .run in the build directory.
+
+        With ``opencl_deps=False`` the package keeps depending on the virtual
+        ``opencl-driver`` instead of this machine's driver (fleet builds).
+        """
+        original_dir = os.path.dirname(installer_path)
+        filename = os.path.basename(installer_path)
+        parsed = runfile.parse_installer_name(filename)
+        if not parsed:
+            raise ValueError(_("Could not extract version number from filename: {}").format(filename))
+        member = None
+        if parsed["kind"] == "zip":
+            member = runfile.zip_member(installer_path)
+            filename = os.path.basename(member.filename)
+            parsed = runfile.parse_installer_name(filename)
+        run_file_path = os.path.join(original_dir, filename)
+        self.tmp_build_dir = self.build_dir_for(installer_path)
+        os.makedirs(self.tmp_build_dir, exist_ok=True)
+        self.original_run_file_path = run_file_path
+        self.run_extracted = False
+        self.install_is_studio = is_studio
+
+        src_dir = os.path.join(self.tmp_build_dir, "src")
+        os.makedirs(src_dir, exist_ok=True)
+        staged_run = os.path.join(src_dir, filename)
+        if member is None:
+            shutil.move(run_file_path, staged_run)
+        elif runfile.is_extracted_copy(staged_run, member):
+            # Left in the staging directory by an earlier attempt
+            self.run_extracted = True
+        elif runfile.is_extracted_copy(run_file_path, member):
+            shutil.move(run_file_path, staged_run)
+        else:
+            self._extract_run_from_zip(installer_path, member, staged_run)
+            self.run_extracted = True
+
+        # The header can name a beta the file name left out
+        self.install_version = runfile.installer_version(staged_run) or parsed["version"]
+        if self.install_version != parsed["version"]:
+            print(f"Version {self.install_version} taken from the installer header", flush=True)
+        with self._measure("render recipe"):
+            self._stage_recipe(is_studio, self.install_version, filename, opencl_deps)
+
+    def _stage_recipe(self, is_studio, version, run_name, opencl_deps):
+        opencl_packages = self.detect_opencl_package().split() if opencl_deps else None
+        rendered = recipe.render(
+            is_studio, version, run_name, self.tmp_build_dir,
+            opencl_packages=opencl_packages, compression=self.settings.get("compression"),
+        )
+        print(
+            f"Build recipe for {version} {'reused from the cache' if rendered['cached'] else 'rendered and checked'}",
+            flush=True,
+        )
+        return rendered
+
+    def _extract_run_from_zip(self, zip_path, member, dest):
+        label = _("Extracting {}...").format(os.path.basename(dest))
+        last = [-1]
+
+        def _progress(done, total):
+            pct = int(done * 100 / total) if total else 100
+            if pct != last[0]:
+                last[0] = pct
+                self.on_step(pct / 100, f"{label}  {pct}%")
+
+        runfile.extract_zip_member(zip_path, member, dest, on_progress=_progress)
+
+    def extract_payload(self, step):
+        """Unpack the .run's squashfs payload once, straight into makepkg's srcdir."""
+        src_dir = os.path.join(self.tmp_build_dir, "src")
+        run_path = os.path.join(src_dir, os.path.basename(self.original_run_file_path))
+        dest = os.path.join(src_dir, "squashfs-root")
+        offset = runfile.payload_offset(run_path)
+        cmd = runfile.unsquashfs_command(run_path, dest, offset) if offset else None
+        if not cmd:
+            return False
+
+        label = _("Step {}: Extracting DaVinci Resolve...").format(step)
+
+        def _on_lines(lines):
+            pct = [l.strip() for l in lines if l.strip().isdigit()]
+            if pct:
+                self.on_step(step, f"{label}  {pct[-1]}%")
+
+        self.on_step(step, label)
+        self.log.connect(_on_lines)
+        try:
+            self.run_cmd(cmd)
+        except Exception as e:
+            # makepkg's prepare() extracts it the slow way instead
+            print(f"Payload extraction failed, leaving it to makepkg: {e}", flush=True)
+            shutil.rmtree(dest, ignore_errors=True)
+            return False
+        finally:
+            self.log.disconnect(_on_lines)
+        self.on_step(step, _("Step {}: Installing DaVinci Resolve...").format(step))
+        return True
+
+    def cleanup(self, failed=False):
+        if not self.tmp_build_dir or not self.original_run_file_path:
+            return
+        try:
+            tmp_run = os.path.join(
+                self.tmp_build_dir, "src", os.path.basename(self.original_run_file_path)
+            )
+            if os.path.exists(tmp_run):
+                if self.run_extracted and not failed:
+                    # The zip is still there; no need to keep a second copy
+                    os.remove(tmp_run)
+                else:
+                    # Keep it beside the zip so a retry skips the extraction
+                    shutil.move(tmp_run, self.original_run_file_path)
+            if os.path.exists(self.tmp_build_dir):
+                shutil.rmtree(self.tmp_build_dir)
+            if self.built_artifacts:
+                artifacts.forget(self.built_artifacts)
+        except Exception:
+            pass
+        finally:
+            self.tmp_build_dir = None
+            self.original_run_file_path = None
+            self.built_artifacts = []
+
+    # ── Step 1: dependencies ────────────────────────────────────────
+
+    def dependency_plan(self, installer_path):
+        """What Step 1 runs, without running it.
+
+        Returns {"packages", "commands", "root_ops", "opencl_amd", "bundle_dir",
+        "offline_conf"}: ``commands`` run as the user, ``root_ops`` go to the
+        privileged helper, ``opencl_amd`` says whether it is built from AUR.
+        """
+        sudo_wrap = self.sudo_wrap
+        opencl_pkg = self.detect_opencl_package()
+
+        # opencl-amd needs to be built from AUR at a pinned commit;
+        # install it separately and exclude from the regular dep list
+        needs_opencl_amd = "opencl-amd" in opencl_pkg
+        regular_opencl = opencl_pkg.replace("opencl-amd", "").strip()
+
+        # AUR-only deps must be installed first so pacman can resolve them later
+        aur_deps = " ".join(deps.AUR_DEPS)
+        dep_list = " ".join(deps.REPO_DEPS)
+        if regular_opencl:
+            dep_list = f"{regular_opencl} {dep_list}"
+        davinci_deps = dep_list
+        aur_cmd = f"paru -Sy --noconfirm --needed --skipreview --removemake {aur_deps} --sudo '{sudo_wrap}'"
+        paru_cmd = f"paru -Sy --noconfirm --needed --skipreview --removemake {davinci_deps} --sudo '{sudo_wrap}'"
+        plan = {
+            "packages": list(deps.AUR_DEPS + deps.REPO_DEPS + deps.LIBCXX) + opencl_pkg.split(),
+            "commands": [aur_cmd, paru_cmd],
+            "root_ops": [privhelper.install_repo(
+                [f"{deps.LIBCXX_REPO}/{p}" for p in deps.LIBCXX], needed=False, overwrite=["*"],
+            )],
+            "opencl_amd": needs_opencl_amd,
+            "bundle_dir": None,
+            "offline_conf": None,
+        }
+
+        # A local repo exported on a connected machine replaces every
+        # network source, opencl-amd included
+        bundle_dir = bundle.find_bundle(installer_path, self.settings)
+        if bundle_dir:
+            offline_conf = os.path.join(self.build_dir_for(installer_path), "pacman-offline.conf")
+            plan.update(
+                commands=[],
+                root_ops=bundle.install_ops(offline_conf, opencl_pkg.split()),
+                opencl_amd=False,
+                bundle_dir=bundle_dir,
+                offline_conf=offline_conf,
+            )
+        return plan
+
+    def install_dependencies(self, step, installer_path):
+        self.on_step(step, _("Step {}: Installing dependencies...").format(step))
+        plan = self.dependency_plan(installer_path)
+        self.bundle_dir = plan["bundle_dir"]
+        if self.bundle_dir:
+            missing = bundle.missing_packages(self.bundle_dir, plan["packages"])
+            if missing:
+                raise RuntimeError(
+                    _("The offline bundle in {} lacks: {}").format(self.bundle_dir, " ".join(missing))
+                )
+            with open(plan["offline_conf"], "w") as f:
+                f.write(bundle.pacman_conf(self.bundle_dir))
+            print(f"Installing dependencies from {self.bundle_dir}", flush=True)
+
+        label = _("Step {}: Installing dependencies...").format(step)
+
+        def _on_dep_event(event):
+            if event["type"] in (logparse.DOWNLOAD, logparse.MAKING, logparse.INSTALLED):
+                detail = event["package"]
+                if "index" in event:
+                    detail += f" {event['index']}/{event['total']}"
+                self.on_step(step, f"{label}  ({detail})")
+
+        self.connect_events(_on_dep_event)
+        try:
+            if plan["commands"]:
+                # --needed makes a second attempt skip what the first installed
+                self.pacman_step(" && ".join(plan["commands"]))
+            self.privileged(*plan["root_ops"])
+            if plan["opencl_amd"]:
+                self.on_step(step, f"{label}  (opencl-amd)")
+                self.install_opencl_amd()
+        finally:
+            self.disconnect_events(_on_dep_event)
+
+    def install_opencl_amd(self):
+        """Build and install opencl-amd from AUR at a known-good commit."""
+        # Skip if already installed at the pinned version
+        if pkgdb.is_installed("opencl-amd"):
+            return
+        tmpdir = tempfile.mkdtemp(prefix="opencl-amd-")
+        pkgdir = os.path.join(tmpdir, "opencl-amd")
+        try:
+            clone_cmd = (
+                f"git clone {deps.OPENCL_AMD_URL} {shlex.quote(pkgdir)} "
+                f"&& cd {shlex.quote(pkgdir)} "
+                f"&& git checkout {deps.OPENCL_AMD_COMMIT} "
+                f"&& PKGDEST=. PACMAN_AUTH='{self.sudo_wrap}' makepkg -s --noconfirm --needed"
+            )
+            self.wait_for_pacman()
+            self.run_cmd(clone_cmd)
+            built = [p for p in glob.glob(os.path.join(pkgdir, "*.pkg.tar*")) if not p.endswith(".sig")]
+            self.privileged(privhelper.install_files(built))
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    # ── Step 2: build (and install) the package ─────────────────────
+
+    def makepkg_command(self, phase="", build_dir=None, offline=None):
+        """Build only; installing is left to the privileged helper.
+
+        ``phase`` is ``-o`` (stop after prepare()) or ``-e`` (continue from there).
+        ``build_dir`` and ``offline`` default to the current run's.
+        """
+        build_dir = build_dir or self.tmp_build_dir
+        if offline is None:
+            offline = bool(self.bundle_dir)
+        quoted_tmp = shlex.quote(build_dir)
+        # With a bundle everything is installed already; never let -s reach a mirror
+        flags = "" if offline else "-s "
+        if phase:
+            flags += phase + " "
+        # Keep every makepkg output in the staging dir, whatever PKGDEST
+        # the user configured, so no copy of the package outlives it
+        cmd = (
+            f"cd {quoted_tmp} && export PACMAN_AUTH='{self.sudo_wrap}' "
+            f"PKGDEST={quoted_tmp} SRCDEST={quoted_tmp} BUILDDIR={quoted_tmp} "
+            f"&& makepkg {flags}--noconfirm --skipinteg --needed"
+        )
+        # prepare() writes one whenever the compression setting needs it
+        if makepkg_conf.render(self.settings.get("compression")):
+            cmd += " --config makepkg.conf"
+        return cmd
+
+    def build_and_install(self, step):
+        self.on_step(step, _("Step {}: Installing DaVinci Resolve...").format(step))
+
+        # Keep the currently installed version around: pacman deletes its
+        # files on upgrade, so hardlink-copy its root first
+        new_root = versions.root_name(self.install_version, self.install_is_studio)
+        old_root = versions.package_root()
+        keep_root = None
+        if old_root and old_root != new_root and os.path.isdir(os.path.join(versions.OPT_DIR, old_root)):
+            keep_root = old_root
+            self.privileged(snapshot_op(keep_root))
+
+        self.extract_payload(step)
+        try:
+            try:
+                reference = self._delta_reference(new_root, self.install_is_studio)
+                if reference:
+                    # Stop after prepare() so the staged files are patched
+                    # like the installed ones before comparing them
+                    self.pacman_step(self.makepkg_command("-o"))
+                    self._delta_upgrade(reference)
+                    self.run_cmd(self.makepkg_command("-e"))
+                else:
+                    self.pacman_step(self.makepkg_command())
+            finally:
+                self._record_artifacts()
+            pkgs = self._built_packages()
+            self.privileged(*install_ops(pkgs, keep_root))
+        except Exception:
+            if keep_root:
+                self.privileged(discard_op(keep_root))
+            raise
+        return new_root
+
+    def _delta_reference(self, new_root, is_studio):
+        if not self.settings.get("delta_upgrade", True):
+            return None
+        return delta.reference_root(new_root, is_studio)
+
+    def _delta_upgrade(self, reference):
+        staging = os.path.join(self.tmp_build_dir, "src", "squashfs-root")
+        try:
+            self.delta_report = delta.dedup(staging, reference)
+        except OSError as e:
+            # Every replacement is atomic, so the staged tree is still whole
+            self._on_output(f"Delta upgrade stopped, packaging the rest as is: {e}\n")
+            return
+        self._on_output(delta.format_report(self.delta_report) + "\n")
+
+    def build_only(self, step):
+        """Build the package without installing it; return its path."""
+        self.on_step(step, _("Step {}: Building DaVinci Resolve...").format(step))
+        self.extract_payload(step)
+        try:
+            self.pacman_step(self.makepkg_command())
+        finally:
+            self._record_artifacts()
+        return self._built_packages()[0]
+
+    def _built_packages(self):
+        pkgs = [p for p in self.built_artifacts if not p.endswith(".sig")]
+        if not pkgs:
+            raise RuntimeError(_("makepkg did not produce a package"))
+        return pkgs
+
+    def _record_artifacts(self):
+        try:
+            self.built_artifacts = artifacts.record(self.tmp_build_dir)
+        except OSError:
+            pass
+
+    # ── Step 3: finishing up ────────────────────────────────────────
+
+    def finish(self, step, new_root):
+        self.on_step(step, _("Step {}: Finishing up...").format(step))
+
+        # A failed IgnorePkg edit doesn't fail the install
+        ops = self.finish_ops(new_root, self.install_is_studio)
+        results = self.privileged(*ops)
+        try:
+            # Removal takes out only what we added, never the user's own entries
+            removal.record_ignores(privhelper.ignore_changes(ops, results, "add"))
+        except OSError as e:
+            print(f"Could not record the IgnorePkg entries: {e}", flush=True)
+        if self.settings.get("verify_install", True):
+            self.verify_installation(step)
+
+        # Load the OpenCL drivers once so the first Resolve start
+        # doesn't pay for device probing; problems are reported later
+        try:
+            self.gpu_report = opencl.check_readiness(self.detect_opencl_package().split())
+            print(opencl.format_summary(self.gpu_report), flush=True)
+        except Exception:
+            self.gpu_report = None
+
+    def ignore_packages(self, is_studio):
+        return ignore_packages(is_studio, self.detect_opencl_package().split())
+
+    def finish_ops(self, new_root, is_studio):
+        return finish_ops(new_root, is_studio, os.getuid(), os.getgid(), self.detect_opencl_package().split())
+
+    def verify_installation(self, step):
+        """Check the installed files against the package's mtree; raise on mismatches."""
+        label = _("Step {}: Verifying installed files...").format(step)
+        self.on_step(step, label)
+        name = package_name(self.install_is_studio)
+        version = pkgdb.query_info(name).get("Version")
+        last = [-1]
+
+        def _progress(done, total):
+            pct = int(done * 100 / total) if total else 100
+            if pct != last[0]:
+                last[0] = pct
+                self.on_step(step, f"{label}  {pct}%")
+
+        try:
+            report = verify.verify(name, version, on_progress=_progress)
+        except OSError as e:
+            # No mtree to check against; nothing to say about the files
+            self._on_output(f"Could not verify {name}: {e}\n")
+            return
+        self.verify_report = report
+        self._on_output(verify.format_report(report) + "\n")
+        if report["problems"]:
+            shown = [f"{p['path']}: {p['problem']}" for p in report["problems"][:verify.SHOWN_PROBLEMS]]
+            raise RuntimeError(
+                _("{} installed files don't match the package:").format(len(report["problems"]))
+                + "\n" + "\n".join(shown)
+            )
+
+    # ── Dry run ─────────────────────────────────────────────────────
+
+    def plan(self, installer_path, is_studio):
+        """Everything ``install`` would do, as JSON-ready data; nothing is changed.
+
+        Lists the stages in order with the commands and privileged
+        operations each one runs, the packages still missing, where the
+        installer and its payload are staged, the space needed per mount and
+        the duration of every stage predicted from earlier runs.
+        """
+        filename = os.path.basename(installer_path)
+        parsed = runfile.parse_installer_name(filename)
+        if not parsed:
+            raise ValueError(_("Could not extract version number from filename: {}").format(filename))
+        member = runfile.zip_member(installer_path) if parsed["kind"] == "zip" else None
+        run_name = os.path.basename(member.filename) if member else filename
+        build_dir = self.build_dir_for(installer_path)
+        src_dir = os.path.join(build_dir, "src")
+        staged_run = os.path.join(src_dir, run_name)
+        beside_zip = os.path.join(os.path.dirname(installer_path), run_name)
+
+        # Where the .run comes from; the CRC of a copy we didn't extract
+        # ourselves isn't checked, that would read gigabytes
+        run_path = None
+        if member is None:
+            source, run_path = "move", installer_path
+        elif runfile.is_extracted_copy(staged_run, member, check_crc=False):
+            source, run_path = "reuse-staged", staged_run
+        elif runfile.is_extracted_copy(beside_zip, member, check_crc=False):
+            source, run_path = "reuse-extracted", beside_zip
+        else:
+            source = "extract-zip"
+        # As prepare() will see it: the header can name a beta the file name left out
+        version = runfile.parse_installer_name(run_name)["version"]
+        if run_path:
+            version = runfile.installer_version(run_path) or version
+        edition = history.edition(is_studio)
+        pkg_name = package_name(is_studio)
+        new_root = versions.root_name(version, is_studio)
+        old_root = versions.package_root()
+        keep_root = None
+        if old_root and old_root != new_root and os.path.isdir(os.path.join(versions.OPT_DIR, old_root)):
+            keep_root = old_root
+        payload_dest = os.path.join(src_dir, "squashfs-root")
+        payload = "unsquashfs" if shutil.which("unsquashfs") else "appimage-extract"
+        # The payload offset of a .run still inside the zip is only known once it's out
+        offset = runfile.payload_offset(run_path) if run_path else None
+        unsquashfs = runfile.unsquashfs_command(staged_run, payload_dest, offset) if offset else None
+        reference = self._delta_reference(new_root, is_studio)
+
+        dep_plan = self.dependency_plan(installer_path)
+        try:
+            missing = pkgdb.missing(dep_plan["packages"])
+        except OSError:
+            missing = None
+        bundle_missing = (
+            bundle.missing_packages(dep_plan["bundle_dir"], dep_plan["packages"])
+            if dep_plan["bundle_dir"] else []
+        )
+        opencl_amd_build = dep_plan["opencl_amd"] and (missing is None or "opencl-amd" in missing)
+
+        def _user(command):
+            return {"runs_as": "user", "command": command}
+
+        def _root(op):
+            return {"runs_as": "root", "operation": op}
+
+        def _task(task, **detail):
+            return dict({"runs_as": "user", "task": task}, **detail)
+
+        offline = bool(dep_plan["bundle_dir"])
+        dependency_actions = [_user(" && ".join(dep_plan["commands"]))] if dep_plan["commands"] else []
+        dependency_actions += [_root(op) for op in dep_plan["root_ops"]]
+        if opencl_amd_build:
+            dependency_actions.append(_task(
+                "build-opencl-amd", url=deps.OPENCL_AMD_URL, commit=deps.OPENCL_AMD_COMMIT,
+            ))
+
+        build_actions = []
+        if keep_root:
+            build_actions.append(_root(snapshot_op(keep_root)))
+        if unsquashfs:
+            build_actions.append(_user(unsquashfs))
+        elif payload == "unsquashfs":
+            build_actions.append(_task("extract-payload", run=staged_run, dest=payload_dest))
+        if reference:
+            build_actions += [
+                _user(self.makepkg_command("-o", build_dir, offline)),
+                _task("delta-upgrade", reference=reference),
+                _user(self.makepkg_command("-e", build_dir, offline)),
+            ]
+        else:
+            build_actions.append(_user(self.makepkg_command("", build_dir, offline)))
+        built = os.path.join(build_dir, f"{pkg_name}-{version}-*.pkg.tar.*")
+        build_actions += [_root(op) for op in install_ops([built], keep_root)]
+
+        finish_actions = [_root(op) for op in self.finish_ops(new_root, is_studio)]
+        if self.settings.get("verify_install", True):
+            finish_actions.append(_task("verify", package=pkg_name))
+        finish_actions.append(_task("check-opencl", packages=self.detect_opencl_package().split()))
+
+        space = self.space_report(installer_path, is_studio)
+        actions = {
+            "preflight": [_task("check-space", mounts=[m["mount"] for m in space["mounts"]])],
+            "prepare": [
+                _task("stage-recipe", source=recipe.RECIPE_DIRS[bool(is_studio)][0], dest=build_dir),
+                _task(source, installer=installer_path, dest=staged_run),
+            ],
+            "dependencies": dependency_actions,
+            "build": build_actions,
+            "finish": finish_actions,
+        }
+
+        medians = {}
+        if os.path.exists(history.db_path()):
+            try:
+                medians = (
+                    history.stage_medians("install", edition, self.launcher["profile"])
+                    or history.stage_medians("install", edition)
+                )
+            except sqlite3.Error:
+                pass
+        stages = []
+        for i, name in enumerate(INSTALL_STAGES):
+            stages.append({
+                "name": name,
+                "after": INSTALL_STAGES[i - 1] if i else None,
+                "predicted_seconds": medians.get(name),
+                "actions": actions[name],
+            })
+        predictions = [s["predicted_seconds"] for s in stages]
+
+        return {
+            "dry_run": True,
+            "installer": {
+                "path": installer_path, "kind": parsed["kind"], "run": run_name,
+                "version": version, "edition": edition, "package": pkg_name,
+                "bytes": member.file_size if member else os.path.getsize(installer_path),
+            },
+            "priority": {"profile": self.launcher["profile"], "method": self.launcher["method"]},
+            "space": space,
+            "dependencies": {
+                "packages": dep_plan["packages"],
+                "missing": missing,
+                "opencl": self.detect_opencl_package().split(),
+                "opencl_amd_build": opencl_amd_build,
+                "bundle_dir": dep_plan["bundle_dir"],
+                "bundle_missing": bundle_missing,
+            },
+            "staging": {
+                "build_dir": build_dir,
+                "installer_source": source,
+                "payload": payload,
+                "compression": self.settings.get("compression") or "default",
+                "delta_reference": reference,
+                "keep_root": keep_root,
+                "new_root": os.path.join(versions.OPT_DIR, new_root),
+            },
+            "ignore_pkg": self.ignore_packages(is_studio),
+            "stages": stages,
+            "predicted_seconds": sum(predictions) if None not in predictions else None,
+        }
+
+    # ── History ─────────────────────────────────────────────────────
+
+    def _timed(self, stage, func, *args, **kwargs):
+        started = time.monotonic()
+        try:
+            with self.profiler.stage(stage) if self.profiler else nullcontext():
+                return func(*args, **kwargs)
+        finally:
+            self.timings[stage] = time.monotonic() - started
+
+    def _begin_run(self, kind, installer_path, is_studio):
+        self.timings = {}
+        self.diagnosis = None
+        self.run_id = None
+        self.install_version = None
+        self._run_started = time.monotonic()
+        if self.launcher["method"]:
+            print(f"Running at {self.launcher['profile']} priority ({self.launcher['method']})", flush=True)
+        try:
+            self.profiler = profiling.start(f"{kind}-{time.strftime('%Y%m%d-%H%M%S')}")
+        except OSError as e:
+            print(f"Could not start profiling: {e}", flush=True)
+        if not self.record_history:
+            return
+        parsed = runfile.parse_installer_name(os.path.basename(installer_path))
+        version = parsed["version"] if parsed else None
+        if parsed and parsed["kind"] == "run":
+            version = runfile.installer_version(installer_path) or version
+        try:
+            # Fingerprinted now: prepare() moves the installer away; the version
+            # of a .run still in its zip is filled in when the run ends
+            self.run_id = history.start_run(
+                kind, history.edition(is_studio), version,
+                history.input_fingerprint(installer_path), priority=self.launcher["profile"],
+            )
+        except (sqlite3.Error, OSError) as e:
+            print(f"Could not record install history: {e}", flush=True)
+        if self.profiler:
+            self.profiler.run_id = self.run_id
+        name = f"run-{self.run_id}" if self.run_id is not None else f"{kind}-{int(time.time())}"
+        try:
+            self.log_writer = logarchive.LogWriter(logarchive.log_path(name))
+            logarchive.prune(logarchive.retention_bytes(self.settings), keep=(self.log_writer.path,))
+        except OSError as e:
+            print(f"Could not archive the install log: {e}", flush=True)
+
+    def _end_run(self, error):
+        self.close_helper()
+        if self.profiler:
+            try:
+                print(profiling.format_report(self.profiler.finish()), flush=True)
+            except OSError as e:
+                print(f"Could not write the profile: {e}", flush=True)
+            self.profiler = None
+        log = None
+        if self.log_writer:
+            try:
+                self.log_writer.close()
+                log = self.log_writer.path
+            except OSError:
+                pass
+        if self.run_id is None:
+            return
+        message = str(error).strip() if error else ""
+        try:
+            history.finish_run(
+                self.run_id,
+                history.FAILED if error else history.SUCCESS,
+                time.monotonic() - self._run_started,
+                stages=self.timings,
+                diagnosis=self.diagnosis["rule"] if self.diagnosis else None,
+                error=message.splitlines()[0] if message else None,
+                log=log,
+                version=self.install_version,
+            )
+        except (sqlite3.Error, OSError) as e:
+            print(f"Could not record install history: {e}", flush=True)
+
+    # ── Whole pipelines ─────────────────────────────────────────────
+
+    def install(self, installer_path, is_studio):
+        """Preflight, dependencies, build + install, finish. Raises on failure."""
+        failed = True
+        error = None
+        lock = self._queue(installer_path)
+        self._begin_run("install", installer_path, is_studio)
+        try:
+            self._timed("preflight", self.preflight, installer_path, is_studio)
+            # A .zip is unpacked here
+            self._timed("prepare", self.prepare, installer_path, is_studio)
+            self._timed("dependencies", self.install_dependencies, 1, installer_path)
+            new_root = self._timed("build", self.build_and_install, 2)
+            self._timed("finish", self.finish, 3, new_root)
+            failed = False
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.cleanup(failed)
+            self._end_run(error)
+            lock.release()
+
+    def build(self, installer_path, is_studio, dest_dir):
+        """Build a machine-independent package into ``dest_dir``; return its path."""
+        failed = True
+        error = None
+        lock = self._queue(installer_path)
+        self._begin_run("build", installer_path, is_studio)
+        try:
+            self._timed("preflight", self.preflight, installer_path, is_studio, install=False)
+            self._timed("prepare", self.prepare, installer_path, is_studio, opencl_deps=False)
+            built = self._timed("build", self.build_only, 1)
+            os.makedirs(dest_dir, exist_ok=True)
+            dest = os.path.join(dest_dir, os.path.basename(built))
+            shutil.move(built, dest)
+            failed = False
+            return dest
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.cleanup(failed)
+            self._end_run(error)
+            lock.release()
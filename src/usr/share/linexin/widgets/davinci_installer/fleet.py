@@ -0,0 +1,290 @@
+"""Install one built package on many machines over SSH.
+
+The package is built once (``InstallEngine.build``), then pushed with the
+offline bundle to every host and installed there by the same stages the
+local install runs: dependencies from the bundle, a snapshot of the
+previous version, ``pacman -U``, activation and IgnorePkg. Hosts are
+handled ``parallel`` at a time.
+
+Every run uploads into a private directory made with ``mktemp -d`` on the
+host, removed again afterwards. The root operations are the engine's own
+(see ``engine.finish_ops``), run by a privileged helper started over ssh
+from the uploaded modules, so a host ends up as a local install leaves
+the machine, down to the record of the IgnorePkg entries it added.
+
+``ssh``/``scp`` are plain argv prefixes (``ssh ... HOST SCRIPT`` and
+``scp ... FILES HOST:DIR``), so a test can point them at ``ssh localhost``
+or a wrapper script that targets a container.
+"""
+import os
+import shlex
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from davinci_installer import artifacts, bundle, deps, diagnose, engine, privhelper, versions
+
+try:
+    _
+except NameError:
+    from gettext import gettext as _
+
+DEFAULT_SSH = ("ssh", "-o", "BatchMode=yes")
+DEFAULT_SCP = ("scp", "-q", "-r", "-o", "BatchMode=yes")
+DEFAULT_SUDO = "sudo -n"
+# Where the private upload directory of a run is created on the hosts
+REMOTE_TMP = "/var/tmp"
+# What the helper and the IgnorePkg record import on the host
+REMOTE_MODULES = ("__init__.py", "config.py", "pacman_conf.py", "pkgdb.py", "privhelper.py", "removal.py")
+OFFLINE_CONF = "pacman-offline.conf"
+
+STAGES = ("probe", "upload", "dependencies", "install", "finish")
+
+
+def _tree_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
+
+
+def parse_pacman_q(output):
+    """``pacman -Q`` lines -> {package: version}."""
+    found = {}
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            found[parts[0]] = parts[1]
+    return found
+
+
+class FleetDriver:
+
+    def __init__(self, hosts, package, bundle_dir, parallel=4, ssh=DEFAULT_SSH,
+                 scp=DEFAULT_SCP, sudo=DEFAULT_SUDO, remote_tmp=REMOTE_TMP, opencl=None,
+                 on_event=None, fake_root=None):
+        """``fake_root`` runs the hosts' helper unprivileged on its fake backend, for tests."""
+        info = artifacts.parse_artifact(os.path.basename(package))
+        if not info or info["package"] == deps.OPENCL_AMD:
+            raise ValueError(_("Not a DaVinci Resolve package: {}").format(package))
+        if not bundle.is_bundle(bundle_dir):
+            raise ValueError(_("Not an offline bundle: {}").format(bundle_dir))
+        self.hosts = list(hosts)
+        self.package = os.path.abspath(package)
+        self.bundle_dir = os.path.abspath(bundle_dir)
+        self.parallel = max(1, int(parallel))
+        self.ssh = list(ssh)
+        self.scp = list(scp)
+        self.sudo = sudo
+        self.remote_tmp = remote_tmp
+        self.fake_root = fake_root
+        self.opencl = list(opencl) if opencl else None
+        self.on_event = on_event or (lambda event: None)
+        self.is_studio = info["package"] == "davinci-resolve-studio"
+        pkgver = info["version"].rsplit("-", 1)[0].split(":")[-1]
+        self.root = versions.root_name(pkgver, self.is_studio)
+        self._lock = threading.Lock()
+
+    # ── Remote plumbing ─────────────────────────────────────────────
+
+    def _emit(self, host, stage, status, **extra):
+        event = dict(host=host, stage=stage, status=status, time=time.time(), **extra)
+        with self._lock:
+            self.on_event(event)
+
+    def _call(self, host, stage, argv):
+        proc = subprocess.Popen(
+            argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, errors="replace",
+        )
+        lines = []
+        for line in iter(proc.stdout.readline, ""):
+            lines.append(line.rstrip("\n"))
+            self._emit(host, stage, "output", line=lines[-1])
+        proc.stdout.close()
+        if proc.wait() != 0:
+            raise RuntimeError(diagnose.failure_message("\n".join(lines)))
+        return "\n".join(lines)
+
+    def remote(self, host, stage, script):
+        return self._call(host, stage, self.ssh + [host, script])
+
+    def copy(self, host, stage, paths, dest):
+        return self._call(host, stage, self.scp + list(paths) + [f"{host}:{dest}/"])
+
+    def _remote_path(self, ctx, local):
+        return f"{ctx['remote_dir']}/{os.path.basename(local)}"
+
+    def _helper(self, host, ctx):
+        if "helper" not in ctx:
+            argv = ["python3", "-B", f"{ctx['remote_dir']}/davinci_installer/privhelper.py", "serve"]
+            if self.fake_root:
+                argv += ["--fake", self.fake_root]
+            else:
+                argv = shlex.split(self.sudo) + argv
+            ctx["helper"] = privhelper.PrivilegedHelper(self.ssh + [host, shlex.join(argv)])
+        return ctx["helper"]
+
+    def _privileged(self, host, ctx, stage, ops):
+        """Run root operations on the host; return their results or raise with a diagnosis."""
+        lines = []
+
+        def _line(line):
+            lines.append(line.rstrip("\n"))
+            self._emit(host, stage, "output", line=lines[-1])
+
+        result = self._helper(host, ctx).run(ops, on_line=_line)
+        if not result["ok"]:
+            raise RuntimeError(diagnose.failure_message("\n".join(lines + [result["error"]])))
+        return result["results"]
+
+    # ── Stages ──────────────────────────────────────────────────────
+
+    def _probe(self, host, ctx):
+        out = self.remote(
+            host, "probe",
+            "id -u; id -g; echo ---; lspci -nn 2>/dev/null; echo ---; "
+            "pacman -Q davinci-resolve davinci-resolve-studio 2>/dev/null; true",
+        )
+        sections = [[]]
+        for line in out.splitlines():
+            if line.strip() == "---":
+                sections.append([])
+            else:
+                sections[-1].append(line)
+        ids, lspci, installed = ("\n".join(s) for s in (sections + [[], []])[:3])
+        # The login user owns the installed root, as the installing user does locally
+        ctx["uid"], ctx["gid"] = (int(v) for v in ids.split()[-2:])
+        ctx["opencl"] = self.opencl or (deps.opencl_for_lspci(lspci) or "opencl-mesa").split()
+        packages = parse_pacman_q(installed)
+        ctx["old_root"] = versions.package_root(
+            lambda pkg: {"Version": packages[pkg]} if pkg in packages else {}
+        )
+        wanted = list(deps.AUR_DEPS + deps.REPO_DEPS + deps.LIBCXX) + ctx["opencl"]
+        missing = bundle.missing_packages(self.bundle_dir, wanted)
+        if missing:
+            raise RuntimeError(
+                _("The offline bundle in {} lacks: {}").format(self.bundle_dir, " ".join(missing))
+            )
+
+    def _upload(self, host, ctx):
+        # Private to the login user, and a fresh one for every run: nobody
+        # else on the host can swap what root runs from it
+        template = f"{self.remote_tmp.rstrip('/')}/davinci-fleet.XXXXXXXXXX"
+        out = self.remote(host, "upload", f"mktemp -d {shlex.quote(template)}").strip().splitlines()
+        remote_dir = out[-1].strip() if out else ""
+        if not remote_dir.startswith(template[:-10]):
+            raise RuntimeError(_("Could not create a staging directory on {}").format(host))
+        ctx["remote_dir"] = remote_dir
+        staging = tempfile.mkdtemp(prefix="davinci-fleet-")
+        try:
+            modules = os.path.join(staging, "davinci_installer")
+            os.makedirs(modules)
+            for name in REMOTE_MODULES:
+                shutil.copy2(os.path.join(os.path.dirname(privhelper.__file__), name), modules)
+            conf = os.path.join(staging, OFFLINE_CONF)
+            with open(conf, "w") as f:
+                f.write(bundle.pacman_conf(self._remote_path(ctx, self.bundle_dir)))
+            paths = [self.package, self.bundle_dir, modules, conf]
+            self.copy(host, "upload", paths, remote_dir)
+            ctx["bytes"] = sum(_tree_size(p) for p in paths)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _dependencies(self, host, ctx):
+        conf = f"{ctx['remote_dir']}/{OFFLINE_CONF}"
+        self._privileged(host, ctx, "dependencies", bundle.install_ops(conf, ctx["opencl"]))
+
+    def _install(self, host, ctx):
+        old = ctx["old_root"]
+        keep_root = old if old and old != self.root else None
+        if keep_root:
+            self._privileged(host, ctx, "install", [engine.snapshot_op(keep_root)])
+        try:
+            self._privileged(
+                host, ctx, "install", engine.install_ops([self._remote_path(ctx, self.package)], keep_root),
+            )
+        except Exception:
+            if keep_root:
+                self._privileged(host, ctx, "install", [engine.discard_op(keep_root)])
+            raise
+
+    def _finish(self, host, ctx):
+        ops = engine.finish_ops(self.root, self.is_studio, ctx["uid"], ctx["gid"], ctx["opencl"])
+        results = self._privileged(host, ctx, "finish", ops)
+        added = privhelper.ignore_changes(ops, results, "add")
+        if not added:
+            return
+        # Kept with the login user's state, where a removal on the host looks
+        record = (
+            "import sys; sys.path.insert(0, sys.argv[1]); "
+            "from davinci_installer import removal; removal.record_ignores(sys.argv[2:])"
+        )
+        try:
+            self.remote(host, "finish", shlex.join(["python3", "-B", "-c", record, ctx["remote_dir"]] + added))
+        except RuntimeError as e:
+            self._emit(host, "finish", "output", line=f"Could not record the IgnorePkg entries: {e}")
+
+    def _cleanup(self, host, ctx):
+        """Drop the uploaded package and bundle; a failure here doesn't fail the host."""
+        self._emit(host, "cleanup", "start")
+        try:
+            self.remote(host, "cleanup", f"rm -rf {shlex.quote(ctx['remote_dir'])}")
+        except Exception as e:
+            self._emit(host, "cleanup", "failed", error=str(e))
+            return False
+        self._emit(host, "cleanup", "done")
+        return True
+
+    # ── Driver ──────────────────────────────────────────────────────
+
+    def install_host(self, host):
+        result = {"host": host, "ok": False, "failed_stage": None, "error": None,
+                  "timings": {}, "bytes": 0}
+        ctx = {}
+        started = time.monotonic()
+        for stage in STAGES:
+            self._emit(host, stage, "start")
+            t = time.monotonic()
+            try:
+                getattr(self, "_" + stage)(host, ctx)
+            except Exception as e:
+                result["timings"][stage] = time.monotonic() - t
+                result.update(failed_stage=stage, error=str(e))
+                self._emit(host, stage, "failed", error=str(e))
+                break
+            result["timings"][stage] = time.monotonic() - t
+            self._emit(host, stage, "done", seconds=result["timings"][stage])
+        else:
+            result["ok"] = True
+        if "helper" in ctx:
+            ctx["helper"].close()
+        # From mktemp on the host holds our files, whatever happened next
+        if "remote_dir" in ctx:
+            result["cleaned_up"] = self._cleanup(host, ctx)
+        result["bytes"] = ctx.get("bytes", 0)
+        result["seconds"] = time.monotonic() - started
+        return result
+
+    def run(self):
+        """Install on every host; return the per-host results and totals."""
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.parallel) as pool:
+            results = list(pool.map(self.install_host, self.hosts))
+        return {
+            "package": os.path.basename(self.package),
+            "parallel": self.parallel,
+            "hosts": results,
+            "succeeded": sum(1 for r in results if r["ok"]),
+            "failed": sum(1 for r in results if not r["ok"]),
+            "seconds": time.monotonic() - started,
+        }
@@ -0,0 +1,205 @@
+"""Install history: one SQLite row per install, build or removal.
+
+Every run records its edition, version, the fingerprint of its input file,
+the priority profile it ran at (see ``priority``), how long each stage
+took, the outcome, the diagnosis of a failure and where its log was
+archived (see ``logarchive``). Queries such as "median build time of the
+last installs on this machine" feed the progress ETA.
+"""
+import os
+import sqlite3
+import statistics
+import time
+from contextlib import closing
+
+from davinci_installer import config, runfile
+
+SCHEMA_VERSION = 1
+# How many recent successful runs a median is taken over
+MEDIAN_WINDOW = 10
+
+RUNNING = "running"
+SUCCESS = "success"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id          INTEGER PRIMARY KEY,
+    kind        TEXT NOT NULL,
+    edition     TEXT,
+    version     TEXT,
+    fingerprint TEXT,
+    priority    TEXT,
+    started     REAL NOT NULL,
+    seconds     REAL,
+    outcome     TEXT NOT NULL,
+    diagnosis   TEXT,
+    error       TEXT,
+    log         TEXT
+);
+CREATE TABLE IF NOT EXISTS stages (
+    run_id  INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    stage   TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (run_id, stage)
+);
+CREATE INDEX IF NOT EXISTS runs_lookup ON runs(kind, outcome, edition, started);
+"""
+
+
+def db_path():
+    return os.path.join(config.state_dir(), "history.sqlite")
+
+
+def connect(path=None):
+    path = path or db_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    db = sqlite3.connect(path, timeout=5)
+    db.row_factory = sqlite3.Row
+    db.execute("PRAGMA foreign_keys = ON")
+    version = db.execute("PRAGMA user_version").fetchone()[0]
+    if version < SCHEMA_VERSION:
+        # WAL lets the UI read while an install thread writes
+        db.execute("PRAGMA journal_mode = WAL")
+        db.executescript(_SCHEMA)
+        db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return db
+
+
+def edition(is_studio):
+    return "studio" if is_studio else "free"
+
+
+def input_fingerprint(path):
+    """The installer's SHA-256 if it was hashed already, else its size and mtime."""
+    try:
+        digest = runfile.cached_fingerprint(path)
+        if digest:
+            return digest
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"stat:{st.st_size}:{st.st_mtime_ns}"
+
+
+# ── Recording ───────────────────────────────────────────────────────
+
+def start_run(kind, edition=None, version=None, fingerprint=None, started=None, priority=None,
+              path=None):
+    """Insert a run in the ``running`` state; return its id."""
+    with closing(connect(path)) as db, db:
+        cur = db.execute(
+            "INSERT INTO runs (kind, edition, version, fingerprint, priority, started, outcome)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (kind, edition, version, fingerprint, priority, started or time.time(), RUNNING),
+        )
+        return cur.lastrowid
+
+
+def finish_run(run_id, outcome, seconds, stages=None, diagnosis=None, error=None, log=None,
+               path=None, version=None):
+    """Store the outcome of a run and the seconds each of its ``stages`` took.
+
+    ``version``, once known, replaces the one the run was started with.
+    """
+    with closing(connect(path)) as db, db:
+        db.execute(
+            "UPDATE runs SET outcome = ?, seconds = ?, diagnosis = ?, error = ?, log = ?,"
+            " version = COALESCE(?, version) WHERE id = ?",
+            (outcome, seconds, diagnosis, error, log, version, run_id),
+        )
+        db.executemany(
+            "INSERT OR REPLACE INTO stages (run_id, stage, seconds) VALUES (?, ?, ?)",
+            [(run_id, stage, secs) for stage, secs in (stages or {}).items()],
+        )
+
+
+# ── Queries ─────────────────────────────────────────────────────────
+
+def _recent_successes(kind, edition, priority=None):
+    query = "SELECT id FROM runs WHERE kind = ? AND outcome = ?"
+    params = [kind, SUCCESS]
+    if edition:
+        query += " AND edition = ?"
+        params.append(edition)
+    if priority:
+        # Runs from before profiles existed ran in the foreground
+        query += " AND COALESCE(priority, 'foreground') = ?"
+        params.append(priority)
+    query += " ORDER BY started DESC LIMIT ?"
+    params.append(MEDIAN_WINDOW)
+    return query, params
+
+
+def stage_medians(kind="install", edition=None, priority=None, path=None):
+    """Median seconds per stage over the last successful runs: {stage: seconds}."""
+    ids, params = _recent_successes(kind, edition, priority)
+    with closing(connect(path)) as db:
+        rows = db.execute(
+            f"SELECT stage, seconds FROM stages WHERE run_id IN ({ids})", params
+        ).fetchall()
+    samples = {}
+    for row in rows:
+        samples.setdefault(row["stage"], []).append(row["seconds"])
+    return {stage: statistics.median(values) for stage, values in samples.items()}
+
+
+def median_seconds(kind="install", edition=None, stage=None, priority=None, path=None):
+    """Median duration of a whole run, or of one ``stage``; None without data."""
+    if stage:
+        return stage_medians(kind, edition, priority, path).get(stage)
+    ids, params = _recent_successes(kind, edition, priority)
+    with closing(connect(path)) as db:
+        values = [r[0] for r in db.execute(f"SELECT seconds FROM runs WHERE id IN ({ids})", params)]
+    return statistics.median(values) if values else None
+
+
+def get_run(run_id, path=None):
+    with closing(connect(path)) as db:
+        row = db.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+    return dict(row) if row else None
+
+
+def recent(limit=20, kind=None, path=None):
+    """The latest runs, newest first, each with its ``stages`` dict."""
+    query = "SELECT * FROM runs"
+    params = []
+    if kind:
+        query += " WHERE kind = ?"
+        params.append(kind)
+    query += " ORDER BY started DESC LIMIT ?"
+    params.append(limit)
+    with closing(connect(path)) as db:
+        runs = [dict(r) for r in db.execute(query, params)]
+        for run in runs:
+            run["stages"] = {
+                r["stage"]: r["seconds"]
+                for r in db.execute(
+                    "SELECT stage, seconds FROM stages WHERE run_id = ? ORDER BY rowid", (run["id"],)
+                )
+            }
+    return runs
+
+
+def estimate_remaining(medians, stages, current, elapsed):
+    """Seconds left when ``current`` has run for ``elapsed``; None if unknown.
+
+    ``stages`` is the ordered list of the pipeline's stages.
+    """
+    if current not in stages or current not in medians:
+        return None
+    later = stages[stages.index(current) + 1:]
+    if any(s not in medians for s in later):
+        return None
+    return max(medians[current] - elapsed, 0) + sum(medians[s] for s in later)
+
+
+def format_duration(seconds):
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds} s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes} min {seconds:02d} s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours} h {minutes:02d} min"
@@ -0,0 +1,217 @@
+"""Keep installs from running into each other and into pacman.
+
+``InstallLock`` is a first-come, first-served queue shared by every widget
+and command-line process of the user. A waiter takes a numbered ticket in
+the runtime directory and holds an ``flock`` on it for as long as it waits
+and runs; the lowest ticket still held owns the lock, and a ticket nobody
+holds any more was left by a process that went away.
+
+``wait_for_pacman`` holds a step back while another package manager has
+the pacman database locked, polling with exponential backoff. A lock file
+that stays with no package manager running was left by one that died; it
+is reported as such instead of waited on forever.
+"""
+import fcntl
+import json
+import os
+import time
+
+from davinci_installer import config, diagnose
+
+try:
+    _
+except NameError:
+    from gettext import gettext as _
+
+DB_LOCK = "/var/lib/pacman/db.lck"
+BACKOFF_START = 1.0
+BACKOFF_MAX = 15.0
+# Times a step that found the database locked is tried again
+LOCKED_RETRIES = 3
+QUEUE_POLL = 1.0
+# Processes that take the database lock, by /proc/<pid>/comm
+PACKAGE_MANAGERS = frozenset({"pacman", "paru", "yay", "makepkg", "pamac-daemon"})
+# Seconds the lock may sit there with none of them running before it counts as stale
+STALE_AFTER = 5.0
+
+
+class StaleLockError(RuntimeError):
+    """pacman's lock file is there, but no package manager is running."""
+
+    def __init__(self, db_lock=DB_LOCK):
+        self.db_lock = db_lock
+        # What pacman itself would print, so it reads as the db-locked diagnosis
+        self.text = (
+            "error: failed to init transaction (unable to lock database)\n"
+            f"error: {db_lock} exists but no package manager is running\n"
+        )
+        super().__init__(diagnose.failure_message(self.text))
+
+
+def runtime_dir():
+    path = os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{os.getuid()}"
+    return path if os.path.isdir(path) else config.state_dir()
+
+
+def queue_dir():
+    return os.path.join(runtime_dir(), "davinci-installer")
+
+
+def pacman_busy(db_lock=DB_LOCK):
+    return os.path.exists(db_lock)
+
+
+def package_manager_running(proc="/proc"):
+    """True if a process that takes pacman's lock is running, or if that can't be told."""
+    # With hidepid, other users' processes (root's pacman) are not listed
+    if not os.path.isdir(os.path.join(proc, "1")):
+        return True
+    try:
+        pids = [name for name in os.listdir(proc) if name.isdigit()]
+    except OSError:
+        return True
+    for pid in pids:
+        try:
+            with open(os.path.join(proc, pid, "comm")) as f:
+                if f.read().strip() in PACKAGE_MANAGERS:
+                    return True
+        except OSError:
+            continue
+    return False
+
+
+def wait_for_pacman(on_wait=None, db_lock=DB_LOCK, sleep=time.sleep, running=package_manager_running):
+    """Block while pacman's database is locked; return the seconds waited.
+
+    ``on_wait(seconds)`` is called before every pause with the time waited so far.
+    Raises ``StaleLockError`` once the lock has outlived every package manager
+    for ``STALE_AFTER`` seconds.
+    """
+    delay = BACKOFF_START
+    waited = 0.0
+    unheld_since = None
+    while pacman_busy(db_lock):
+        if running():
+            unheld_since = None
+        elif unheld_since is None:
+            unheld_since = waited
+        elif waited - unheld_since >= STALE_AFTER:
+            raise StaleLockError(db_lock)
+        if on_wait:
+            on_wait(waited)
+        sleep(delay)
+        waited += delay
+        delay = min(delay * 2, BACKOFF_MAX)
+    return waited
+
+
+def waiting_message(ahead):
+    """Status line for ``InstallLock.acquire``'s ``on_wait``."""
+    label = ahead[0].get("label") or _("another install")
+    return _("Waiting for {} to finish ({} in the queue before this one)...").format(label, len(ahead))
+
+
+class InstallLock:
+    """One install at a time, in the order they asked."""
+
+    def __init__(self, label="", directory=None):
+        self.label = label
+        self.directory = directory or queue_dir()
+        self._fd = None
+        self._ticket = None
+
+    def _sequence(self):
+        # Held while a ticket is taken, dropped or checked, so a new ticket
+        # is never seen before its owner has locked it
+        fd = os.open(os.path.join(self.directory, "sequence"), os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return fd
+
+    def _take_ticket(self):
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        seq = self._sequence()
+        try:
+            number = int(os.pread(seq, 32, 0) or b"0") + 1
+            os.ftruncate(seq, 0)
+            os.pwrite(seq, str(number).encode(), 0)
+            self._ticket = os.path.join(self.directory, f"{number:012d}.ticket")
+            self._fd = os.open(self._ticket, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            info = {"pid": os.getpid(), "label": self.label, "since": time.time()}
+            os.write(self._fd, json.dumps(info).encode())
+        finally:
+            os.close(seq)
+
+    def ahead(self):
+        """Holders of the tickets before ours, oldest first: [{"pid", "label", "since"}]."""
+        mine = os.path.basename(self._ticket)
+        found = []
+        seq = self._sequence()
+        try:
+            for name in sorted(os.listdir(self.directory)):
+                if not name.endswith(".ticket") or name >= mine:
+                    continue
+                path = os.path.join(self.directory, name)
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                except FileNotFoundError:
+                    continue
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    try:
+                        found.append(json.loads(os.pread(fd, 4096, 0) or b"{}"))
+                    except ValueError:
+                        found.append({})
+                else:
+                    # Nobody holds it: its process is gone
+                    os.unlink(path)
+                finally:
+                    os.close(fd)
+        finally:
+            os.close(seq)
+        return found
+
+    def acquire(self, on_wait=None, poll=QUEUE_POLL):
+        """Queue up and block until every earlier ticket is released.
+
+        ``on_wait(ahead)`` is called with the list from ``ahead`` while waiting.
+        Returns True if it had to wait.
+        """
+        self._take_ticket()
+        waited = False
+        try:
+            while True:
+                ahead = self.ahead()
+                if not ahead:
+                    return waited
+                waited = True
+                if on_wait:
+                    on_wait(ahead)
+                time.sleep(poll)
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self):
+        if self._fd is None:
+            return
+        seq = self._sequence()
+        try:
+            try:
+                os.unlink(self._ticket)
+            except FileNotFoundError:
+                pass
+            os.close(self._fd)
+        finally:
+            os.close(seq)
+        self._fd = None
+        self._ticket = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+        return False
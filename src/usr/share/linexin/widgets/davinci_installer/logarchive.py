@@ -0,0 +1,333 @@
+"""Compressed run logs with random access by line.
+
+A log is a series of independent gzip members of about ``CHUNK_BYTES`` of
+text each, ending on line boundaries, so the file is still a plain
+``.log.gz`` that ``zless`` can read. Next to it a small index records
+every member's offset, compressed length and line count. Reading lines
+10 000-10 050 then means decompressing one member, not the whole log, and
+a log being written can be read the same way while it grows.
+"""
+import bisect
+import glob
+import gzip
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+
+from davinci_installer import config
+
+CHUNK_BYTES = 256 * 1024
+# Decompressed chunks kept per reader
+CACHE_CHUNKS = 4
+DEFAULT_RETENTION_MB = 256
+
+INDEX_MAGIC = b"DVLOGIX1"
+_ENTRY = struct.Struct("<QII")  # offset, compressed length, line count
+
+
+def logs_dir():
+    return os.path.join(config.state_dir(), "logs")
+
+
+def log_path(name):
+    return os.path.join(logs_dir(), f"{name}.log.gz")
+
+
+def index_path(path):
+    return path + ".idx"
+
+
+def _split(text):
+    # Not splitlines(): progress bars redraw with \r inside one line
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+class _ChunkedLog:
+    """Line access shared by readers and live writers."""
+
+    def __init__(self):
+        self._offsets = []      # compressed offset of every chunk
+        self._lengths = []      # compressed length of every chunk
+        self._first_lines = []  # line number each chunk starts with
+        self._total_lines = 0
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _add_chunk(self, offset, length, lines):
+        self._offsets.append(offset)
+        self._lengths.append(length)
+        self._first_lines.append(self._total_lines)
+        self._total_lines += lines
+
+    def _read_compressed(self, offset, length):
+        raise NotImplementedError
+
+    def _tail_lines(self):
+        """Lines not yet in a chunk (only a live writer has any)."""
+        return []
+
+    def _chunk_lines(self, index):
+        with self._cache_lock:
+            lines = self._cache.get(index)
+            if lines is not None:
+                self._cache.move_to_end(index)
+                return lines
+        data = self._read_compressed(self._offsets[index], self._lengths[index])
+        lines = _split(gzip.decompress(data).decode("utf-8", "replace"))
+        with self._cache_lock:
+            self._cache[index] = lines
+            while len(self._cache) > CACHE_CHUNKS:
+                self._cache.popitem(last=False)
+        return lines
+
+    def _snapshot(self):
+        """(first line of every chunk, lines in chunks, lines after them) as of now.
+
+        Published chunks never change, so they can be read from the
+        snapshot while more output is written.
+        """
+        return list(self._first_lines), self._total_lines, self._tail_lines()
+
+    def line_count(self):
+        return self._total_lines + len(self._tail_lines())
+
+    def chunk_count(self):
+        return len(self._offsets)
+
+    def lines(self, start, count):
+        """Up to ``count`` lines from line number ``start`` on."""
+        first_lines, sealed, tail = self._snapshot()
+        result = []
+        end = min(start + count, sealed + len(tail))
+        while start < end:
+            if start >= sealed:
+                result.extend(tail[start - sealed:end - sealed])
+                break
+            index = bisect.bisect_right(first_lines, start) - 1
+            first = first_lines[index]
+            chunk = self._chunk_lines(index)
+            taken = chunk[start - first:end - first]
+            result.extend(taken)
+            start += len(taken)
+        return result
+
+    def line(self, number):
+        found = self.lines(number, 1)
+        return found[0] if found else ""
+
+    def text(self):
+        """The whole log as one string."""
+        lines = self.lines(0, self.line_count())
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def find(self, text, start=0, backwards=False):
+        """Number of the next line containing ``text`` (case-insensitive), or None.
+
+        Chunks are decompressed one at a time, so a search through the
+        whole log only ever holds one chunk in memory.
+        """
+        needle = text.lower()
+        first_lines, sealed, tail = self._snapshot()
+        total = sealed + len(tail)
+        if not needle or not total:
+            return None
+        number = max(0, min(start, total - 1))
+        while 0 <= number < total:
+            if number >= sealed:
+                block_start = sealed
+                block = tail
+            else:
+                index = bisect.bisect_right(first_lines, number) - 1
+                block_start = first_lines[index]
+                block = self._chunk_lines(index)
+            positions = range(number - block_start, -1, -1) if backwards \
+                else range(number - block_start, len(block))
+            for i in positions:
+                if needle in block[i].lower():
+                    return block_start + i
+            number = block_start - 1 if backwards else block_start + len(block)
+        return None
+
+
+class LogWriter(_ChunkedLog):
+    """Appends output to a chunked log; safe to read from another thread."""
+
+    def __init__(self, path, chunk_bytes=CHUNK_BYTES):
+        super().__init__()
+        self.path = path
+        self.chunk_bytes = chunk_bytes
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._file = open(path, "w+b")
+        self._index = open(index_path(path), "wb")
+        self._index.write(INDEX_MAGIC)
+        # Reentrant: reads take it around _tail_lines(), which takes it too
+        self._lock = threading.RLock()
+        self._partial = ""
+        self._pending = []
+        self._pending_bytes = 0
+        self._size = 0
+        self.closed = False
+
+    def _read_compressed(self, offset, length):
+        return os.pread(self._file.fileno(), length, offset)
+
+    def _tail_lines(self):
+        with self._lock:
+            return self._pending + ([self._partial] if self._partial else [])
+
+    # Readers on other threads must not see a chunk half published; the
+    # chunks themselves are read after the lock is dropped
+    def _snapshot(self):
+        with self._lock:
+            return super()._snapshot()
+
+    def line_count(self):
+        with self._lock:
+            return super().line_count()
+
+    def write(self, text):
+        with self._lock:
+            data = self._partial + text
+            lines = data.split("\n")
+            self._partial = lines.pop()
+            self._pending.extend(lines)
+            self._pending_bytes += len(data) - len(self._partial)
+            if self._pending_bytes >= self.chunk_bytes:
+                self._flush_chunk()
+
+    def _flush_chunk(self):
+        if not self._pending:
+            return
+        data = gzip.compress(("\n".join(self._pending) + "\n").encode("utf-8"), compresslevel=6)
+        offset = self._size
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+        self._index.write(_ENTRY.pack(offset, len(data), len(self._pending)))
+        self._index.flush()
+        # Publish the chunk before dropping the lines it holds
+        self._add_chunk(offset, len(data), len(self._pending))
+        self._pending = []
+        self._pending_bytes = 0
+
+    def close(self):
+        with self._lock:
+            if self.closed:
+                return
+            if self._partial:
+                self._pending.append(self._partial)
+                self._partial = ""
+            self._flush_chunk()
+            self._file.close()
+            self._index.close()
+            # Stay readable, e.g. for a log view still showing this run
+            self._file = open(self.path, "rb")
+            self.closed = True
+
+    def compressed_size(self):
+        return self._size
+
+
+class LogReader(_ChunkedLog):
+    """Random access to a finished (or interrupted) log."""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self._file = open(path, "rb")
+        if not self._load_index():
+            self._rebuild_index()
+
+    def _read_compressed(self, offset, length):
+        return os.pread(self._file.fileno(), length, offset)
+
+    def _load_index(self):
+        try:
+            with open(index_path(self.path), "rb") as f:
+                data = f.read()
+        except OSError:
+            return False
+        if not data.startswith(INDEX_MAGIC):
+            return False
+        size = os.fstat(self._file.fileno()).st_size
+        body = data[len(INDEX_MAGIC):]
+        usable = len(body) - len(body) % _ENTRY.size
+        for offset, length, lines in _ENTRY.iter_unpack(body[:usable]):
+            if offset + length > size:
+                break
+            self._add_chunk(offset, length, lines)
+        return True
+
+    def _rebuild_index(self):
+        """Find member boundaries of a log written without an index."""
+        self._file.seek(0)
+        data = self._file.read()
+        offset = 0
+        while offset < len(data):
+            d = zlib.decompressobj(wbits=31)
+            text = d.decompress(data[offset:])
+            if not d.eof:
+                break
+            length = len(data) - offset - len(d.unused_data)
+            self._add_chunk(offset, length, len(_split(text.decode("utf-8", "replace"))))
+            offset += length
+
+    def close(self):
+        self._file.close()
+
+
+def write_text(path, text):
+    """Archive a complete log in one go; return ``path``."""
+    writer = LogWriter(path)
+    try:
+        writer.write(text)
+    finally:
+        writer.close()
+    return path
+
+
+def archived_logs():
+    """Every archived log, oldest first."""
+    found = []
+    for path in glob.glob(os.path.join(logs_dir(), "*.log.gz")):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        size = st.st_size
+        try:
+            size += os.path.getsize(index_path(path))
+        except OSError:
+            pass
+        found.append((st.st_mtime, path, size))
+    found.sort()
+    return [{"path": p, "size": s} for _mtime, p, s in found]
+
+
+def prune(max_bytes, keep=()):
+    """Delete the oldest logs until all of them fit in ``max_bytes``; return the deleted paths."""
+    logs = archived_logs()
+    total = sum(entry["size"] for entry in logs)
+    removed = []
+    for entry in logs:
+        if total <= max_bytes:
+            break
+        if entry["path"] in keep:
+            continue
+        for path in (entry["path"], index_path(entry["path"])):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        total -= entry["size"]
+        removed.append(entry["path"])
+    return removed
+
+
+def retention_bytes(settings):
+    return int(settings.get("log_retention_mb", DEFAULT_RETENTION_MB)) * 1024 * 1024
@@ -0,0 +1,44 @@
+"""Batched delivery of command output from worker threads to the main loop."""
+import threading
+
+
+class LogChannel:
+    """Collects lines pushed from any thread and delivers them in batches.
+
+    ``schedule`` is called with a flush callback at most once per pending
+    batch (the widget passes a ``GLib.timeout_add`` wrapper), so a command
+    printing thousands of lines costs a handful of main-loop wakeups
+    instead of one per line.
+    """
+
+    def __init__(self, schedule):
+        self._schedule = schedule
+        self._lock = threading.Lock()
+        self._pending = []
+        self._scheduled = False
+        self._listeners = []
+
+    def connect(self, callback):
+        self._listeners.append(callback)
+        return callback
+
+    def disconnect(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def push(self, line):
+        with self._lock:
+            self._pending.append(line)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._schedule(self.flush)
+
+    def flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._scheduled = False
+        if batch:
+            for callback in list(self._listeners):
+                callback(batch)
+        return False
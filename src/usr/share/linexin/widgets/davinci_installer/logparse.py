@@ -0,0 +1,116 @@
+"""Streaming parser turning paru/pacman/makepkg output into typed events.
+
+Lines are fed one at a time; each call returns the events the line
+completed. Events are dicts with a ``type`` key:
+
+- ``sync``       repository database refresh (``repo``)
+- ``download``   package download (``package``, optional ``percent``)
+- ``making``     makepkg started building (``package``, ``version``)
+- ``built``      makepkg finished building (``package``, ``version``)
+- ``installed``  pacman installed/upgraded/reinstalled (``package``,
+                 ``action``, optional ``index``/``total``)
+- ``conflict``   package or file conflict (``package``, ``other`` or ``path``)
+- ``warning``    ``message``
+- ``error``      ``message`` and ``context``, the lines leading up to it
+"""
+import re
+from collections import deque
+
+SYNC = "sync"
+DOWNLOAD = "download"
+MAKING = "making"
+BUILT = "built"
+INSTALLED = "installed"
+CONFLICT = "conflict"
+WARNING = "warning"
+ERROR = "error"
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+# Order matters: the first matching rule wins
+_RULES = (
+    (MAKING, re.compile(r"^==> Making package:\s+(?P<package>\S+)\s+(?P<version>\S+)")),
+    (BUILT, re.compile(r"^==> Finished making:\s+(?P<package>\S+)\s+(?P<version>\S+)")),
+    (ERROR, re.compile(r"^(?:==> ERROR|error):\s*(?P<message>.*)$")),
+    (WARNING, re.compile(r"^(?:==> WARNING|warning):\s*(?P<message>.*)$")),
+    (CONFLICT, re.compile(
+        r"^(?P<package>[\w@.+-]+): (?P<path>/\S.*) exists in filesystem(?: \(owned by (?P<other>\S+)\))?$"
+    )),
+    (CONFLICT, re.compile(
+        r"^:: (?P<package>[\w@.+-]+?)(?:-[^\s-]+-[^\s-]+)? and (?P<other>[\w@.+-]+?)(?:-[^\s-]+-[^\s-]+)? are in conflict"
+    )),
+    (INSTALLED, re.compile(
+        r"^(?:\((?P<index>\d+)/(?P<total>\d+)\)\s+)?"
+        r"(?P<action>installing|upgrading|reinstalling|downgrading)\s+(?P<package>[\w@.+-]+?)(?:\.\.\.|\s|$)"
+    )),
+    (DOWNLOAD, re.compile(
+        r"^\s*(?P<package>[\w@.+-]+?)(?:-(?P<version>[^\s-]+-[^\s-]+)-(?:x86_64|any))?"
+        r"(?:\s+downloading\.\.\.$|\s+[\d.]+\s+[KMG]?i?B\s.*?(?P<percent>\d+)%\s*$)"
+    )),
+    (SYNC, re.compile(r"^\s*(?P<repo>[\w-]+)\s+(?:downloading\.\.\.|is up to date)$")),
+)
+
+
+_SEVERITY = {ERROR: ERROR, CONFLICT: ERROR, WARNING: WARNING}
+
+
+def clean(line):
+    """A line as a terminal would end up showing it: no colours, last redraw only."""
+    return _ANSI_RE.sub("", line).rstrip("\r\n").rsplit("\r", 1)[-1]
+
+
+def severity(line):
+    """ERROR, WARNING or None for one cleaned line, by the same rules as the parser."""
+    for kind, rx in _RULES:
+        if kind in _SEVERITY and rx.match(line):
+            return _SEVERITY[kind]
+    return None
+
+
+class LogParser:
+
+    def __init__(self, context=8):
+        self._recent = deque(maxlen=context)
+        self._sync = False
+
+    def feed(self, line):
+        """Parse one output line; return the (possibly empty) list of events."""
+        # Progress bars redraw with \r; only the final state matters
+        text = clean(line)
+        events = []
+        stripped = text.strip()
+        if stripped.startswith(":: Synchronizing package databases"):
+            self._sync = True
+        elif stripped.startswith("::"):
+            self._sync = False
+        for kind, rx in _RULES:
+            if kind == SYNC and not self._sync:
+                continue
+            if kind == DOWNLOAD and self._sync:
+                continue
+            m = rx.match(text)
+            if not m:
+                continue
+            event = {"type": kind}
+            event.update({k: v for k, v in m.groupdict().items() if v is not None})
+            for key in ("index", "total", "percent"):
+                if key in event:
+                    event[key] = int(event[key])
+            if kind == ERROR:
+                event["context"] = list(self._recent)
+            events.append(event)
+            break
+        if stripped:
+            self._recent.append(text)
+        return events
+
+    def feed_lines(self, lines):
+        events = []
+        for line in lines:
+            events.extend(self.feed(line))
+        return events
+
+
+def parse(text):
+    """Parse a whole transcript."""
+    return LogParser().feed_lines(text.splitlines())
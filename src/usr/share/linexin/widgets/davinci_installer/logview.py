@@ -0,0 +1,249 @@
+"""A log view that stays fast however long the log gets.
+
+``LogView`` shows a ``logarchive`` log (a live ``LogWriter`` or a finished
+``LogReader``) in a ``Gtk.ListView``. The list model only knows the line
+count; a row's text is fetched from the archive when the row is realised,
+so memory and redraw cost depend on the visible rows, not the log length.
+"""
+import threading
+
+from gi.repository import Gio, GLib, GObject, Gtk, Pango
+
+from davinci_installer import logparse
+
+try:
+    _
+except NameError:
+    from gettext import gettext as _
+
+CSS = """
+.log-view row {
+    padding: 0 8px;
+    min-height: 0;
+}
+.log-view .log-error {
+    color: @error_color;
+}
+.log-view .log-warning {
+    color: @warning_color;
+}
+"""
+
+_SEVERITY_CLASSES = {logparse.ERROR: "log-error", logparse.WARNING: "log-warning"}
+
+
+class LogLine(GObject.Object):
+
+    def __init__(self, number, text):
+        super().__init__()
+        self.number = number
+        self.text = text
+
+
+class LogLineModel(GObject.Object, Gio.ListModel):
+    """One item per log line, created on demand from the archive."""
+
+    def __init__(self):
+        super().__init__()
+        self.source = None
+        self._count = 0
+
+    def do_get_item_type(self):
+        return LogLine.__gtype__
+
+    def do_get_n_items(self):
+        return self._count
+
+    def do_get_item(self, position):
+        if position >= self._count:
+            return None
+        return LogLine(position, self.source.line(position))
+
+    def set_source(self, source):
+        removed = self._count
+        self.source = source
+        self._count = source.line_count() if source else 0
+        self.items_changed(0, removed, self._count)
+
+    def refresh(self):
+        """Announce lines appended since the last call; return how many."""
+        if not self.source:
+            return 0
+        count = self.source.line_count()
+        added = count - self._count
+        if added > 0:
+            old = self._count
+            self._count = count
+            if old:
+                # The old last line may have been incomplete; bind it again
+                self.items_changed(old - 1, 1, added + 1)
+            else:
+                self.items_changed(0, 0, added)
+        return max(added, 0)
+
+
+class LogView(Gtk.Box):
+    """Search bar, follow-tail toggle and the virtualised line list."""
+
+    def __init__(self):
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        self.add_css_class("log-view")
+        self._search_serial = 0
+
+        bar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        self.search_entry = Gtk.SearchEntry()
+        self.search_entry.set_hexpand(True)
+        self.search_entry.set_placeholder_text(_("Search the log"))
+        self.search_entry.connect("search-changed", self._on_search_changed)
+        self.search_entry.connect("activate", lambda _e: self.search(backwards=False))
+        self.search_entry.connect("next-match", lambda _e: self.search(backwards=False))
+        self.search_entry.connect("previous-match", lambda _e: self.search(backwards=True))
+        bar.append(self.search_entry)
+
+        for icon, tooltip, backwards in (
+            ("go-up-symbolic", _("Previous match"), True),
+            ("go-down-symbolic", _("Next match"), False),
+        ):
+            btn = Gtk.Button.new_from_icon_name(icon)
+            btn.set_tooltip_text(tooltip)
+            btn.connect("clicked", lambda _b, back=backwards: self.search(backwards=back))
+            bar.append(btn)
+
+        self.follow_button = Gtk.ToggleButton()
+        self.follow_button.set_icon_name("go-bottom-symbolic")
+        self.follow_button.set_tooltip_text(_("Follow new output"))
+        self.follow_button.set_active(True)
+        self.follow_button.connect("toggled", self._on_follow_toggled)
+        bar.append(self.follow_button)
+        self.append(bar)
+
+        self.model = LogLineModel()
+        self.selection = Gtk.SingleSelection(model=self.model)
+        self.selection.set_autoselect(False)
+        self.selection.set_can_unselect(True)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_setup_row)
+        factory.connect("bind", self._on_bind_row)
+        self.list_view = Gtk.ListView(model=self.selection, factory=factory)
+        self.list_view.add_css_class("monospace")
+
+        self.scrolled = Gtk.ScrolledWindow()
+        self.scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        self.scrolled.set_vexpand(True)
+        self.scrolled.set_child(self.list_view)
+        # Scrolling up by hand stops following the tail
+        scroll = Gtk.EventControllerScroll.new(Gtk.EventControllerScrollFlags.VERTICAL)
+        scroll.connect("scroll", self._on_user_scroll)
+        self.scrolled.add_controller(scroll)
+
+        frame = Gtk.Frame()
+        frame.set_child(self.scrolled)
+        frame.set_vexpand(True)
+        self.append(frame)
+
+    # ── Source ──────────────────────────────────────────────────────
+
+    @property
+    def source(self):
+        return self.model.source
+
+    def set_source(self, source):
+        self._search_serial += 1
+        self.model.set_source(source)
+        if self.follow_button.get_active():
+            self.scroll_to_end()
+
+    def refresh(self):
+        """Pick up new lines of a live log; call after each output batch."""
+        if self.model.refresh() and self.follow_button.get_active():
+            self.scroll_to_end()
+
+    def set_follow(self, follow):
+        self.follow_button.set_active(follow)
+
+    # ── Rows ────────────────────────────────────────────────────────
+
+    def _on_setup_row(self, _factory, item):
+        label = Gtk.Label(xalign=0)
+        label.set_ellipsize(Pango.EllipsizeMode.END)
+        label.set_single_line_mode(True)
+        item.set_child(label)
+
+    def _on_bind_row(self, _factory, item):
+        label = item.get_child()
+        text = logparse.clean(item.get_item().text)
+        for css in _SEVERITY_CLASSES.values():
+            label.remove_css_class(css)
+        css = _SEVERITY_CLASSES.get(logparse.severity(text))
+        if css:
+            label.add_css_class(css)
+        label.set_text(text)
+        label.set_tooltip_text(text if len(text) > 120 else None)
+
+    # ── Scrolling ───────────────────────────────────────────────────
+
+    def _scroll_to(self, position, select=False):
+        if select:
+            self.selection.set_selected(position)
+        if hasattr(self.list_view, "scroll_to"):  # GTK 4.12
+            flags = Gtk.ListScrollFlags.SELECT if select else Gtk.ListScrollFlags.NONE
+            self.list_view.scroll_to(position, flags, None)
+        else:
+            adj = self.scrolled.get_vadjustment()
+            count = self.model.get_n_items()
+            if count:
+                span = adj.get_upper() - adj.get_page_size()
+                adj.set_value(span * position / max(count - 1, 1))
+
+    def scroll_to_end(self):
+        count = self.model.get_n_items()
+        if count:
+            self._scroll_to(count - 1)
+
+    def _on_follow_toggled(self, button):
+        if button.get_active():
+            self.scroll_to_end()
+
+    def _on_user_scroll(self, _controller, _dx, dy):
+        if dy < 0 and self.follow_button.get_active():
+            self.follow_button.set_active(False)
+        return False
+
+    # ── Search ──────────────────────────────────────────────────────
+
+    def _on_search_changed(self, entry):
+        self.search_entry.remove_css_class("error")
+        if entry.get_text():
+            self.search(backwards=False, from_start=True)
+
+    def search(self, backwards=False, from_start=False):
+        """Find the next (or previous) line with the search text off the UI thread."""
+        source = self.source
+        needle = self.search_entry.get_text()
+        if not source or not needle:
+            return
+        selected = self.selection.get_selected()
+        if from_start or selected == Gtk.INVALID_LIST_POSITION:
+            start = 0 if not backwards else self.model.get_n_items() - 1
+        else:
+            start = selected - 1 if backwards else selected + 1
+        self._search_serial += 1
+        serial = self._search_serial
+
+        def _find():
+            found = source.find(needle, start, backwards)
+            GLib.idle_add(self._on_found, serial, found)
+
+        threading.Thread(target=_find, daemon=True).start()
+
+    def _on_found(self, serial, found):
+        if serial != self._search_serial:
+            return False
+        if found is None:
+            self.search_entry.add_css_class("error")
+            return False
+        self.search_entry.remove_css_class("error")
+        self.follow_button.set_active(False)
+        self._scroll_to(found, select=True)
+        return False
@@ -0,0 +1,29 @@
+"""Per-build makepkg.conf overrides (compression profile)."""
+
+SYSTEM_CONF = "/etc/makepkg.conf"
+
+# profile -> (lines appended after the system config, expected size ratio of
+# the built package to the installed payload)
+PROFILES = {
+    "default": ((), 0.5),
+    "fast": (("PKGEXT='.pkg.tar.zst'", "COMPRESSZST=(zstd -c -T0 -1 -)"), 0.6),
+    "none": (("PKGEXT='.pkg.tar'",), 1.0),
+}
+
+
+def profile(name):
+    return name if name in PROFILES else "default"
+
+
+def package_ratio(name):
+    return PROFILES[profile(name)][1]
+
+
+def render(name, system_conf=SYSTEM_CONF):
+    """makepkg.conf text for ``name``, or None when the system config is used as is."""
+    overrides = PROFILES[profile(name)][0]
+    if not overrides:
+        return None
+    lines = [f"source {system_conf}"]
+    lines.extend(overrides)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,169 @@
+"""OpenCL ICD discovery and GPU readiness checks run before Resolve's first launch."""
+import ctypes
+import glob
+import os
+import time
+
+from davinci_installer import pkgdb
+
+try:
+    _
+except NameError:
+    from gettext import gettext as _
+
+VENDORS_DIR = "/etc/OpenCL/vendors"
+OPENCL_LOADER = "libOpenCL.so.1"
+
+# Library name fragment -> vendor, checked in order against the ICD's library path
+_LIBRARY_VENDORS = (
+    ("nvidia", "nvidia"),
+    ("amdocl", "amd"),
+    ("rocm", "amd"),
+    ("rusticl", "mesa"),
+    ("mesaopencl", "mesa"),
+    ("igdrcl", "intel"),
+    ("intelocl", "intel"),
+)
+
+PACKAGE_VENDORS = {
+    "opencl-amd": "amd",
+    "rocm-opencl-runtime": "amd",
+    "opencl-nvidia": "nvidia",
+    "opencl-mesa": "mesa",
+    "intel-compute-runtime": "intel",
+}
+
+CL_SUCCESS = 0
+CL_DEVICE_TYPE_ALL = 0xFFFFFFFF
+
+
+def vendor_for_library(library):
+    name = os.path.basename(library).lower()
+    for fragment, vendor in _LIBRARY_VENDORS:
+        if fragment in name or fragment in library.lower():
+            return vendor
+    return "unknown"
+
+
+def enumerate_icds(vendors_dir=VENDORS_DIR):
+    """Return one entry per ``*.icd`` file with the library it points at."""
+    icds = []
+    for path in sorted(glob.glob(os.path.join(vendors_dir, "*.icd"))):
+        try:
+            with open(path, "r", errors="replace") as f:
+                library = f.read().strip().splitlines()[0].strip()
+        except (OSError, IndexError):
+            library = ""
+        if os.path.isabs(library):
+            present = os.path.exists(library)
+        else:
+            # Bare sonames are resolved by the loader at runtime
+            present = None
+        icds.append({
+            "icd": path,
+            "library": library,
+            "vendor": vendor_for_library(library) if library else "unknown",
+            "present": present,
+        })
+    return icds
+
+
+def probe_platforms(loader=OPENCL_LOADER):
+    """Load the ICD loader and count platforms/devices.
+
+    Loading every vendor driver here pays Resolve's device-probe cost up
+    front. Returns None when no loader is available.
+    """
+    try:
+        cl = ctypes.CDLL(loader)
+    except OSError:
+        return None
+    num = ctypes.c_uint32(0)
+    if cl.clGetPlatformIDs(0, None, ctypes.byref(num)) != CL_SUCCESS or not num.value:
+        return {"platforms": 0, "devices": 0}
+    ids = (ctypes.c_void_p * num.value)()
+    cl.clGetPlatformIDs(num.value, ids, None)
+    devices = 0
+    for pid in ids:
+        count = ctypes.c_uint32(0)
+        rc = cl.clGetDeviceIDs(
+            ctypes.c_void_p(pid), ctypes.c_uint64(CL_DEVICE_TYPE_ALL),
+            0, None, ctypes.byref(count),
+        )
+        if rc == CL_SUCCESS:
+            devices += count.value
+    return {"platforms": num.value, "devices": devices}
+
+
+def check_readiness(expected, vendors_dir=VENDORS_DIR, is_installed=pkgdb.is_installed,
+                    probe=probe_platforms):
+    """Compare the detected OpenCL packages with what is actually set up.
+
+    ``expected`` is the package list from the GPU detection. Pass
+    ``probe=None`` to skip loading drivers (e.g. on machines without a GPU).
+    """
+    started = time.monotonic()
+    timings = {}
+    problems = []
+
+    t = time.monotonic()
+    packages = {pkg: bool(is_installed(pkg)) for pkg in expected}
+    timings["packages"] = time.monotonic() - t
+    for pkg, ok in packages.items():
+        if not ok:
+            problems.append(_("Package {} is not installed").format(pkg))
+
+    t = time.monotonic()
+    icds = enumerate_icds(vendors_dir)
+    timings["icds"] = time.monotonic() - t
+    vendors = {icd["vendor"] for icd in icds}
+    for pkg in expected:
+        vendor = PACKAGE_VENDORS.get(pkg)
+        if vendor and vendor not in vendors:
+            problems.append(
+                _("No OpenCL ICD for {} found in {}").format(pkg, vendors_dir)
+            )
+    for icd in icds:
+        if icd["present"] is False:
+            problems.append(
+                _("{} points at missing library {}").format(
+                    os.path.basename(icd["icd"]), icd["library"]
+                )
+            )
+
+    devices = None
+    if probe:
+        t = time.monotonic()
+        devices = probe()
+        timings["probe"] = time.monotonic() - t
+        if devices is not None and not devices["devices"]:
+            problems.append(_("The OpenCL loader reports no devices"))
+
+    timings["total"] = time.monotonic() - started
+    return {
+        "expected": list(expected),
+        "packages": packages,
+        "icds": icds,
+        "devices": devices,
+        "problems": problems,
+        "ready": not problems,
+        "timings": timings,
+    }
+
+
+def format_summary(report):
+    lines = []
+    for icd in report["icds"]:
+        lines.append("{}: {} ({})".format(
+            os.path.basename(icd["icd"]), icd["library"] or "?", icd["vendor"]
+        ))
+    if not report["icds"]:
+        lines.append(_("No OpenCL ICDs registered"))
+    devices = report["devices"]
+    if devices is not None:
+        lines.append(_("{} platform(s), {} device(s)").format(
+            devices["platforms"], devices["devices"]
+        ))
+    lines.extend("• " + p for p in report["problems"])
+    lines.append(_("Checked in {:.2f} s").format(report["timings"]["total"]))
+    return "\n".join(lines)
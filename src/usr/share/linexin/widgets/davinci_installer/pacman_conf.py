@@ -0,0 +1,120 @@
+"""Edit the IgnorePkg list of pacman.conf.
+
+Runs as a standalone script under the privileged session:
+
+    python3 pacman_conf.py add|remove PKG... [--config PATH]
+"""
+import os
+import re
+import sys
+import tempfile
+
+CONF_PATH = "/etc/pacman.conf"
+_IGNORE_RE = re.compile(r"^\s*#?\s*IgnorePkg\s*=")
+
+
+def _entries(line):
+    content = line.strip().lstrip("#").strip()
+    if "=" not in content:
+        return []
+    return content.split("=", 1)[1].strip().split()
+
+
+def ignored(lines):
+    """Entries of the active IgnorePkg lines."""
+    found = []
+    for line in lines:
+        if _IGNORE_RE.match(line) and not line.lstrip().startswith("#"):
+            found += [p for p in _entries(line) if p not in found]
+    return found
+
+
+def add_ignore(lines, packages):
+    new_lines = []
+    found = False
+    for line in lines:
+        if _IGNORE_RE.match(line):
+            found = True
+            existing = _entries(line)
+            for pkg in packages:
+                if pkg not in existing:
+                    existing.append(pkg)
+            new_lines.append(f"IgnorePkg = {' '.join(existing)}\n")
+        else:
+            new_lines.append(line)
+    if found:
+        return new_lines
+    final_lines = []
+    inserted = False
+    for line in new_lines:
+        final_lines.append(line)
+        if line.strip() == "[options]" and not inserted:
+            final_lines.append(f"IgnorePkg = {' '.join(packages)}\n")
+            inserted = True
+    if not inserted:
+        final_lines.append(f"IgnorePkg = {' '.join(packages)}\n")
+    return final_lines
+
+
+def remove_ignore(lines, packages):
+    new_lines = []
+    for line in lines:
+        if _IGNORE_RE.match(line) and not line.lstrip().startswith("#"):
+            kept = [p for p in _entries(line) if p not in packages]
+            if kept:
+                new_lines.append(f"IgnorePkg = {' '.join(kept)}\n")
+            else:
+                new_lines.append("#IgnorePkg   =\n")
+        else:
+            new_lines.append(line)
+    return new_lines
+
+
+def update(path, action, packages):
+    """Add or remove ``packages``; return the entries that were actually added or removed."""
+    with open(path, "r") as f:
+        lines = f.readlines()
+    if action == "add":
+        new_lines = add_ignore(lines, packages)
+    else:
+        new_lines = remove_ignore(lines, packages)
+    if new_lines == lines:
+        return []
+    before, after = ignored(lines), ignored(new_lines)
+    if action == "add":
+        changed = [p for p in after if p not in before]
+    else:
+        changed = [p for p in before if p not in after]
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".pacman.conf.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.writelines(new_lines)
+        st = os.stat(path)
+        os.chmod(tmp, st.st_mode & 0o7777)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return changed
+
+
+def main(argv):
+    args = list(argv)
+    path = CONF_PATH
+    if "--config" in args:
+        i = args.index("--config")
+        path = args[i + 1]
+        del args[i:i + 2]
+    if len(args) < 2 or args[0] not in ("add", "remove"):
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+    try:
+        update(path, args[0], args[1:])
+    except Exception as e:
+        print(f"Error updating pacman.conf: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
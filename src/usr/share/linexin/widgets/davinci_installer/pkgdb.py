@@ -0,0 +1,69 @@
+"""Read-only queries against the local pacman database."""
+import re
+import subprocess
+
+_SIZE_UNITS = {
+    "B": 1,
+    "KiB": 1024,
+    "MiB": 1024 ** 2,
+    "GiB": 1024 ** 3,
+    "TiB": 1024 ** 4,
+}
+
+
+def is_installed(pkg):
+    r = subprocess.run(
+        ["pacman", "-Qq", pkg],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    return r.returncode == 0
+
+
+def missing(packages):
+    """The ones of ``packages`` (names or dependency specs) not satisfied locally."""
+    if not packages:
+        return []
+    r = subprocess.run(
+        ["pacman", "-T", *packages],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    return r.stdout.split()
+
+
+def parse_size(text):
+    """Convert pacman's ``6.12 GiB`` notation to bytes."""
+    m = re.match(r"\s*([\d.,]+)\s*([KMGT]?i?B)", text)
+    if not m:
+        return None
+    value = float(m.group(1).replace(",", "."))
+    return int(value * _SIZE_UNITS.get(m.group(2), 1))
+
+
+def query_info(pkg):
+    r = subprocess.run(
+        ["pacman", "-Qi", pkg],
+        capture_output=True, text=True,
+        env={"LC_ALL": "C", "PATH": "/usr/bin:/bin"},
+    )
+    if r.returncode != 0:
+        return {}
+    info = {}
+    for line in r.stdout.splitlines():
+        key, sep, value = line.partition(":")
+        if sep and not key.startswith(" "):
+            info[key.strip()] = value.strip()
+    return info
+
+
+def installed_size(pkg):
+    size = query_info(pkg).get("Installed Size")
+    return parse_size(size) if size else None
+
+
+def format_size(num_bytes):
+    value = float(num_bytes)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(value) < 1024 or unit == "GiB":
+            break
+        value /= 1024
+    return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
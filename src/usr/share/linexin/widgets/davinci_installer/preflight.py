@@ -0,0 +1,113 @@
+"""Disk-space preflight: per-mount peak requirements of an install.
+
+Every stage of a build keeps its output around until the package is
+installed, so the peak is the sum of all stages that land on a mount.
+Filesystem access goes through ``stat``/``statvfs`` arguments so the
+planner can be driven with fake filesystems.
+"""
+import os
+
+from davinci_installer import makepkg_conf, pkgdb
+
+try:
+    _
+except NameError:
+    from gettext import gettext as _
+
+# Installed payload vs. compressed squashfs image
+PAYLOAD_RATIO = 2.1
+# Head-room for logs, pacman's own temporaries and estimation error
+MARGIN = 1.05
+OPT_DIR = "/opt"
+
+
+def existing_ancestor(path, stat=os.stat):
+    path = os.path.abspath(path)
+    while True:
+        try:
+            stat(path)
+            return path
+        except OSError:
+            parent = os.path.dirname(path)
+            if parent == path:
+                return path
+            path = parent
+
+
+def mount_point(path, stat=os.stat):
+    """Return (mount point, st_dev) of the filesystem that would hold ``path``."""
+    path = existing_ancestor(path, stat)
+    dev = stat(path).st_dev
+    while path != os.path.dirname(path):
+        parent = os.path.dirname(path)
+        if stat(parent).st_dev != dev:
+            break
+        path = parent
+    return path, dev
+
+
+def estimate_payload(installer_size, installed_size=None):
+    estimate = int(installer_size * PAYLOAD_RATIO)
+    return max(estimate, installed_size or 0)
+
+
+def plan_stages(installer_path, run_size, build_dir, compression="default",
+                is_zip=False, pkgdest=None, install_dir=OPT_DIR,
+                installed_size=None, stat=os.stat):
+    """List the space each stage of the install needs and where."""
+    payload = estimate_payload(run_size, installed_size)
+    package = int(payload * makepkg_conf.package_ratio(compression))
+    staged_run = run_size
+    if not is_zip:
+        # A .run on the same filesystem is moved into place, not copied
+        _src_mount, src_dev = mount_point(installer_path, stat)
+        _dst_mount, dst_dev = mount_point(build_dir, stat)
+        if src_dev == dst_dev:
+            staged_run = 0
+    stages = [
+        {"stage": _("Installer (.run)"), "path": build_dir, "bytes": staged_run},
+        {"stage": _("Extracted payload"), "path": build_dir, "bytes": payload},
+        {"stage": _("Built package"), "path": pkgdest or build_dir, "bytes": package},
+    ]
+    if install_dir:
+        stages.append({"stage": _("Installed files"), "path": install_dir, "bytes": payload})
+    return stages
+
+
+def check(stages, statvfs=os.statvfs, stat=os.stat):
+    """Group stage requirements by mount and compare them with free space."""
+    mounts = {}
+    for stage in stages:
+        if not stage["bytes"]:
+            continue
+        mount, dev = mount_point(stage["path"], stat)
+        entry = mounts.get(dev)
+        if entry is None:
+            st = statvfs(mount)
+            entry = mounts[dev] = {
+                "mount": mount,
+                "available": st.f_bavail * st.f_frsize,
+                "required": 0,
+                "stages": [],
+            }
+        entry["required"] += stage["bytes"]
+        entry["stages"].append(stage)
+    for entry in mounts.values():
+        entry["required"] = int(entry["required"] * MARGIN)
+        entry["ok"] = entry["required"] <= entry["available"]
+    report = sorted(mounts.values(), key=lambda e: e["mount"])
+    return {"ok": all(e["ok"] for e in report), "mounts": report}
+
+
+def format_report(report):
+    lines = []
+    for entry in report["mounts"]:
+        mark = "✓" if entry["ok"] else "✗"
+        lines.append(_("{} {}: needs {}, {} free").format(
+            mark, entry["mount"],
+            pkgdb.format_size(entry["required"]),
+            pkgdb.format_size(entry["available"]),
+        ))
+        for stage in entry["stages"]:
+            lines.append(f"    {stage['stage']}: {pkgdb.format_size(stage['bytes'])}")
+    return "\n".join(lines)
@@ -0,0 +1,91 @@
+"""Install priority profiles, so the workstation stays usable during a run.
+
+``foreground`` starts commands as they are. ``background`` and ``idle``
+start them in a transient systemd user scope with lower CPU and IO
+weights and a soft memory limit; where no user manager is reachable they
+fall back to a higher nice level. The command runs under ``nice`` and
+``ionice`` either way, since the io controller is often not delegated to
+user scopes.
+"""
+import functools
+import os
+import shutil
+import subprocess
+
+FOREGROUND = "foreground"
+BACKGROUND = "background"
+IDLE = "idle"
+PROFILES = (FOREGROUND, BACKGROUND, IDLE)
+DEFAULT = FOREGROUND
+
+SCOPE = "systemd-scope"
+NICE = "nice"
+
+# systemd resource-control properties per profile (weights default to 100)
+_SCOPE_PROPERTIES = {
+    BACKGROUND: {"CPUWeight": "20", "IOWeight": "20", "MemoryHigh": "75%"},
+    IDLE: {"CPUWeight": "1", "IOWeight": "1", "MemoryHigh": "50%"},
+}
+_IOPRIO_CLASS_BE = 2
+_IOPRIO_CLASS_IDLE = 3
+# (nice increment, ioprio class, ioprio level)
+_NICE_LEVELS = {
+    BACKGROUND: (10, _IOPRIO_CLASS_BE, 7),
+    IDLE: (19, _IOPRIO_CLASS_IDLE, 0),
+}
+
+
+def normalize(profile):
+    return profile if profile in PROFILES else DEFAULT
+
+
+def from_settings(settings):
+    return normalize(settings.get("install_priority"))
+
+
+@functools.lru_cache(maxsize=None)
+def scope_available():
+    """True if ``systemd-run --user --scope`` works in this session."""
+    if not shutil.which("systemd-run") or not os.environ.get("XDG_RUNTIME_DIR"):
+        return False
+    try:
+        r = subprocess.run(
+            ["systemd-run", "--user", "--scope", "--quiet", "--collect", "true"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return r.returncode == 0
+
+
+def _nice_prefix(profile):
+    """``nice`` and ``ionice`` in front of the command; children inherit both."""
+    nice_by, ioclass, level = _NICE_LEVELS[profile]
+    prefix = ["nice", "-n", str(nice_by)]
+    if shutil.which("ionice"):
+        prefix += ["ionice", "-c", str(ioclass)]
+        # The idle class has no levels; ionice warns when given one
+        if ioclass != _IOPRIO_CLASS_IDLE:
+            prefix += ["-n", str(level)]
+    return prefix
+
+
+def launcher(profile, use_scope=None):
+    """How to start commands at ``profile``.
+
+    Returns {"profile", "method", "prefix"}: ``prefix`` is put in front of
+    the command line, and is empty for ``foreground``.
+    """
+    profile = normalize(profile)
+    if profile == FOREGROUND:
+        return {"profile": profile, "method": None, "prefix": []}
+    if use_scope is None:
+        use_scope = scope_available()
+    if use_scope:
+        prefix = ["systemd-run", "--user", "--scope", "--quiet", "--collect"]
+        for key, value in _SCOPE_PROPERTIES[profile].items():
+            prefix += ["-p", f"{key}={value}"]
+        return {
+            "profile": profile, "method": SCOPE, "prefix": prefix + ["--"] + _nice_prefix(profile),
+        }
+    return {"profile": profile, "method": NICE, "prefix": _nice_prefix(profile)}
@@ -0,0 +1,452 @@
+"""One long-lived root process for every privileged step of a session.
+
+Started once through the sudo wrapper:
+
+    python3 privhelper.py serve [--fake DIR]
+
+it reads requests from stdin and answers on stdout, one JSON object per
+line. A request carries a queue of typed operations that run in order;
+the queue stops at the first failing operation unless that operation is
+marked ``optional``::
+
+    -> {"id": 3, "ops": [{"op": "chown", "path": "/opt/x", "uid": 1000, "gid": 1000},
+                         {"op": "ignore", "action": "add", "packages": ["a"]}]}
+    <- {"id": 3, "event": "output", "index": 1, "line": "..."}
+    <- {"id": 3, "event": "result", "index": 0, "ok": true, "error": null}
+    <- {"id": 3, "event": "result", "index": 1, "ok": true, "error": null, "changed": ["a"]}
+    <- {"id": 3, "event": "done", "ok": true, "error": null}
+
+An ``ignore`` result lists the entries it actually added or removed.
+Ownership and IgnorePkg changes run inside the helper; only pacman and
+shell scripts are forked. ``--fake DIR`` swaps in a backend that keeps a
+journal and a package list under DIR instead of touching the system, so
+the protocol can be exercised without root.
+"""
+import json
+import os
+import re
+import shlex
+import subprocess
+import sys
+import threading
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from davinci_installer import pacman_conf  # noqa: E402
+
+# op -> required arguments
+OPS = {
+    "install_files": ("paths",),
+    "install_repo": ("packages",),
+    "remove": ("packages",),
+    "ignore": ("action", "packages"),
+    "chown": ("path", "uid", "gid"),
+    "script": ("script",),
+}
+# Operations that take pacman's database lock
+DATABASE_OPS = ("install_files", "install_repo", "remove")
+
+
+# ── Operations ──────────────────────────────────────────────────────
+
+def install_files(paths, overwrite=()):
+    """``pacman -U`` the given package files."""
+    return {"op": "install_files", "paths": list(paths), "overwrite": list(overwrite)}
+
+
+def install_repo(packages, config=None, refresh=True, needed=True, overwrite=()):
+    """``pacman -S`` packages from the configured (or a given) set of repos."""
+    return {"op": "install_repo", "packages": list(packages), "config": config,
+            "refresh": refresh, "needed": needed, "overwrite": list(overwrite)}
+
+
+def remove(packages):
+    return {"op": "remove", "packages": list(packages)}
+
+
+def ignore(action, packages, optional=False):
+    return {"op": "ignore", "action": action, "packages": list(packages), "optional": optional}
+
+
+def chown(path, uid, gid):
+    """Recursive ``chown`` without following symlinks."""
+    return {"op": "chown", "path": path, "uid": uid, "gid": gid}
+
+
+def script(text, name=None):
+    """A shell snippet from ``versions``; ``name`` labels it in the log."""
+    return {"op": "script", "script": text, "name": name}
+
+
+def uses_database(ops):
+    return any(op.get("op") in DATABASE_OPS for op in ops)
+
+
+def ignore_changes(ops, results, action):
+    """IgnorePkg entries the successful ``ignore`` operations with ``action`` changed."""
+    changed = []
+    for op, result in zip(ops, results):
+        if op.get("op") == "ignore" and op["action"] == action and result and result["ok"]:
+            changed += [p for p in result.get("changed", ()) if p not in changed]
+    return changed
+
+
+def validate(op):
+    if not isinstance(op, dict) or op.get("op") not in OPS:
+        return f"unknown operation: {op.get('op') if isinstance(op, dict) else op!r}"
+    missing = [k for k in OPS[op["op"]] if k not in op]
+    if missing:
+        return f"{op['op']}: missing {', '.join(missing)}"
+    if op["op"] == "ignore" and op["action"] not in ("add", "remove"):
+        return f"ignore: unknown action {op['action']!r}"
+    return None
+
+
+def describe(op):
+    """One line for the log, e.g. ``:: chown 1000:1000 /opt/resolve-20.0.1``."""
+    kind = op["op"]
+    if kind == "install_files":
+        detail = " ".join(os.path.basename(p) for p in op["paths"])
+    elif kind in ("install_repo", "remove"):
+        detail = " ".join(op["packages"])
+    elif kind == "ignore":
+        detail = f"{op['action']} {' '.join(op['packages'])}"
+    elif kind == "chown":
+        detail = f"{op['uid']}:{op['gid']} {op['path']}"
+    else:
+        detail = op.get("name") or op["script"].split("\n", 1)[0][:80]
+    return f":: {kind} {detail}"
+
+
+# ── Backends ────────────────────────────────────────────────────────
+
+class OperationError(Exception):
+    pass
+
+
+class SystemBackend:
+    """Acts on the real system; needs root."""
+
+    name = "system"
+    conf_path = pacman_conf.CONF_PATH
+
+    def _spawn(self, argv, emit):
+        # stdin is the request pipe; a prompt must not read protocol lines
+        proc = subprocess.Popen(
+            argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, errors="replace",
+        )
+        for line in iter(proc.stdout.readline, ""):
+            emit(line)
+        proc.stdout.close()
+        code = proc.wait()
+        if code != 0:
+            raise OperationError(f"{os.path.basename(argv[0])} exited with status {code}")
+
+    @staticmethod
+    def _overwrite(op):
+        args = []
+        for pattern in op.get("overwrite") or ():
+            args += ["--overwrite", pattern]
+        return args
+
+    def install_files(self, op, emit):
+        self._spawn(["pacman", "-U", "--noconfirm"] + self._overwrite(op) + ["--"] + op["paths"], emit)
+
+    def install_repo(self, op, emit):
+        argv = ["pacman"]
+        if op.get("config"):
+            argv += ["--config", op["config"]]
+        argv += ["-Sy" if op.get("refresh", True) else "-S", "--noconfirm"]
+        if op.get("needed", True):
+            argv.append("--needed")
+        self._spawn(argv + self._overwrite(op) + ["--"] + op["packages"], emit)
+
+    def remove(self, op, emit):
+        self._spawn(["pacman", "-Rns", "--noconfirm", "--"] + op["packages"], emit)
+
+    def ignore(self, op, emit):
+        changed = pacman_conf.update(self.conf_path, op["action"], op["packages"])
+        emit(f"IgnorePkg {'updated' if changed else 'unchanged'} in {self.conf_path}\n")
+        return {"changed": changed}
+
+    def chown(self, op, emit):
+        uid, gid = int(op["uid"]), int(op["gid"])
+        count = 0
+        os.lchown(op["path"], uid, gid)
+        for dirpath, dirnames, filenames in os.walk(op["path"]):
+            for name in dirnames + filenames:
+                os.lchown(os.path.join(dirpath, name), uid, gid)
+                count += 1
+        emit(f"changed ownership of {count + 1} entries\n")
+
+    def script(self, op, emit):
+        self._spawn(["sh", "-c", op["script"]], emit)
+
+
+class FakeBackend(SystemBackend):
+    """Keeps everything under ``root``: a journal, a package list and a pacman.conf."""
+
+    name = "fake"
+    _PKG_RE = re.compile(r"^(?P<name>.+)-(?P<version>[^-]+-[^-]+)-[^-]+\.pkg\.tar(?:\.\w+)?$")
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        os.makedirs(os.path.join(self.root, "etc"), exist_ok=True)
+        self.conf_path = os.path.join(self.root, "etc", "pacman.conf")
+        if not os.path.exists(self.conf_path):
+            with open(self.conf_path, "w") as f:
+                f.write("[options]\n")
+        self.db_path = os.path.join(self.root, "installed.json")
+
+    def _journal(self, op):
+        with open(os.path.join(self.root, "journal.jsonl"), "a") as f:
+            f.write(json.dumps(op) + "\n")
+
+    def _installed(self):
+        try:
+            with open(self.db_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, installed):
+        with open(self.db_path, "w") as f:
+            json.dump(installed, f, indent=2, sort_keys=True)
+
+    def install_files(self, op, emit):
+        self._journal(op)
+        installed = self._installed()
+        total = len(op["paths"])
+        for i, path in enumerate(op["paths"], 1):
+            if not os.path.exists(path):
+                emit(f"error: '{path}': could not find or read package\n")
+                raise OperationError("pacman exited with status 1")
+            m = self._PKG_RE.match(os.path.basename(path))
+            name, version = (m.group("name"), m.group("version")) if m else (os.path.basename(path), "?")
+            emit(f"({i}/{total}) installing {name}\n")
+            installed[name] = version
+        self._save(installed)
+
+    def install_repo(self, op, emit):
+        self._journal(op)
+        installed = self._installed()
+        for i, pkg in enumerate(op["packages"], 1):
+            name = pkg.split("/")[-1]
+            if op.get("needed", True) and name in installed:
+                emit(f"warning: {name} is up to date -- skipping\n")
+                continue
+            emit(f"({i}/{len(op['packages'])}) installing {name}\n")
+            installed[name] = "repo"
+        self._save(installed)
+
+    def remove(self, op, emit):
+        self._journal(op)
+        installed = self._installed()
+        missing = [p for p in op["packages"] if p not in installed]
+        if missing:
+            for pkg in missing:
+                emit(f"error: target not found: {pkg}\n")
+            raise OperationError("pacman exited with status 1")
+        for pkg in op["packages"]:
+            emit(f"removing {pkg}...\n")
+            del installed[pkg]
+        self._save(installed)
+
+    def ignore(self, op, emit):
+        self._journal(op)
+        return super().ignore(op, emit)
+
+    def chown(self, op, emit):
+        self._journal(op)
+        if not os.path.lexists(op["path"]):
+            emit(f"chown: cannot access '{op['path']}': No such file or directory\n")
+            raise OperationError("chown failed")
+        count = sum(len(d) + len(f) for _p, d, f in os.walk(op["path"])) + 1
+        emit(f"changed ownership of {count} entries\n")
+
+    def script(self, op, emit):
+        # Checked, recorded, never run
+        self._journal(op)
+        r = subprocess.run(["sh", "-n", "-c", op["script"]], capture_output=True, text=True)
+        if r.returncode != 0:
+            emit(r.stderr)
+            raise OperationError("sh exited with status 2")
+
+
+# ── Server ──────────────────────────────────────────────────────────
+
+def serve(backend, stdin=None, stdout=None):
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+
+    def send(**event):
+        stdout.write(json.dumps(event) + "\n")
+        stdout.flush()
+
+    send(event="ready", pid=os.getpid(), uid=os.getuid(), backend=backend.name)
+    for raw in stdin:
+        if not raw.strip():
+            continue
+        req_id = None
+        try:
+            request = json.loads(raw)
+            if isinstance(request, dict):
+                req_id = request.get("id")
+            ops = list(request["ops"])
+            if req_id is None:
+                raise KeyError("id")
+        except (ValueError, KeyError, TypeError) as e:
+            # Answered under the request's id when it has one, so its caller stops waiting
+            send(event="done", id=req_id, ok=False, error=f"malformed request: {e}")
+            continue
+        ok = True
+        error = None
+        for index, op in enumerate(ops):
+            if not ok:
+                send(event="result", id=req_id, index=index, ok=False, skipped=True, error=None)
+                continue
+            problem = validate(op)
+            extra = None
+
+            def emit(line, index=index):
+                send(event="output", id=req_id, index=index, line=line)
+
+            if problem is None:
+                try:
+                    emit(describe(op) + "\n")
+                    extra = getattr(backend, op["op"])(op, emit)
+                except (OperationError, OSError, subprocess.SubprocessError) as e:
+                    problem = str(e)
+                except Exception as e:
+                    # A malformed operation fails on its own, not the whole session
+                    problem = f"{op['op']}: {type(e).__name__}: {e}"
+            send(event="result", id=req_id, index=index, ok=problem is None, error=problem,
+                 **(extra or {}))
+            if problem is not None and not op.get("optional"):
+                ok = False
+                error = problem
+        send(event="done", id=req_id, ok=ok, error=error)
+
+
+# ── Client ──────────────────────────────────────────────────────────
+
+class HelperError(RuntimeError):
+    pass
+
+
+class PrivilegedHelper:
+    """Client end: spawns the helper and runs operation queues through it."""
+
+    def __init__(self, argv, env=None):
+        self.proc = subprocess.Popen(
+            argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            text=True, encoding="utf-8", errors="replace", env=env,
+        )
+        self._lock = threading.Lock()
+        self._next_id = 1
+        ready = self._read()
+        if not ready or ready.get("event") != "ready":
+            self.close()
+            raise HelperError("the privileged helper did not start")
+        self.backend = ready.get("backend")
+        self.uid = ready.get("uid")
+
+    @classmethod
+    def spawn(cls, sudo_wrap="sudo", env=None, fake_root=None, launcher=None):
+        """Start the helper through ``sudo_wrap``, or unprivileged with ``fake_root``.
+
+        With a ``priority.launcher`` everything the helper runs inherits its priority.
+        """
+        argv = [sys.executable if fake_root else "python3", os.path.abspath(__file__), "serve"]
+        if fake_root:
+            argv += ["--fake", fake_root]
+        else:
+            argv = shlex.split(sudo_wrap) + argv
+        if launcher:
+            argv = launcher["prefix"] + argv
+        return cls(argv, env=env)
+
+    def _read(self):
+        line = self.proc.stdout.readline()
+        if not line:
+            return None
+        try:
+            return json.loads(line)
+        except ValueError:
+            return {"event": "noise", "line": line}
+
+    def run(self, ops, on_line=None, on_result=None):
+        """Run a queue of operations; return {ok, error, results}.
+
+        ``on_line`` gets every output line, ``on_result`` every finished
+        (or skipped) operation's result.
+        """
+        with self._lock:
+            if self.proc.poll() is not None:
+                raise HelperError("the privileged helper is not running")
+            req_id = self._next_id
+            self._next_id += 1
+            try:
+                self.proc.stdin.write(json.dumps({"id": req_id, "ops": list(ops)}) + "\n")
+                self.proc.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                raise HelperError(f"the privileged helper went away: {e}")
+            results = []
+            while True:
+                event = self._read()
+                if event is None:
+                    raise HelperError("the privileged helper exited unexpectedly")
+                if event.get("event") == "done" and event.get("id") is None:
+                    # A request the helper couldn't read, so it can't say whose it was
+                    raise HelperError(event.get("error") or "the privileged helper rejected a request")
+                if event.get("id") != req_id:
+                    continue
+                kind = event.get("event")
+                if kind == "output":
+                    if on_line:
+                        on_line(event["line"])
+                elif kind == "result":
+                    results.append(event)
+                    if on_result:
+                        on_result(event)
+                elif kind == "done":
+                    return {"ok": event["ok"], "error": event["error"], "results": results}
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv):
+    args = list(argv)
+    if not args or args[0] != "serve":
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+    if "--fake" in args:
+        backend = FakeBackend(args[args.index("--fake") + 1])
+    else:
+        if os.geteuid() != 0:
+            print("privhelper: must run as root (or with --fake DIR)", file=sys.stderr)
+            return 1
+        backend = SystemBackend()
+    serve(backend)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
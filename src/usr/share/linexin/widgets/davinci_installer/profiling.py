@@ -0,0 +1,271 @@
+"""Opt-in profiling of install runs and of the widget's main-loop callbacks.
+
+Switched on with ``DAVINCI_INSTALLER_PROFILE`` (or ``--profile`` on the
+command line), a comma-separated list of:
+
+    timing       wall and CPU time of every stage and measured section
+    cprofile     one .prof file per stage, for pstats or snakeviz
+    tracemalloc  the allocations each stage added, top lines first
+    all          all of the above
+
+``1`` means ``timing``. Idle and timeout callbacks that run longer than
+``DAVINCI_INSTALLER_FRAME_BUDGET_MS`` (16) are reported as they happen.
+Reports are written to ``DAVINCI_INSTALLER_PROFILE_DIR``, by default the
+``profiles`` directory next to the install history.
+"""
+import contextlib
+import cProfile
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+from davinci_installer import config
+
+ENV = "DAVINCI_INSTALLER_PROFILE"
+ENV_DIR = "DAVINCI_INSTALLER_PROFILE_DIR"
+ENV_BUDGET = "DAVINCI_INSTALLER_FRAME_BUDGET_MS"
+
+TIMING = "timing"
+CPROFILE = "cprofile"
+TRACEMALLOC = "tracemalloc"
+MODES = (TIMING, CPROFILE, TRACEMALLOC)
+
+DEFAULT_BUDGET_MS = 16.0
+# Allocation sites listed per stage, and slow callbacks per report
+TOP_ALLOCATIONS = 25
+TOP_CALLBACKS = 20
+
+
+def modes(value=None):
+    value = os.environ.get(ENV, "") if value is None else value
+    found = set()
+    for item in value.lower().split(","):
+        item = item.strip()
+        if item in ("1", "yes", "true", "on"):
+            found.add(TIMING)
+        elif item == "all":
+            found.update(MODES)
+        elif item in MODES:
+            found.add(item)
+    if found:
+        # Every report carries the timings
+        found.add(TIMING)
+    return frozenset(found)
+
+
+def enabled():
+    return bool(modes())
+
+
+def frame_budget():
+    """Seconds a main-loop callback may take before it is reported."""
+    try:
+        return float(os.environ.get(ENV_BUDGET, DEFAULT_BUDGET_MS)) / 1000
+    except ValueError:
+        return DEFAULT_BUDGET_MS / 1000
+
+
+def profile_dir():
+    return os.environ.get(ENV_DIR) or os.path.join(config.state_dir(), "profiles")
+
+
+# ── Main-loop callbacks ─────────────────────────────────────────────
+
+class CallbackStats:
+    """Calls, total and longest time per callback; shared by every wrapped callback."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, name, seconds, slow):
+        with self._lock:
+            entry = self._stats.setdefault(name, {"calls": 0, "seconds": 0.0, "max": 0.0, "slow": 0})
+            entry["calls"] += 1
+            entry["seconds"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+            entry["slow"] += bool(slow)
+
+    def take(self):
+        """Return the stats gathered so far and start over."""
+        with self._lock:
+            stats, self._stats = self._stats, {}
+        return stats
+
+
+callbacks = CallbackStats()
+
+
+def wrap_callback(func, budget=None):
+    budget = frame_budget() if budget is None else budget
+    name = getattr(func, "__qualname__", None) or repr(func)
+
+    @functools.wraps(func)
+    def _timed(*args):
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            took = time.perf_counter() - started
+            callbacks.record(name, took, took > budget)
+            if took > budget:
+                print(f"[profile] {name} blocked the main loop for {took * 1000:.1f} ms",
+                      file=sys.stderr, flush=True)
+    return _timed
+
+
+class MainLoop:
+    """Stands in for ``GLib``, timing every idle and timeout callback added through it."""
+
+    def __init__(self, glib):
+        self._glib = glib
+
+    def __getattr__(self, name):
+        return getattr(self._glib, name)
+
+    def idle_add(self, func, *args, **kwargs):
+        return self._glib.idle_add(wrap_callback(func), *args, **kwargs)
+
+    def timeout_add(self, interval, func, *args, **kwargs):
+        return self._glib.timeout_add(interval, wrap_callback(func), *args, **kwargs)
+
+    def timeout_add_seconds(self, interval, func, *args, **kwargs):
+        return self._glib.timeout_add_seconds(interval, wrap_callback(func), *args, **kwargs)
+
+
+def instrument(glib):
+    """``glib`` itself, or a ``MainLoop`` around it while profiling is on."""
+    return MainLoop(glib) if enabled() else glib
+
+
+# ── Runs ────────────────────────────────────────────────────────────
+
+class RunProfiler:
+    """Collects one run's stage timings, profiles and allocation reports."""
+
+    def __init__(self, name, modes, directory=None):
+        self.name = name
+        self.modes = modes
+        self.directory = directory or profile_dir()
+        self.run_id = None
+        self.stages = {}
+        self.sections = {}
+        self.files = []
+        self._started = time.perf_counter()
+        self._own_tracing = False
+        os.makedirs(self.directory, exist_ok=True)
+        if TRACEMALLOC in modes and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._own_tracing = True
+        callbacks.take()
+
+    def _path(self, suffix):
+        path = os.path.join(self.directory, f"{self.name}-{suffix}")
+        self.files.append(path)
+        return path
+
+    @contextlib.contextmanager
+    def stage(self, stage):
+        profile = cProfile.Profile() if CPROFILE in self.modes else None
+        before = tracemalloc.take_snapshot() if TRACEMALLOC in self.modes else None
+        wall = time.perf_counter()
+        # Stages run on one thread; the UI's CPU time isn't theirs
+        cpu = time.thread_time()
+        if profile:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile:
+                profile.disable()
+            self.stages[stage] = {
+                "seconds": time.perf_counter() - wall,
+                "cpu_seconds": time.thread_time() - cpu,
+            }
+            if before:
+                self._write_allocations(stage, before)
+            if profile:
+                profile.dump_stats(self._path(f"{stage}.prof"))
+
+    def _write_allocations(self, stage, before):
+        # Leave out what the profilers themselves allocated
+        ignore = [tracemalloc.Filter(False, m.__file__) for m in (tracemalloc, cProfile, contextlib)]
+        after = tracemalloc.take_snapshot().filter_traces(ignore)
+        diff = after.compare_to(before.filter_traces(ignore), "lineno")
+        self.stages[stage]["allocated_bytes"] = sum(s.size_diff for s in diff)
+        with open(self._path(f"{stage}-alloc.txt"), "w") as f:
+            f.write(f"Top {TOP_ALLOCATIONS} allocation sites added during {stage}:\n")
+            for stat in diff[:TOP_ALLOCATIONS]:
+                f.write(f"{stat}\n")
+
+    def add(self, section, seconds):
+        entry = self.sections.setdefault(section, {"calls": 0, "seconds": 0.0, "max": 0.0})
+        entry["calls"] += 1
+        entry["seconds"] += seconds
+        entry["max"] = max(entry["max"], seconds)
+
+    @contextlib.contextmanager
+    def measure(self, section):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(section, time.perf_counter() - started)
+
+    def finish(self):
+        """Write the run's report next to its profiles and return it."""
+        stats = callbacks.take()
+        slow = sorted(
+            ({"callback": name, **entry} for name, entry in stats.items() if entry["slow"]),
+            key=lambda e: e["max"], reverse=True,
+        )
+        report = {
+            "name": self.name,
+            "run_id": self.run_id,
+            "modes": sorted(self.modes),
+            "seconds": time.perf_counter() - self._started,
+            "stages": self.stages,
+            "sections": self.sections,
+            "callbacks": stats,
+            "frame_budget_ms": frame_budget() * 1000,
+            "slow_callbacks": slow[:TOP_CALLBACKS],
+            "files": list(self.files),
+        }
+        if self._own_tracing:
+            report["peak_traced_bytes"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        path = self._path("profile.json")
+        report["files"].append(path)
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        return report
+
+
+def start(name):
+    """A ``RunProfiler`` for the run ``name`` if profiling is on, else None."""
+    found = modes()
+    return RunProfiler(name, found) if found else None
+
+
+def format_report(report):
+    lines = [f"Profile of {report['name']} ({', '.join(report['modes'])}):"]
+    for stage, entry in report["stages"].items():
+        lines.append(f"  {stage:<14}{entry['seconds']:9.2f} s wall {entry['cpu_seconds']:9.2f} s CPU")
+    for section, entry in report["sections"].items():
+        lines.append(
+            f"  {section:<22}{entry['calls']:>8} calls {entry['seconds']:9.3f} s"
+            f" (longest {entry['max'] * 1000:.1f} ms)"
+        )
+    if report["slow_callbacks"]:
+        lines.append(f"  Main-loop callbacks over {report['frame_budget_ms']:.0f} ms:")
+        for entry in report["slow_callbacks"]:
+            lines.append(
+                f"    {entry['callback']}: {entry['slow']} of {entry['calls']} calls,"
+                f" longest {entry['max'] * 1000:.1f} ms"
+            )
+    lines.append(f"  Written to {os.path.dirname(report['files'][-1])}")
+    return "\n".join(lines)
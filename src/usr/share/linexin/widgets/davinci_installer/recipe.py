@@ -0,0 +1,258 @@
+"""Render the build recipe (PKGBUILD, install script, panel setup) from its templates.
+
+The PKGBUILDs under ``/usr/share/linexin/davinci[studio]`` carry ``@NAME@``
+placeholders for the variables in ``VARIABLES``; the compression profile
+becomes a ``makepkg.conf`` next to them. A rendered recipe is checked with
+``bash -n`` and by sourcing it in an empty environment before makepkg ever
+runs it, then kept in the cache under a hash of everything it was rendered
+from, so building the same installer again copies it instead.
+"""
+import hashlib
+import json
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import tempfile
+import time
+
+from davinci_installer import config, history, makepkg_conf, versions
+
+try:
+    _
+except NameError:
+    from gettext import gettext as _
+
+RECIPE_DIRS = {
+    False: ("/usr/share/linexin/davinci", "davinci-resolve.install"),
+    True: ("/usr/share/linexin/davincistudio", "davinci-resolve-studio.install"),
+}
+PANELS_SCRIPT = "davinci-control-panels-setup.sh"
+
+# Placeholders a template may use; values are shell-quoted when filled in
+VARIABLES = {
+    "EDITION": "free or studio",
+    "VERSION": "pkgver, e.g. 20.1 or 20.1beta2",
+    "RUNFILE": "file name of the .run installer",
+    "OPENCL_DEPENDS": "OpenCL packages to depend on, as quoted words",
+    "INSTALLROOT": "directory of this version under /opt",
+}
+
+# Bump when rendering changes, so recipes cached by an older installer aren't reused
+RENDER_VERSION = 1
+CACHE_ENTRIES = 8
+CHECK_TIMEOUT = 10
+# The virtual dependency kept when the package shouldn't pin this machine's driver
+OPENCL_VIRTUAL = "opencl-driver"
+
+_PLACEHOLDER_RE = re.compile(r"@([A-Z][A-Z_]*)@")
+# What makepkg accepts in pkgver
+_PKGVER_RE = re.compile(r"^[A-Za-z0-9._+]+$")
+
+
+class RecipeError(ValueError):
+    """A template or its rendered recipe is unusable; the message says why."""
+
+
+def package_name(studio):
+    return "davinci-resolve-studio" if studio else "davinci-resolve"
+
+
+def template_files(studio):
+    """(source path, name in the build directory) of every recipe file."""
+    source_dir, install_file = RECIPE_DIRS[bool(studio)]
+    return [
+        (os.path.join(source_dir, name), name)
+        for name in ("PKGBUILD", install_file, PANELS_SCRIPT)
+    ]
+
+
+def variables(studio, version, run_name, opencl_packages=None):
+    """Raw values of ``VARIABLES``; ``opencl_packages`` None keeps the virtual dependency."""
+    if not _PKGVER_RE.match(version or ""):
+        raise RecipeError(_("{} is not a valid package version").format(version))
+    return {
+        "EDITION": history.edition(studio),
+        "VERSION": version,
+        "RUNFILE": run_name,
+        "OPENCL_DEPENDS": list(opencl_packages) if opencl_packages else [OPENCL_VIRTUAL],
+        "INSTALLROOT": versions.root_name(version, studio),
+    }
+
+
+def _quote(value):
+    if isinstance(value, (list, tuple)):
+        return " ".join(shlex.quote(v) for v in value)
+    return shlex.quote(str(value))
+
+
+def render_template(text, values):
+    """Fill in the ``@NAME@`` placeholders of ``text``; unknown or unset ones are errors."""
+    used = set(_PLACEHOLDER_RE.findall(text))
+    unknown = used - set(VARIABLES)
+    if unknown:
+        raise RecipeError(_("Unknown placeholder in the recipe: {}").format(", ".join(sorted(unknown))))
+    unset = used - set(values)
+    if unset:
+        raise RecipeError(_("No value for recipe placeholder: {}").format(", ".join(sorted(unset))))
+    return _PLACEHOLDER_RE.sub(lambda m: _quote(values[m.group(1)]), text)
+
+
+# ── Checks ──────────────────────────────────────────────────────────
+
+# Prints what the checks compare, NUL-separated: five fields, then depends
+_PROBE = (
+    'source ./PKGBUILD || exit 1\n'
+    'printf "%s\\0" "$pkgname" "$pkgver" "$_edition" "$_runfile" "$_installroot" "${depends[@]}"\n'
+)
+
+
+def _bash(args, cwd, stdin=None):
+    try:
+        return subprocess.run(
+            ["bash", "--noprofile", "--norc", *args],
+            cwd=cwd, input=stdin, capture_output=True, timeout=CHECK_TIMEOUT,
+            # Nothing from the user's environment leaks into the recipe
+            env={"PATH": "/usr/bin:/bin", "LC_ALL": "C", "HOME": cwd},
+        )
+    except subprocess.TimeoutExpired:
+        raise RecipeError(_("Checking the recipe took longer than {} seconds").format(CHECK_TIMEOUT))
+
+
+def check(pkgbuild_text, studio, values):
+    """Raise ``RecipeError`` unless the PKGBUILD parses and declares what it was rendered with.
+
+    It is sourced in an empty scratch directory with a bare environment, the
+    way makepkg reads it before building; only its functions touch the build.
+    """
+    with tempfile.TemporaryDirectory(prefix="davinci-recipe-") as scratch:
+        with open(os.path.join(scratch, "PKGBUILD"), "w") as f:
+            f.write(pkgbuild_text)
+        r = _bash(["-n", "PKGBUILD"], scratch)
+        if r.returncode != 0:
+            raise RecipeError(_("The recipe has a syntax error: {}").format(
+                r.stderr.decode(errors="replace").strip()))
+        r = _bash(["-s"], scratch, stdin=_PROBE.encode())
+        if r.returncode != 0:
+            raise RecipeError(_("The recipe could not be read: {}").format(
+                r.stderr.decode(errors="replace").strip()))
+    fields = [v.decode(errors="replace") for v in r.stdout.split(b"\0")[:-1]]
+    if len(fields) < 5:
+        raise RecipeError(_("The recipe could not be read: {}").format(r.stdout[:200]))
+    declared = dict(zip(("pkgname", "VERSION", "EDITION", "RUNFILE", "INSTALLROOT"), fields))
+    depends = fields[5:]
+    expected = {key: values.get(key) for key in declared}
+    expected["pkgname"] = package_name(studio)
+    for key, value in expected.items():
+        if declared[key] != value:
+            raise RecipeError(_("The recipe declares {} as {!r} instead of {!r}").format(
+                key.lower(), declared[key], value))
+    missing = [p for p in values["OPENCL_DEPENDS"] if p not in depends]
+    if missing:
+        raise RecipeError(_("The recipe doesn't depend on {}").format(", ".join(missing)))
+
+
+# ── Cache ───────────────────────────────────────────────────────────
+
+def cache_root():
+    return os.path.join(config.cache_dir(), "recipes")
+
+
+def _read_templates(studio):
+    """{name: (source path, contents)} of the recipe's templates."""
+    contents = {}
+    for path, name in template_files(studio):
+        try:
+            with open(path, "rb") as f:
+                contents[name] = (path, f.read())
+        except FileNotFoundError:
+            raise FileNotFoundError(_("Required file not found at {}").format(path))
+    return contents
+
+
+def cache_key(contents, values, conf):
+    digest = hashlib.sha256()
+    digest.update(json.dumps(
+        {"render": RENDER_VERSION, "values": values, "makepkg.conf": conf}, sort_keys=True,
+    ).encode())
+    for name in sorted(contents):
+        digest.update(name.encode() + b"\0" + hashlib.sha256(contents[name][1]).digest())
+    return digest.hexdigest()
+
+
+def _prune(root, keep):
+    entries = []
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        if ".tmp-" in name:
+            # Left by a render that died; anything older than a minute is nobody's
+            if time.time() - os.path.getmtime(path) > 60:
+                shutil.rmtree(path, ignore_errors=True)
+            continue
+        entries.append((os.path.getmtime(path), path))
+    entries.sort(reverse=True)
+    for _mtime, path in entries[keep:]:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _render_entry(entry, contents, studio, values, conf):
+    tmp = f"{entry}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    try:
+        for name, (source, data) in contents.items():
+            if name == "PKGBUILD":
+                text = render_template(data.decode(), values)
+                check(text, studio, values)
+                data = text.encode()
+            with open(os.path.join(tmp, name), "wb") as f:
+                f.write(data)
+            shutil.copymode(source, os.path.join(tmp, name))
+        if conf:
+            with open(os.path.join(tmp, "makepkg.conf"), "w") as f:
+                f.write(conf)
+        try:
+            os.rename(tmp, entry)
+        except OSError:
+            # Another process rendered the same recipe first
+            if not os.path.isdir(entry):
+                raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def render(studio, version, run_name, dest_dir, opencl_packages=None, compression=None):
+    """Write the checked recipe for one build into ``dest_dir``.
+
+    Returns {"key", "cached", "files", "variables"}; ``cached`` is True when
+    an earlier render with the same inputs was reused.
+    """
+    values = variables(studio, version, run_name, opencl_packages)
+    contents = _read_templates(studio)
+    conf = makepkg_conf.render(compression)
+    key = cache_key(contents, values, conf)
+    root = cache_root()
+    entry = os.path.join(root, key)
+    cached = os.path.isdir(entry)
+    if not cached:
+        os.makedirs(root, exist_ok=True)
+        _render_entry(entry, contents, studio, values, conf)
+    # Most recently used entries survive pruning
+    os.utime(entry)
+    files = []
+    for name in sorted(os.listdir(entry)):
+        dest = os.path.join(dest_dir, name)
+        shutil.copy2(os.path.join(entry, name), dest)
+        files.append(dest)
+    if not conf:
+        # A makepkg.conf left by an earlier build with another profile
+        try:
+            os.unlink(os.path.join(dest_dir, "makepkg.conf"))
+        except FileNotFoundError:
+            pass
+    try:
+        _prune(root, CACHE_ENTRIES)
+    except OSError:
+        pass
+    return {"key": key, "cached": cached, "files": files, "variables": values}
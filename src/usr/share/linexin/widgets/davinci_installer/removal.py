@@ -0,0 +1,55 @@
+"""Helpers for the removal stage."""
+import json
+import os
+
+from davinci_installer import config, pkgdb
+
+PACKAGES = ("davinci-resolve", "davinci-resolve-studio")
+
+
+def installed_packages(is_installed=pkgdb.is_installed):
+    return [pkg for pkg in PACKAGES if is_installed(pkg)]
+
+
+def free_bytes(path):
+    st = os.statvfs(path)
+    return st.f_bavail * st.f_frsize
+
+
+def removal_fraction(free_before, free_now, expected):
+    if not expected:
+        return 0.0
+    return min(max((free_now - free_before) / expected, 0.0), 1.0)
+
+
+# ── IgnorePkg entries the installer added ───────────────────────────
+
+def ignore_record_path():
+    return os.path.join(config.state_dir(), "ignore-added.json")
+
+
+def added_ignores(path=None):
+    """Entries the installer put into IgnorePkg itself, not the ones the user had."""
+    try:
+        with open(path or ignore_record_path(), "r") as f:
+            return list(json.load(f))
+    except (OSError, ValueError, TypeError):
+        return []
+
+
+def _save_ignores(entries, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + ".tmp", "w") as f:
+        json.dump(entries, f)
+    os.replace(path + ".tmp", path)
+
+
+def record_ignores(added, path=None):
+    path = path or ignore_record_path()
+    known = added_ignores(path)
+    _save_ignores(known + [p for p in added if p not in known], path)
+
+
+def forget_ignores(removed, path=None):
+    path = path or ignore_record_path()
+    _save_ignores([p for p in added_ignores(path) if p not in removed], path)
@@ -0,0 +1,300 @@
+"""Recognising, fingerprinting and validating BlackMagic installer downloads."""
+import hashlib
+import json
+import os
+import re
+import shlex
+import shutil
+import struct
+import threading
+import zipfile
+import zlib
+
+from davinci_installer import config
+
+try:
+    _
+except NameError:
+    from gettext import gettext as _
+
+# Betas are named either DaVinci_Resolve_20.1b2_Linux.run or ..._20.1_Linux_beta.run
+INSTALLER_RE = re.compile(
+    r"DaVinci_Resolve(?P<studio>_Studio)?_(?P<release>\d+(?:\.\d+)*)"
+    r"(?:_?(?:[bB]|[bB]eta)(?P<beta>\d+))?_Linux(?P<beta_tag>_[bB]eta)?\.(?P<kind>run|zip)$"
+)
+# How the stub ahead of the payload names the version, e.g. "DaVinci Resolve Studio 20.1 Beta 2"
+HEADER_VERSION_RE = re.compile(
+    rb"DaVinci Resolve(?: Studio)? v?(\d+(?:\.\d+)+)(?:\s*(?:[bB]|[bB]eta)\s*(\d+))?"
+)
+HEADER_LIMIT = 4 * 1024 * 1024
+PARTIAL_SUFFIXES = (".part", ".crdownload", ".download", ".partial", ".tmp")
+
+CHUNK_SIZE = 4 * 1024 * 1024
+ELF_MAGIC = b"\x7fELF"
+SQUASHFS_MAGIC = b"hsqs"
+
+_cache_lock = threading.Lock()
+
+
+def pkgver(release, beta=None):
+    """pacman version of a release or beta: ``20.1``, ``20.1beta2`` (sorts before ``20.1``)."""
+    if beta is None or beta is False:
+        return release
+    return f"{release}beta{'' if beta is True else beta}"
+
+
+def parse_installer_name(filename):
+    m = INSTALLER_RE.search(os.path.basename(filename))
+    if not m:
+        return None
+    beta = int(m.group("beta")) if m.group("beta") else bool(m.group("beta_tag")) or None
+    return {
+        "version": pkgver(m.group("release"), beta),
+        "release": m.group("release"),
+        "beta": beta,
+        "studio": bool(m.group("studio")),
+        "kind": m.group("kind"),
+    }
+
+
+def header_version(path):
+    """Version named in the stub ahead of the payload, as ``pkgver`` spells it; None if absent."""
+    try:
+        limit = payload_offset(path) or HEADER_LIMIT
+        with open(path, "rb") as f:
+            m = HEADER_VERSION_RE.search(f.read(min(limit, HEADER_LIMIT)))
+    except OSError:
+        return None
+    if not m:
+        return None
+    return pkgver(m.group(1).decode(), int(m.group(2)) if m.group(2) else None)
+
+
+def installer_version(path):
+    """Version of a .run from its name, refined by its header.
+
+    The header wins when it names the same release in more detail (a beta
+    number the file name left out); a header that disagrees is ignored.
+    """
+    parsed = parse_installer_name(path)
+    named = parsed["version"] if parsed else None
+    found = header_version(path)
+    if not named:
+        return found
+    if found and re.match(r"\d+(?:\.\d+)*", found).group(0) == parsed["release"]:
+        return found
+    return named
+
+
+def is_partial(filename):
+    return filename.endswith(PARTIAL_SUFFIXES)
+
+
+# ── Fingerprints ────────────────────────────────────────────────────
+
+def _fingerprint_cache_path():
+    return os.path.join(config.cache_dir(), "fingerprints.json")
+
+
+def _load_fingerprints():
+    try:
+        with open(_fingerprint_cache_path(), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def cached_fingerprint(path):
+    """Return the stored SHA-256 if the file hasn't changed since it was hashed."""
+    st = os.stat(path)
+    entry = _load_fingerprints().get(os.path.abspath(path))
+    if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+        return entry["sha256"]
+    return None
+
+
+def fingerprint(path, on_progress=None):
+    """SHA-256 of ``path``, reusing the on-disk cache keyed by size and mtime."""
+    cached = cached_fingerprint(path)
+    if cached:
+        return cached
+    st = os.stat(path)
+    digest = hashlib.sha256()
+    done = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            done += len(chunk)
+            if on_progress:
+                on_progress(done, st.st_size)
+    value = digest.hexdigest()
+    with _cache_lock:
+        entries = _load_fingerprints()
+        entries[os.path.abspath(path)] = {
+            "size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": value,
+        }
+        # Drop entries for files that are gone
+        entries = {p: e for p, e in entries.items() if os.path.exists(p)}
+        cache_path = _fingerprint_cache_path()
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path + ".tmp", "w") as f:
+            json.dump(entries, f)
+        os.replace(cache_path + ".tmp", cache_path)
+    return value
+
+
+# ── Validation ──────────────────────────────────────────────────────
+
+def elf_end_offset(header):
+    """Offset right after the ELF section header table, where an AppImage's payload starts."""
+    if header[:4] != ELF_MAGIC or len(header) < 64:
+        return None
+    if header[4] == 2:  # ELFCLASS64
+        e_shoff, = struct.unpack_from("<Q", header, 0x28)
+        e_shentsize, e_shnum = struct.unpack_from("<HH", header, 0x3A)
+    else:
+        e_shoff, = struct.unpack_from("<I", header, 0x20)
+        e_shentsize, e_shnum = struct.unpack_from("<HH", header, 0x2E)
+    return e_shoff + e_shentsize * e_shnum
+
+
+def payload_offset(path):
+    """Offset of the squashfs image inside an AppImage-style ``.run``, or None."""
+    with open(path, "rb") as f:
+        offset = elf_end_offset(f.read(64))
+        if offset is None:
+            return None
+        f.seek(offset)
+        if f.read(4) != SQUASHFS_MAGIC:
+            return None
+    return offset
+
+
+def unsquashfs_command(run_path, dest, offset):
+    """Command that unpacks the payload straight into ``dest``.
+
+    Returns None when unsquashfs isn't installed; makepkg then falls back to
+    running the installer's own ``--appimage-extract``.
+    """
+    if not shutil.which("unsquashfs"):
+        return None
+    return (
+        f"unsquashfs -f -no-xattrs -percentage -o {int(offset)} "
+        f"-d {shlex.quote(dest)} {shlex.quote(run_path)}"
+    )
+
+
+def find_zip_member(zf):
+    for info in zf.infolist():
+        parsed = parse_installer_name(os.path.basename(info.filename))
+        if parsed and parsed["kind"] == "run":
+            return info
+    return None
+
+
+# ── Zip extraction ──────────────────────────────────────────────────
+
+def _stamps_path():
+    return os.path.join(config.cache_dir(), "extracted.json")
+
+
+def _load_stamps():
+    try:
+        with open(_stamps_path(), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _record_extraction(path, info):
+    st = os.stat(path)
+    with _cache_lock:
+        stamps = {p: s for p, s in _load_stamps().items() if os.path.exists(p)}
+        stamps[os.path.abspath(path)] = {
+            "size": st.st_size, "mtime_ns": st.st_mtime_ns, "crc": info.CRC,
+        }
+        os.makedirs(os.path.dirname(_stamps_path()), exist_ok=True)
+        with open(_stamps_path() + ".tmp", "w") as f:
+            json.dump(stamps, f)
+        os.replace(_stamps_path() + ".tmp", _stamps_path())
+
+
+def is_extracted_copy(path, info, check_crc=True):
+    """True if ``path`` already holds the zip member ``info``.
+
+    Files we extracted ourselves are recognised from a stamp without reading
+    them; anything else of the right size is checked against the member CRC,
+    or taken on trust with ``check_crc=False``.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    if st.st_size != info.file_size:
+        return False
+    stamp = _load_stamps().get(os.path.abspath(path))
+    if stamp and stamp["mtime_ns"] == st.st_mtime_ns and stamp["size"] == st.st_size:
+        return stamp["crc"] == info.CRC
+    if not check_crc:
+        return True
+    crc = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            crc = zlib.crc32(chunk, crc)
+    return crc == info.CRC
+
+
+def extract_zip_member(zip_path, info, dest, on_progress=None):
+    """Stream one member out of the zip in chunks; the CRC is checked at EOF."""
+    tmp = dest + ".part"
+    done = 0
+    with zipfile.ZipFile(zip_path) as zf:
+        with zf.open(info) as src, open(tmp, "wb") as out:
+            while True:
+                chunk = src.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                out.write(chunk)
+                done += len(chunk)
+                if on_progress:
+                    on_progress(done, info.file_size)
+    os.chmod(tmp, 0o755)
+    os.replace(tmp, dest)
+    _record_extraction(dest, info)
+
+
+def zip_member(zip_path):
+    with zipfile.ZipFile(zip_path) as zf:
+        info = find_zip_member(zf)
+    if info is None:
+        raise ValueError(_("The archive contains no .run installer"))
+    return info
+
+
+def validate(path):
+    """Cheap structural checks; returns a dict with ``ok`` and a ``reason`` on failure."""
+    parsed = parse_installer_name(path)
+    if not parsed:
+        return {"ok": False, "reason": _("Not a DaVinci Resolve installer")}
+    try:
+        if parsed["kind"] == "zip":
+            with zipfile.ZipFile(path) as zf:
+                member = find_zip_member(zf)
+                if member is None:
+                    return {"ok": False, "reason": _("The archive contains no .run installer")}
+                return {"ok": True, "member": member.filename, "size": member.file_size}
+        with open(path, "rb") as f:
+            if elf_end_offset(f.read(64)) is None:
+                return {"ok": False, "reason": _("The installer is not an executable")}
+        offset = payload_offset(path)
+        if offset is None:
+            return {"ok": False, "reason": _("The installer payload is missing or truncated")}
+        return {"ok": True, "payload_offset": offset, "size": os.path.getsize(path)}
+    except (OSError, zipfile.BadZipFile) as e:
+        return {"ok": False, "reason": str(e)}
@@ -0,0 +1,242 @@
+"""Check an installed package against the mtree pacman recorded for it.
+
+Like ``pacman -Qkk``, but the checks run on a thread pool with large
+sequential reads, and files whose size, mtime and inode haven't changed
+since they last verified are not read again. Ownership isn't compared:
+the installer hands the install root to the user on purpose.
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from davinci_installer import config, pkgdb
+
+LOCAL_DB = "/var/lib/pacman/local"
+READ_BYTES = 4 * 1024 * 1024
+# Problems listed in an error message; the report keeps all of them
+SHOWN_PROBLEMS = 10
+
+_ESCAPE_RE = re.compile(rb"\\([0-7]{3})")
+
+
+def default_workers():
+    return min(8, os.cpu_count() or 2)
+
+
+def cache_path():
+    return os.path.join(config.state_dir(), "verify-cache.json")
+
+
+def installed_package():
+    """(name, version) of the installed Resolve package, or None."""
+    for name in ("davinci-resolve", "davinci-resolve-studio"):
+        version = pkgdb.query_info(name).get("Version")
+        if version:
+            return name, version
+    return None
+
+
+def mtree_path(name, version, local_db=LOCAL_DB):
+    return os.path.join(local_db, f"{name}-{version}", "mtree")
+
+
+def _unescape(raw):
+    return os.fsdecode(_ESCAPE_RE.sub(lambda m: bytes([int(m.group(1), 8)]), raw))
+
+
+def parse_mtree(data):
+    """Entries of a pacman mtree: [{"path", "type", "size", "mode", "sha256", "link"}].
+
+    Paths are absolute; the package's own metadata files are left out.
+    """
+    defaults = {}
+    entries = []
+    for line in data.split(b"\n"):
+        line = line.strip()
+        if not line or line.startswith(b"#"):
+            continue
+        fields = line.split()
+        if fields[0] == b"/set":
+            for field in fields[1:]:
+                key, _sep, value = field.partition(b"=")
+                defaults[key] = value
+            continue
+        if fields[0] == b"/unset":
+            for key in fields[1:]:
+                defaults.pop(key, None)
+            continue
+        keys = dict(defaults)
+        for field in fields[1:]:
+            key, _sep, value = field.partition(b"=")
+            keys[key] = value
+        path = _unescape(fields[0])
+        if path.startswith("./."):
+            continue  # .PKGINFO, .BUILDINFO, .MTREE, .INSTALL
+        entries.append({
+            "path": path[1:] if path.startswith("./") else path,
+            "type": keys.get(b"type", b"file").decode(),
+            "size": int(keys[b"size"]) if b"size" in keys else None,
+            "mode": int(keys[b"mode"], 8) if b"mode" in keys else None,
+            "sha256": keys[b"sha256digest"].decode() if b"sha256digest" in keys else None,
+            "link": _unescape(keys[b"link"]) if b"link" in keys else None,
+        })
+    return entries
+
+
+def load_mtree(name, version, local_db=LOCAL_DB):
+    with gzip.open(mtree_path(name, version, local_db), "rb") as f:
+        return parse_mtree(f.read())
+
+
+def _load_cache(name, version, path):
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("package") != name or data.get("version") != version:
+        return {}
+    return data.get("files", {})
+
+
+def _save_cache(name, version, files, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"package": name, "version": version, "files": files}, f)
+    os.replace(tmp, path)
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    buf = bytearray(READ_BYTES)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as f:
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except (AttributeError, OSError):
+            pass
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.hexdigest()
+
+
+def _check(entry, cached):
+    """Return (problem or None, bytes read or None, cache record or None)."""
+    path = entry["path"]
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return "missing", None, None
+    except OSError as e:
+        return f"unreadable: {e.strerror}", None, None
+    kind = entry["type"]
+    if kind == "dir":
+        if not stat.S_ISDIR(st.st_mode):
+            return "not a directory", None, None
+    elif kind == "link":
+        if not stat.S_ISLNK(st.st_mode):
+            return "not a symlink", None, None
+        target = os.readlink(path)
+        if entry["link"] is not None and target != entry["link"]:
+            return f"points to {target}, expected {entry['link']}", None, None
+        return None, None, None
+    elif not stat.S_ISREG(st.st_mode):
+        return "not a regular file", None, None
+    if entry["mode"] is not None and stat.S_IMODE(st.st_mode) != entry["mode"]:
+        return f"mode {stat.S_IMODE(st.st_mode):o}, expected {entry['mode']:o}", None, None
+    if kind != "file":
+        return None, None, None
+    if entry["size"] is not None and st.st_size != entry["size"]:
+        return f"size {st.st_size}, expected {entry['size']}", None, None
+    if not entry["sha256"]:
+        return None, None, None
+    record = [st.st_size, st.st_mtime_ns, st.st_ino, entry["sha256"]]
+    if cached == record:
+        return None, None, record
+    try:
+        digest = file_sha256(path)
+    except OSError as e:
+        return f"unreadable: {e.strerror}", None, None
+    if digest != entry["sha256"]:
+        return "checksum mismatch", st.st_size, None
+    return None, st.st_size, record
+
+
+def verify(name, version, workers=None, full=False, on_progress=None, local_db=LOCAL_DB,
+           cache=None):
+    """Verify every file of an installed package; return a report.
+
+    ``full`` ignores the cache of earlier results. ``on_progress(done,
+    total)`` is called with byte counts as files finish.
+    """
+    started = time.monotonic()
+    entries = load_mtree(name, version, local_db)
+    cache = cache or cache_path()
+    known = {} if full else _load_cache(name, version, cache)
+    total = sum(e["size"] or 0 for e in entries if e["type"] == "file")
+    # Largest first, so one big file doesn't end up last on a single thread
+    entries.sort(key=lambda e: e["size"] or 0, reverse=True)
+
+    report = {
+        "package": name, "version": version, "entries": len(entries),
+        "hashed_files": 0, "hashed_bytes": 0, "cached_files": 0, "total_bytes": total,
+        "problems": [], "seconds": 0.0, "throughput": None,
+    }
+    records = {}
+    done = 0
+    with ThreadPoolExecutor(max_workers=workers or default_workers()) as pool:
+        futures = {pool.submit(_check, e, known.get(e["path"])): e for e in entries}
+        for future in as_completed(futures):
+            entry = futures[future]
+            problem, hashed, record = future.result()
+            if problem:
+                report["problems"].append({"path": entry["path"], "problem": problem})
+            if record:
+                records[entry["path"]] = record
+            if hashed is not None:
+                report["hashed_files"] += 1
+                report["hashed_bytes"] += hashed
+            elif record:
+                report["cached_files"] += 1
+            if entry["type"] == "file":
+                done += entry["size"] or 0
+                if on_progress:
+                    on_progress(done, total)
+
+    report["problems"].sort(key=lambda p: p["path"])
+    report["seconds"] = time.monotonic() - started
+    if report["seconds"] > 0:
+        report["throughput"] = report["hashed_bytes"] / report["seconds"]
+    try:
+        _save_cache(name, version, records, cache)
+    except OSError:
+        pass
+    return report
+
+
+def format_report(report):
+    rate = (
+        f" at {pkgdb.format_size(report['throughput'])}/s" if report["throughput"] else ""
+    )
+    summary = (
+        f"Verified {report['entries']} entries of {report['package']} {report['version']}"
+        f" in {report['seconds']:.1f} s: {report['hashed_files']} files"
+        f" ({pkgdb.format_size(report['hashed_bytes'])}) read{rate},"
+        f" {report['cached_files']} unchanged since the last check"
+    )
+    if not report["problems"]:
+        return summary
+    lines = [summary, f"Problems ({len(report['problems'])}):"]
+    lines += [f"  {p['path']}: {p['problem']}" for p in report["problems"][:SHOWN_PROBLEMS]]
+    if len(report["problems"]) > SHOWN_PROBLEMS:
+        lines.append(f"  ... and {len(report['problems']) - SHOWN_PROBLEMS} more")
+    return "\n".join(lines)
@@ -0,0 +1,177 @@
+"""Side-by-side Resolve versions under /opt with an instantly switchable /opt/resolve.
+
+Layout::
+
+    /opt/resolve-20.0.1/              package-owned install root
+    /opt/resolve-19.1.4-studio/       retained root from an earlier install
+    /opt/resolve-versions/current ->  ../resolve-20.0.1   (user-owned)
+    /opt/resolve ->                   resolve-versions/current
+
+Only ``current`` changes when switching, and its directory belongs to the
+user, so a switch is a single unprivileged symlink rename.
+"""
+import os
+import re
+import shlex
+
+from davinci_installer import pkgdb
+
+OPT_DIR = "/opt"
+ACTIVE_LINK = os.path.join(OPT_DIR, "resolve")
+SWITCH_DIR = os.path.join(OPT_DIR, "resolve-versions")
+CURRENT_LINK = os.path.join(SWITCH_DIR, "current")
+
+_ROOT_RE = re.compile(r"^resolve-(\d+(?:\.\d+)*(?:beta\d*)?)(-studio)?$")
+_VERSION_RE = re.compile(r"(\d+(?:\.\d+)*)(?:beta(\d*))?")
+
+
+def root_name(version, studio):
+    return f"resolve-{version}-studio" if studio else f"resolve-{version}"
+
+
+def parse_root_name(name):
+    m = _ROOT_RE.match(name)
+    if not m:
+        return None
+    return {"version": m.group(1), "studio": bool(m.group(2))}
+
+
+def version_key(version):
+    """Sort key; a beta sorts after the previous release and before its own."""
+    m = _VERSION_RE.match(version)
+    if not m:
+        return (tuple(int(p) for p in re.findall(r"\d+", version)), 1, 0)
+    release = tuple(int(p) for p in m.group(1).split("."))
+    if m.group(2) is None:
+        return (release, 1, 0)
+    return (release, 0, int(m.group(2) or 0))
+
+
+def label(info):
+    return f"{info['version']} Studio" if info["studio"] else info["version"]
+
+
+def package_root(query_info=pkgdb.query_info):
+    """Name of the install root owned by the installed package, if any."""
+    for pkg, studio in (("davinci-resolve", False), ("davinci-resolve-studio", True)):
+        version = query_info(pkg).get("Version")
+        if version:
+            return root_name(version.rsplit("-", 1)[0].split(":")[-1], studio)
+    return None
+
+
+def active_root(current_link=CURRENT_LINK):
+    try:
+        return os.path.basename(os.readlink(current_link))
+    except OSError:
+        return None
+
+
+def installed_versions(opt_dir=OPT_DIR, current_link=CURRENT_LINK):
+    """Return every complete install root, newest first."""
+    active = active_root(current_link)
+    found = []
+    try:
+        names = os.listdir(opt_dir)
+    except OSError:
+        return found
+    for name in names:
+        info = parse_root_name(name)
+        path = os.path.join(opt_dir, name)
+        if not info or os.path.islink(path):
+            continue
+        if not os.path.isfile(os.path.join(path, "bin", "resolve")):
+            continue
+        info.update(name=name, path=path, active=(name == active))
+        found.append(info)
+    found.sort(key=lambda i: (version_key(i["version"]), i["studio"]), reverse=True)
+    return found
+
+
+def switch(name, current_link=CURRENT_LINK):
+    """Atomically point ``current`` at another install root."""
+    tmp = current_link + ".tmp"
+    try:
+        os.unlink(tmp)
+    except FileNotFoundError:
+        pass
+    os.symlink(os.path.join("..", name), tmp)
+    os.replace(tmp, current_link)
+
+
+# ── Privileged shell snippets (run through the sudo wrapper) ────────
+
+def activate_script(name, owner, opt_dir=OPT_DIR):
+    """Create the switch directory, point it at ``name`` and link /opt/resolve.
+
+    A real /opt/resolve directory left over from the single-root layout is
+    removed if empty and moved aside otherwise.
+    """
+    switch_dir = os.path.join(opt_dir, "resolve-versions")
+    current = os.path.join(switch_dir, "current")
+    active = os.path.join(opt_dir, "resolve")
+    tmp = os.path.join(opt_dir, ".resolve.tmp")
+    q = shlex.quote
+    return " && ".join([
+        f"mkdir -p {q(switch_dir)}",
+        f"ln -sfn {q(os.path.join('..', name))} {q(current)}",
+        f"chown -h {q(owner)} {q(switch_dir)} {q(current)}",
+        f"{{ [ -L {q(active)} ] || [ ! -d {q(active)} ] || rmdir {q(active)} 2>/dev/null"
+        f" || mv -T {q(active)} {q(active)}.orphaned-$(date +%s); }}",
+        f"ln -sfn resolve-versions/current {q(tmp)}",
+        f"mv -Tf {q(tmp)} {q(active)}",
+    ])
+
+
+def deactivate_script(opt_dir=OPT_DIR):
+    active = os.path.join(opt_dir, "resolve")
+    q = shlex.quote
+    return (
+        f"{{ [ ! -L {q(active)} ] || rm -f {q(active)}; }}"
+        f" && rm -rf {q(os.path.join(opt_dir, 'resolve-versions'))}"
+    )
+
+
+def _keep_path(name, opt_dir):
+    return os.path.join(opt_dir, f".{name}.keep")
+
+
+def snapshot_script(name, opt_dir=OPT_DIR):
+    """Hardlink-copy a root so it survives pacman removing its files on upgrade."""
+    keep = shlex.quote(_keep_path(name, opt_dir))
+    src = shlex.quote(os.path.join(opt_dir, name))
+    return f"rm -rf {keep} && cp -al {src} {keep}"
+
+
+def restore_script(name, opt_dir=OPT_DIR):
+    keep = shlex.quote(_keep_path(name, opt_dir))
+    dest = shlex.quote(os.path.join(opt_dir, name))
+    return f"rm -rf {dest} && mv -T {keep} {dest}"
+
+
+def discard_script(name, opt_dir=OPT_DIR):
+    return f"rm -rf {shlex.quote(_keep_path(name, opt_dir))}"
+
+
+def prune_script(names, opt_dir=OPT_DIR):
+    paths = " ".join(shlex.quote(os.path.join(opt_dir, n)) for n in names)
+    return f"rm -rf {paths}"
+
+
+def reclaimable_size(path):
+    """Bytes freed by deleting a tree.
+
+    Inodes that still have links outside the tree (e.g. files shared with
+    another version) are not counted.
+    """
+    links = {}
+    for dirpath, dirnames, filenames in os.walk(path):
+        for name in dirnames + filenames:
+            try:
+                st = os.lstat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            key = (st.st_dev, st.st_ino)
+            seen, nlink, size = links.get(key, (0, st.st_nlink, st.st_blocks * 512))
+            links[key] = (seen + 1, nlink, size)
+    return sum(size for seen, nlink, size in links.values() if seen >= nlink)
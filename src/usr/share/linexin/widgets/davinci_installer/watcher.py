@@ -0,0 +1,109 @@
+"""Watches download directories for finished DaVinci Resolve installers."""
+import os
+import threading
+
+from gi.repository import Gio, GLib
+
+from davinci_installer import runfile
+
+# A download counts as finished once its size stops changing for this long
+SETTLE_MS = 2000
+
+
+class InstallerWatcher:
+    """Monitors directories and reports pre-validated installer candidates.
+
+    ``on_ready`` is called on the main loop with a dict holding the path,
+    parsed version/edition, size, SHA-256 and validation result.
+    """
+
+    def __init__(self, directories, on_ready, kinds=("run",)):
+        self.directories = [d for d in directories if os.path.isdir(d)]
+        self.on_ready = on_ready
+        self.kinds = kinds
+        self._monitors = []
+        self._pending = {}
+        self._seen = {}
+
+    @staticmethod
+    def default_directories(settings):
+        dirs = []
+        if settings.get("watch_downloads"):
+            download = GLib.get_user_special_dir(GLib.UserDirectory.DIRECTORY_DOWNLOAD)
+            dirs.append(download or os.path.join(os.path.expanduser("~"), "Downloads"))
+        dirs.extend(os.path.expanduser(d) for d in settings.get("watch_dirs", []))
+        return dirs
+
+    def start(self):
+        for directory in self.directories:
+            gfile = Gio.File.new_for_path(directory)
+            try:
+                monitor = gfile.monitor_directory(Gio.FileMonitorFlags.WATCH_MOVES, None)
+            except GLib.Error:
+                continue
+            monitor.connect("changed", self._on_changed)
+            self._monitors.append(monitor)
+        # Pick up installers that finished downloading before we started
+        for directory in self.directories:
+            try:
+                names = os.listdir(directory)
+            except OSError:
+                continue
+            for name in names:
+                self._consider(os.path.join(directory, name))
+
+    def stop(self):
+        for monitor in self._monitors:
+            monitor.cancel()
+        self._monitors = []
+        for source_id in self._pending.values():
+            GLib.source_remove(source_id)
+        self._pending = {}
+
+    def _on_changed(self, _monitor, gfile, other, event):
+        if event in (Gio.FileMonitorEvent.RENAMED, Gio.FileMonitorEvent.MOVED_IN) and other:
+            # Browsers rename foo.run.part -> foo.run when done
+            self._consider(other.get_path())
+        elif event in (
+            Gio.FileMonitorEvent.CREATED,
+            Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+            Gio.FileMonitorEvent.MOVED_IN,
+        ):
+            self._consider(gfile.get_path())
+
+    def _consider(self, path):
+        if not path:
+            return
+        name = os.path.basename(path)
+        parsed = runfile.parse_installer_name(name)
+        if not parsed or parsed["kind"] not in self.kinds:
+            return
+        if path in self._pending:
+            GLib.source_remove(self._pending.pop(path))
+        self._pending[path] = GLib.timeout_add(SETTLE_MS, self._settle, path, None)
+
+    def _settle(self, path, last_size):
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._pending.pop(path, None)
+            return False
+        partial = any(os.path.exists(path + s) for s in runfile.PARTIAL_SUFFIXES)
+        if partial or not st.st_size or st.st_size != last_size:
+            self._pending[path] = GLib.timeout_add(SETTLE_MS, self._settle, path, st.st_size)
+            return False
+        self._pending.pop(path, None)
+        key = (st.st_size, st.st_mtime_ns)
+        if self._seen.get(path) == key:
+            return False
+        self._seen[path] = key
+        threading.Thread(target=self._inspect, args=(path,), daemon=True).start()
+        return False
+
+    def _inspect(self, path):
+        candidate = dict(runfile.parse_installer_name(path), path=path)
+        candidate["validation"] = runfile.validate(path)
+        candidate["size"] = os.path.getsize(path)
+        if candidate["validation"]["ok"]:
+            candidate["sha256"] = runfile.fingerprint(path)
+        GLib.idle_add(self.on_ready, candidate)
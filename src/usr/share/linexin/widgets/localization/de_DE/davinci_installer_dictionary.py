@@ -28,4 +28,134 @@ translations = {
     "Authentication Failed": "Authentifizierung fehlgeschlagen",
     "Incorrect password.": "Falsches Passwort.",
     "Installation failed": "Installation fehlgeschlagen",
+    "Check GPU readiness": "GPU-Bereitschaft prüfen",
+    "Resolve is ready to launch": "Resolve ist startbereit",
+    "OpenCL setup needs attention": "OpenCL-Einrichtung erfordert Aufmerksamkeit",
+    "Removal in progress. Do NOT close the app.": "Entfernung läuft. Schließen Sie die App NICHT.",
+    "Removing {}...": "{} wird entfernt...",
+    "Removal failed": "Entfernung fehlgeschlagen",
+    "{} removed": "{} entfernt",
+    "Reclaimed {} in {:.0f} s.": "{} in {:.0f} s freigegeben.",
+    "DaVinci Resolve is not installed as a package.": "DaVinci Resolve ist nicht als Paket installiert.",
+    "Active version": "Aktive Version",
+    "Remove old versions": "Alte Versionen entfernen",
+    "Remove old versions?": "Alte Versionen entfernen?",
+    "Removing old versions...": "Alte Versionen werden entfernt...",
+    "Old versions removed": "Alte Versionen entfernt",
+    "Could not switch version": "Version konnte nicht gewechselt werden",
+    "Install": "Installieren",
+    "{} {} is ready to install": "{} {} ist bereit zur Installation",
+    "DaVinci Resolve Installer (*.run, *.zip)": "DaVinci Resolve-Installationsprogramm (*.run, *.zip)",
+    "Extracting {}...": "{} wird entpackt...",
+    "Step {}: Extracting DaVinci Resolve...": "Schritt {}: DaVinci Resolve wird entpackt...",
+    "Installer (.run)": "Installationsprogramm (.run)",
+    "Extracted payload": "Entpackte Nutzdaten",
+    "Built package": "Erstelltes Paket",
+    "Installed files": "Installierte Dateien",
+    "{} {}: needs {}, {} free": "{} {}: benötigt {}, {} frei",
+    "Not enough disk space": "Nicht genügend Speicherplatz",
+    "Reclaim space": "Speicherplatz freigeben",
+    "Nothing to reclaim": "Nichts freizugeben",
+    "Total: {}": "Gesamt: {}",
+    "No old DaVinci Resolve or opencl-amd packages were found.": "Es wurden keine alten DaVinci Resolve- oder opencl-amd-Pakete gefunden.",
+    "Removing old packages...": "Alte Pakete werden entfernt...",
+    "Old packages removed": "Alte Pakete entfernt",
+    "The offline bundle in {} lacks: {}": "Dem Offline-Paket in {} fehlt: {}",
+    "Step {}: Building DaVinci Resolve...": "Schritt {}: DaVinci Resolve wird erstellt...",
+    "makepkg did not produce a package": "makepkg hat kein Paket erzeugt",
+    "The disk ran out of space": "Der Datenträger ist voll",
+    "Free up space or choose a build directory on a larger drive, then try again.": "Geben Sie Speicherplatz frei oder wählen Sie ein Build-Verzeichnis auf einem größeren Laufwerk und versuchen Sie es erneut.",
+    "The package database is locked": "Die Paketdatenbank ist gesperrt",
+    "Another package manager is running. Wait for it to finish; if none is running, remove /var/lib/pacman/db.lck.": "Ein anderer Paketmanager läuft. Warten Sie, bis er fertig ist; läuft keiner, entfernen Sie /var/lib/pacman/db.lck.",
+    "A PGP signature could not be verified": "Eine PGP-Signatur konnte nicht überprüft werden",
+    "Import the missing key with 'gpg --recv-keys {0}' and try again.": "Importieren Sie den fehlenden Schlüssel mit 'gpg --recv-keys {0}' und versuchen Sie es erneut.",
+    "A package signature is not trusted": "Einer Paketsignatur wird nicht vertraut",
+    "Update the keyring with 'sudo pacman -Sy archlinux-keyring' and run 'sudo pacman-key --populate'.": "Aktualisieren Sie den Schlüsselbund mit 'sudo pacman -Sy archlinux-keyring' und führen Sie 'sudo pacman-key --populate' aus.",
+    "Files of {0} already exist on the system": "Dateien von {0} sind bereits auf dem System vorhanden",
+    "Another package owns these files. Remove the conflicting package or, if the files are leftovers, delete them and try again.": "Diese Dateien gehören einem anderen Paket. Entfernen Sie das kollidierende Paket oder löschen Sie übrig gebliebene Dateien und versuchen Sie es erneut.",
+    "{0} conflicts with an installed package": "{0} kollidiert mit einem installierten Paket",
+    "Remove the conflicting package, then run the installation again.": "Entfernen Sie das kollidierende Paket und starten Sie die Installation erneut.",
+    "The package {0} could not be found": "Das Paket {0} wurde nicht gefunden",
+    "Update the package databases with 'sudo pacman -Syu' and check that the [extra] repository is enabled in /etc/pacman.conf.": "Aktualisieren Sie die Paketdatenbanken mit 'sudo pacman -Syu' und prüfen Sie, ob das Repository [extra] in /etc/pacman.conf aktiviert ist.",
+    "A download failed": "Ein Download ist fehlgeschlagen",
+    "Check the network connection, or install from an offline bundle.": "Prüfen Sie die Netzwerkverbindung oder installieren Sie aus einem Offline-Paket.",
+    "A downloaded package is corrupted": "Ein heruntergeladenes Paket ist beschädigt",
+    "Remove it from /var/cache/pacman/pkg and try again.": "Entfernen Sie es aus /var/cache/pacman/pkg und versuchen Sie es erneut.",
+    "Administrator authentication failed": "Administrator-Authentifizierung fehlgeschlagen",
+    "Check the password and try again.": "Prüfen Sie das Passwort und versuchen Sie es erneut.",
+    "Building the package failed in {0}()": "Das Erstellen des Pakets ist in {0}() fehlgeschlagen",
+    "See the log excerpt below; the installer file may be incomplete or damaged.": "Siehe Protokollauszug unten; die Installationsdatei ist möglicherweise unvollständig oder beschädigt.",
+    "About {} left, based on earlier installs": "Noch etwa {}, basierend auf früheren Installationen",
+    "Show progress": "Fortschritt anzeigen",
+    "Hide progress": "Fortschritt ausblenden",
+    "Search the log": "Protokoll durchsuchen",
+    "Previous match": "Vorheriger Treffer",
+    "Next match": "Nächster Treffer",
+    "Follow new output": "Neuer Ausgabe folgen",
+    "View previous logs": "Frühere Protokolle anzeigen",
+    "View log": "Protokoll anzeigen",
+    "Installation": "Installation",
+    "Build": "Build",
+    "Removal": "Entfernung",
+    "succeeded": "erfolgreich",
+    "failed": "fehlgeschlagen",
+    "interrupted": "unterbrochen",
+    "No logs yet": "Noch keine Protokolle",
+    "Logs are kept for every install and removal from now on.": "Ab jetzt wird für jede Installation und Entfernung ein Protokoll aufbewahrt.",
+    "Install logs": "Installationsprotokolle",
+    "Full speed": "Volle Geschwindigkeit",
+    "In the background": "Im Hintergrund",
+    "Only when idle": "Nur im Leerlauf",
+    "Install priority": "Installationspriorität",
+    "Verify installation": "Installation überprüfen",
+    "Verifying installation": "Installation wird überprüft",
+    "Checking the installed files against the package...": "Installierte Dateien werden mit dem Paket verglichen...",
+    "Close": "Schließen",
+    "Verification failed": "Überprüfung fehlgeschlagen",
+    "{} files don't match the package": "{} Dateien stimmen nicht mit dem Paket überein",
+    "Reinstall DaVinci Resolve to repair them.": "Installieren Sie DaVinci Resolve neu, um sie zu reparieren.",
+    "All installed files are intact": "Alle installierten Dateien sind intakt",
+    "Step {}: Verifying installed files...": "Schritt {}: Installierte Dateien werden überprüft...",
+    "{} installed files don't match the package:": "{} installierte Dateien stimmen nicht mit dem Paket überein:",
+    "Install {} {} ({}) from {}": "{} {} ({}) aus {} installieren",
+    "Priority: {}": "Priorität: {}",
+    "Space:": "Speicherplatz:",
+    "Staging in {}": "Bereitstellung in {}",
+    "The installer is moved there": "Das Installationsprogramm wird dorthin verschoben",
+    "The installer extracted by an earlier attempt is reused": "Das bei einem früheren Versuch entpackte Installationsprogramm wird wiederverwendet",
+    "The installer extracted next to the zip is reused": "Das neben der ZIP-Datei entpackte Installationsprogramm wird wiederverwendet",
+    "The installer is extracted from the zip": "Das Installationsprogramm wird aus der ZIP-Datei entpackt",
+    "Payload unpacked with {}": "Nutzdaten werden mit {} entpackt",
+    "Unchanged files are shared with {}": "Unveränderte Dateien werden mit {} geteilt",
+    "{} is kept next to the new version": "{} bleibt neben der neuen Version erhalten",
+    "Dependencies:": "Abhängigkeiten:",
+    "From the offline bundle in {}": "Aus dem Offline-Paket in {}",
+    "Missing from the bundle: {}": "Fehlen im Paket: {}",
+    "Could not ask pacman which are installed": "pacman konnte nicht nach installierten Paketen gefragt werden",
+    "To install: {}": "Zu installieren: {}",
+    "All installed already": "Alle bereits installiert",
+    "opencl-amd is built from AUR": "opencl-amd wird aus dem AUR gebaut",
+    "Added to IgnorePkg: {}": "Zu IgnorePkg hinzugefügt: {}",
+    "Stages:": "Phasen:",
+    "total": "gesamt",
+    "No earlier install to predict the duration from": "Keine frühere Installation, aus der sich die Dauer schätzen lässt",
+    "Preview": "Vorschau",
+    "Install plan": "Installationsplan",
+    "Working out the install plan...": "Installationsplan wird erstellt...",
+    "Back": "Zurück",
+    "Copy as JSON": "Als JSON kopieren",
+    "Could not plan the install": "Die Installation konnte nicht geplant werden",
+    "another install": "eine andere Installation",
+    "Waiting for {} to finish ({} in the queue before this one)...": "Warten, bis {} fertig ist ({} in der Warteschlange davor)...",
+    "Waiting for the package manager...": "Warten auf die Paketverwaltung...",
+    "{} is not a valid package version": "{} ist keine gültige Paketversion",
+    "Unknown placeholder in the recipe: {}": "Unbekannter Platzhalter im Rezept: {}",
+    "No value for recipe placeholder: {}": "Kein Wert für den Rezept-Platzhalter: {}",
+    "Checking the recipe took longer than {} seconds": "Die Prüfung des Rezepts dauerte länger als {} Sekunden",
+    "The recipe has a syntax error: {}": "Das Rezept enthält einen Syntaxfehler: {}",
+    "The recipe could not be read: {}": "Das Rezept konnte nicht gelesen werden: {}",
+    "The recipe declares {} as {!r} instead of {!r}": "Das Rezept setzt {} auf {!r} statt {!r}",
+    "The recipe doesn't depend on {}": "Das Rezept hängt nicht von {} ab",
+    "Import the missing key with 'gpg --recv-keys' (makepkg lists its ID above the error) and try again.": "Importieren Sie den fehlenden Schlüssel mit 'gpg --recv-keys' (makepkg nennt seine ID über dem Fehler) und versuchen Sie es erneut.",
+    "Could not create a staging directory on {}": "Auf {} konnte kein Staging-Verzeichnis angelegt werden",
 }
@@ -28,4 +28,134 @@ translations = {
     "Authentication Failed": "Authentication Failed",
     "Incorrect password.": "Incorrect password.",
     "Installation failed": "Installation failed",
+    "Check GPU readiness": "Check GPU readiness",
+    "Resolve is ready to launch": "Resolve is ready to launch",
+    "OpenCL setup needs attention": "OpenCL setup needs attention",
+    "Removal in progress. Do NOT close the app.": "Removal in progress. Do NOT close the app.",
+    "Removing {}...": "Removing {}...",
+    "Removal failed": "Removal failed",
+    "{} removed": "{} removed",
+    "Reclaimed {} in {:.0f} s.": "Reclaimed {} in {:.0f} s.",
+    "DaVinci Resolve is not installed as a package.": "DaVinci Resolve is not installed as a package.",
+    "Active version": "Active version",
+    "Remove old versions": "Remove old versions",
+    "Remove old versions?": "Remove old versions?",
+    "Removing old versions...": "Removing old versions...",
+    "Old versions removed": "Old versions removed",
+    "Could not switch version": "Could not switch version",
+    "Install": "Install",
+    "{} {} is ready to install": "{} {} is ready to install",
+    "DaVinci Resolve Installer (*.run, *.zip)": "DaVinci Resolve Installer (*.run, *.zip)",
+    "Extracting {}...": "Extracting {}...",
+    "Step {}: Extracting DaVinci Resolve...": "Step {}: Extracting DaVinci Resolve...",
+    "Installer (.run)": "Installer (.run)",
+    "Extracted payload": "Extracted payload",
+    "Built package": "Built package",
+    "Installed files": "Installed files",
+    "{} {}: needs {}, {} free": "{} {}: needs {}, {} free",
+    "Not enough disk space": "Not enough disk space",
+    "Reclaim space": "Reclaim space",
+    "Nothing to reclaim": "Nothing to reclaim",
+    "Total: {}": "Total: {}",
+    "No old DaVinci Resolve or opencl-amd packages were found.": "No old DaVinci Resolve or opencl-amd packages were found.",
+    "Removing old packages...": "Removing old packages...",
+    "Old packages removed": "Old packages removed",
+    "The offline bundle in {} lacks: {}": "The offline bundle in {} lacks: {}",
+    "Step {}: Building DaVinci Resolve...": "Step {}: Building DaVinci Resolve...",
+    "makepkg did not produce a package": "makepkg did not produce a package",
+    "The disk ran out of space": "The disk ran out of space",
+    "Free up space or choose a build directory on a larger drive, then try again.": "Free up space or choose a build directory on a larger drive, then try again.",
+    "The package database is locked": "The package database is locked",
+    "Another package manager is running. Wait for it to finish; if none is running, remove /var/lib/pacman/db.lck.": "Another package manager is running. Wait for it to finish; if none is running, remove /var/lib/pacman/db.lck.",
+    "A PGP signature could not be verified": "A PGP signature could not be verified",
+    "Import the missing key with 'gpg --recv-keys {0}' and try again.": "Import the missing key with 'gpg --recv-keys {0}' and try again.",
+    "A package signature is not trusted": "A package signature is not trusted",
+    "Update the keyring with 'sudo pacman -Sy archlinux-keyring' and run 'sudo pacman-key --populate'.": "Update the keyring with 'sudo pacman -Sy archlinux-keyring' and run 'sudo pacman-key --populate'.",
+    "Files of {0} already exist on the system": "Files of {0} already exist on the system",
+    "Another package owns these files. Remove the conflicting package or, if the files are leftovers, delete them and try again.": "Another package owns these files. Remove the conflicting package or, if the files are leftovers, delete them and try again.",
+    "{0} conflicts with an installed package": "{0} conflicts with an installed package",
+    "Remove the conflicting package, then run the installation again.": "Remove the conflicting package, then run the installation again.",
+    "The package {0} could not be found": "The package {0} could not be found",
+    "Update the package databases with 'sudo pacman -Syu' and check that the [extra] repository is enabled in /etc/pacman.conf.": "Update the package databases with 'sudo pacman -Syu' and check that the [extra] repository is enabled in /etc/pacman.conf.",
+    "A download failed": "A download failed",
+    "Check the network connection, or install from an offline bundle.": "Check the network connection, or install from an offline bundle.",
+    "A downloaded package is corrupted": "A downloaded package is corrupted",
+    "Remove it from /var/cache/pacman/pkg and try again.": "Remove it from /var/cache/pacman/pkg and try again.",
+    "Administrator authentication failed": "Administrator authentication failed",
+    "Check the password and try again.": "Check the password and try again.",
+    "Building the package failed in {0}()": "Building the package failed in {0}()",
+    "See the log excerpt below; the installer file may be incomplete or damaged.": "See the log excerpt below; the installer file may be incomplete or damaged.",
+    "About {} left, based on earlier installs": "About {} left, based on earlier installs",
+    "Show progress": "Show progress",
+    "Hide progress": "Hide progress",
+    "Search the log": "Search the log",
+    "Previous match": "Previous match",
+    "Next match": "Next match",
+    "Follow new output": "Follow new output",
+    "View previous logs": "View previous logs",
+    "View log": "View log",
+    "Installation": "Installation",
+    "Build": "Build",
+    "Removal": "Removal",
+    "succeeded": "succeeded",
+    "failed": "failed",
+    "interrupted": "interrupted",
+    "No logs yet": "No logs yet",
+    "Logs are kept for every install and removal from now on.": "Logs are kept for every install and removal from now on.",
+    "Install logs": "Install logs",
+    "Full speed": "Full speed",
+    "In the background": "In the background",
+    "Only when idle": "Only when idle",
+    "Install priority": "Install priority",
+    "Verify installation": "Verify installation",
+    "Verifying installation": "Verifying installation",
+    "Checking the installed files against the package...": "Checking the installed files against the package...",
+    "Close": "Close",
+    "Verification failed": "Verification failed",
+    "{} files don't match the package": "{} files don't match the package",
+    "Reinstall DaVinci Resolve to repair them.": "Reinstall DaVinci Resolve to repair them.",
+    "All installed files are intact": "All installed files are intact",
+    "Step {}: Verifying installed files...": "Step {}: Verifying installed files...",
+    "{} installed files don't match the package:": "{} installed files don't match the package:",
+    "Install {} {} ({}) from {}": "Install {} {} ({}) from {}",
+    "Priority: {}": "Priority: {}",
+    "Space:": "Space:",
+    "Staging in {}": "Staging in {}",
+    "The installer is moved there": "The installer is moved there",
+    "The installer extracted by an earlier attempt is reused": "The installer extracted by an earlier attempt is reused",
+    "The installer extracted next to the zip is reused": "The installer extracted next to the zip is reused",
+    "The installer is extracted from the zip": "The installer is extracted from the zip",
+    "Payload unpacked with {}": "Payload unpacked with {}",
+    "Unchanged files are shared with {}": "Unchanged files are shared with {}",
+    "{} is kept next to the new version": "{} is kept next to the new version",
+    "Dependencies:": "Dependencies:",
+    "From the offline bundle in {}": "From the offline bundle in {}",
+    "Missing from the bundle: {}": "Missing from the bundle: {}",
+    "Could not ask pacman which are installed": "Could not ask pacman which are installed",
+    "To install: {}": "To install: {}",
+    "All installed already": "All installed already",
+    "opencl-amd is built from AUR": "opencl-amd is built from AUR",
+    "Added to IgnorePkg: {}": "Added to IgnorePkg: {}",
+    "Stages:": "Stages:",
+    "total": "total",
+    "No earlier install to predict the duration from": "No earlier install to predict the duration from",
+    "Preview": "Preview",
+    "Install plan": "Install plan",
+    "Working out the install plan...": "Working out the install plan...",
+    "Back": "Back",
+    "Copy as JSON": "Copy as JSON",
+    "Could not plan the install": "Could not plan the install",
+    "another install": "another install",
+    "Waiting for {} to finish ({} in the queue before this one)...": "Waiting for {} to finish ({} in the queue before this one)...",
+    "Waiting for the package manager...": "Waiting for the package manager...",
+    "{} is not a valid package version": "{} is not a valid package version",
+    "Unknown placeholder in the recipe: {}": "Unknown placeholder in the recipe: {}",
+    "No value for recipe placeholder: {}": "No value for recipe placeholder: {}",
+    "Checking the recipe took longer than {} seconds": "Checking the recipe took longer than {} seconds",
+    "The recipe has a syntax error: {}": "The recipe has a syntax error: {}",
+    "The recipe could not be read: {}": "The recipe could not be read: {}",
+    "The recipe declares {} as {!r} instead of {!r}": "The recipe declares {} as {!r} instead of {!r}",
+    "The recipe doesn't depend on {}": "The recipe doesn't depend on {}",
+    "Import the missing key with 'gpg --recv-keys' (makepkg lists its ID above the error) and try again.": "Import the missing key with 'gpg --recv-keys' (makepkg lists its ID above the error) and try again.",
+    "Could not create a staging directory on {}": "Could not create a staging directory on {}",
 }
@@ -28,4 +28,134 @@ translations = {
     "Authentication Failed": "Autenticación fallida",
     "Incorrect password.": "Contraseña incorrecta.",
     "Installation failed": "Instalación fallida",
+    "Check GPU readiness": "Comprobar preparación de la GPU",
+    "Resolve is ready to launch": "Resolve está listo para iniciarse",
+    "OpenCL setup needs attention": "La configuración de OpenCL requiere atención",
+    "Removal in progress. Do NOT close the app.": "Eliminación en curso. NO cierre la aplicación.",
+    "Removing {}...": "Eliminando {}...",
+    "Removal failed": "La eliminación falló",
+    "{} removed": "{} eliminado",
+    "Reclaimed {} in {:.0f} s.": "Se liberaron {} en {:.0f} s.",
+    "DaVinci Resolve is not installed as a package.": "DaVinci Resolve no está instalado como paquete.",
+    "Active version": "Versión activa",
+    "Remove old versions": "Eliminar versiones antiguas",
+    "Remove old versions?": "¿Eliminar versiones antiguas?",
+    "Removing old versions...": "Eliminando versiones antiguas...",
+    "Old versions removed": "Versiones antiguas eliminadas",
+    "Could not switch version": "No se pudo cambiar de versión",
+    "Install": "Instalar",
+    "{} {} is ready to install": "{} {} está listo para instalarse",
+    "DaVinci Resolve Installer (*.run, *.zip)": "Instalador de DaVinci Resolve (*.run, *.zip)",
+    "Extracting {}...": "Extrayendo {}...",
+    "Step {}: Extracting DaVinci Resolve...": "Paso {}: Extrayendo DaVinci Resolve...",
+    "Installer (.run)": "Instalador (.run)",
+    "Extracted payload": "Contenido extraído",
+    "Built package": "Paquete compilado",
+    "Installed files": "Archivos instalados",
+    "{} {}: needs {}, {} free": "{} {}: necesita {}, {} libres",
+    "Not enough disk space": "No hay suficiente espacio en disco",
+    "Reclaim space": "Liberar espacio",
+    "Nothing to reclaim": "Nada que liberar",
+    "Total: {}": "Total: {}",
+    "No old DaVinci Resolve or opencl-amd packages were found.": "No se encontraron paquetes antiguos de DaVinci Resolve ni de opencl-amd.",
+    "Removing old packages...": "Eliminando paquetes antiguos...",
+    "Old packages removed": "Paquetes antiguos eliminados",
+    "The offline bundle in {} lacks: {}": "Al paquete sin conexión en {} le falta: {}",
+    "Step {}: Building DaVinci Resolve...": "Paso {}: Compilando DaVinci Resolve...",
+    "makepkg did not produce a package": "makepkg no generó ningún paquete",
+    "The disk ran out of space": "El disco se quedó sin espacio",
+    "Free up space or choose a build directory on a larger drive, then try again.": "Libere espacio o elija un directorio de compilación en una unidad más grande e inténtelo de nuevo.",
+    "The package database is locked": "La base de datos de paquetes está bloqueada",
+    "Another package manager is running. Wait for it to finish; if none is running, remove /var/lib/pacman/db.lck.": "Otro gestor de paquetes está en ejecución. Espere a que termine; si no hay ninguno, elimine /var/lib/pacman/db.lck.",
+    "A PGP signature could not be verified": "No se pudo verificar una firma PGP",
+    "Import the missing key with 'gpg --recv-keys {0}' and try again.": "Importe la clave que falta con 'gpg --recv-keys {0}' e inténtelo de nuevo.",
+    "A package signature is not trusted": "La firma de un paquete no es de confianza",
+    "Update the keyring with 'sudo pacman -Sy archlinux-keyring' and run 'sudo pacman-key --populate'.": "Actualice el llavero con 'sudo pacman -Sy archlinux-keyring' y ejecute 'sudo pacman-key --populate'.",
+    "Files of {0} already exist on the system": "Los archivos de {0} ya existen en el sistema",
+    "Another package owns these files. Remove the conflicting package or, if the files are leftovers, delete them and try again.": "Estos archivos pertenecen a otro paquete. Elimine el paquete en conflicto o, si son restos, bórrelos e inténtelo de nuevo.",
+    "{0} conflicts with an installed package": "{0} entra en conflicto con un paquete instalado",
+    "Remove the conflicting package, then run the installation again.": "Elimine el paquete en conflicto y vuelva a ejecutar la instalación.",
+    "The package {0} could not be found": "No se encontró el paquete {0}",
+    "Update the package databases with 'sudo pacman -Syu' and check that the [extra] repository is enabled in /etc/pacman.conf.": "Actualice las bases de datos con 'sudo pacman -Syu' y compruebe que el repositorio [extra] esté habilitado en /etc/pacman.conf.",
+    "A download failed": "Falló una descarga",
+    "Check the network connection, or install from an offline bundle.": "Compruebe la conexión de red o instale desde un paquete sin conexión.",
+    "A downloaded package is corrupted": "Un paquete descargado está dañado",
+    "Remove it from /var/cache/pacman/pkg and try again.": "Elimínelo de /var/cache/pacman/pkg e inténtelo de nuevo.",
+    "Administrator authentication failed": "Falló la autenticación de administrador",
+    "Check the password and try again.": "Compruebe la contraseña e inténtelo de nuevo.",
+    "Building the package failed in {0}()": "La compilación del paquete falló en {0}()",
+    "See the log excerpt below; the installer file may be incomplete or damaged.": "Consulte el extracto del registro a continuación; el archivo del instalador puede estar incompleto o dañado.",
+    "About {} left, based on earlier installs": "Quedan unos {}, según instalaciones anteriores",
+    "Show progress": "Mostrar progreso",
+    "Hide progress": "Ocultar progreso",
+    "Search the log": "Buscar en el registro",
+    "Previous match": "Coincidencia anterior",
+    "Next match": "Siguiente coincidencia",
+    "Follow new output": "Seguir la salida nueva",
+    "View previous logs": "Ver registros anteriores",
+    "View log": "Ver registro",
+    "Installation": "Instalación",
+    "Build": "Compilación",
+    "Removal": "Eliminación",
+    "succeeded": "correcto",
+    "failed": "fallido",
+    "interrupted": "interrumpido",
+    "No logs yet": "Aún no hay registros",
+    "Logs are kept for every install and removal from now on.": "A partir de ahora se guarda un registro de cada instalación y eliminación.",
+    "Install logs": "Registros de instalación",
+    "Full speed": "A toda velocidad",
+    "In the background": "En segundo plano",
+    "Only when idle": "Solo en reposo",
+    "Install priority": "Prioridad de instalación",
+    "Verify installation": "Verificar instalación",
+    "Verifying installation": "Verificando la instalación",
+    "Checking the installed files against the package...": "Comparando los archivos instalados con el paquete...",
+    "Close": "Cerrar",
+    "Verification failed": "La verificación falló",
+    "{} files don't match the package": "{} archivos no coinciden con el paquete",
+    "Reinstall DaVinci Resolve to repair them.": "Reinstale DaVinci Resolve para repararlos.",
+    "All installed files are intact": "Todos los archivos instalados están intactos",
+    "Step {}: Verifying installed files...": "Paso {}: Verificando los archivos instalados...",
+    "{} installed files don't match the package:": "{} archivos instalados no coinciden con el paquete:",
+    "Install {} {} ({}) from {}": "Instalar {} {} ({}) desde {}",
+    "Priority: {}": "Prioridad: {}",
+    "Space:": "Espacio:",
+    "Staging in {}": "Preparación en {}",
+    "The installer is moved there": "El instalador se mueve allí",
+    "The installer extracted by an earlier attempt is reused": "Se reutiliza el instalador extraído en un intento anterior",
+    "The installer extracted next to the zip is reused": "Se reutiliza el instalador extraído junto al zip",
+    "The installer is extracted from the zip": "El instalador se extrae del zip",
+    "Payload unpacked with {}": "Contenido desempaquetado con {}",
+    "Unchanged files are shared with {}": "Los archivos sin cambios se comparten con {}",
+    "{} is kept next to the new version": "{} se conserva junto a la nueva versión",
+    "Dependencies:": "Dependencias:",
+    "From the offline bundle in {}": "Desde el paquete sin conexión en {}",
+    "Missing from the bundle: {}": "Faltan en el paquete: {}",
+    "Could not ask pacman which are installed": "No se pudo consultar a pacman cuáles están instalados",
+    "To install: {}": "Por instalar: {}",
+    "All installed already": "Todas ya instaladas",
+    "opencl-amd is built from AUR": "opencl-amd se compila desde AUR",
+    "Added to IgnorePkg: {}": "Añadidos a IgnorePkg: {}",
+    "Stages:": "Etapas:",
+    "total": "total",
+    "No earlier install to predict the duration from": "No hay instalaciones anteriores para predecir la duración",
+    "Preview": "Vista previa",
+    "Install plan": "Plan de instalación",
+    "Working out the install plan...": "Elaborando el plan de instalación...",
+    "Back": "Atrás",
+    "Copy as JSON": "Copiar como JSON",
+    "Could not plan the install": "No se pudo planificar la instalación",
+    "another install": "otra instalación",
+    "Waiting for {} to finish ({} in the queue before this one)...": "Esperando a que termine {} ({} en la cola antes que esta)...",
+    "Waiting for the package manager...": "Esperando al gestor de paquetes...",
+    "{} is not a valid package version": "{} no es una versión de paquete válida",
+    "Unknown placeholder in the recipe: {}": "Marcador desconocido en la receta: {}",
+    "No value for recipe placeholder: {}": "Sin valor para el marcador de la receta: {}",
+    "Checking the recipe took longer than {} seconds": "La comprobación de la receta tardó más de {} segundos",
+    "The recipe has a syntax error: {}": "La receta tiene un error de sintaxis: {}",
+    "The recipe could not be read: {}": "No se pudo leer la receta: {}",
+    "The recipe declares {} as {!r} instead of {!r}": "La receta declara {} como {!r} en lugar de {!r}",
+    "The recipe doesn't depend on {}": "La receta no depende de {}",
+    "Import the missing key with 'gpg --recv-keys' (makepkg lists its ID above the error) and try again.": "Importe la clave que falta con 'gpg --recv-keys' (makepkg muestra su ID encima del error) e inténtelo de nuevo.",
+    "Could not create a staging directory on {}": "No se pudo crear un directorio temporal en {}",
 }
@@ -28,4 +28,134 @@ translations = {
     "Authentication Failed": "Échec de l'authentification",
     "Incorrect password.": "Mot de passe incorrect.",
     "Installation failed": "Échec de l'installation",
+    "Check GPU readiness": "Vérifier l'état du GPU",
+    "Resolve is ready to launch": "Resolve est prêt à être lancé",
+    "OpenCL setup needs attention": "La configuration OpenCL nécessite votre attention",
+    "Removal in progress. Do NOT close the app.": "Suppression en cours. Ne fermez PAS l'application.",
+    "Removing {}...": "Suppression de {}...",
+    "Removal failed": "Échec de la suppression",
+    "{} removed": "{} supprimé",
+    "Reclaimed {} in {:.0f} s.": "{} libérés en {:.0f} s.",
+    "DaVinci Resolve is not installed as a package.": "DaVinci Resolve n'est pas installé en tant que paquet.",
+    "Active version": "Version active",
+    "Remove old versions": "Supprimer les anciennes versions",
+    "Remove old versions?": "Supprimer les anciennes versions ?",
+    "Removing old versions...": "Suppression des anciennes versions...",
+    "Old versions removed": "Anciennes versions supprimées",
+    "Could not switch version": "Impossible de changer de version",
+    "Install": "Installer",
+    "{} {} is ready to install": "{} {} est prêt à être installé",
+    "DaVinci Resolve Installer (*.run, *.zip)": "Programme d'installation de DaVinci Resolve (*.run, *.zip)",
+    "Extracting {}...": "Extraction de {}...",
+    "Step {}: Extracting DaVinci Resolve...": "Étape {} : Extraction de DaVinci Resolve...",
+    "Installer (.run)": "Programme d'installation (.run)",
+    "Extracted payload": "Contenu extrait",
+    "Built package": "Paquet construit",
+    "Installed files": "Fichiers installés",
+    "{} {}: needs {}, {} free": "{} {} : nécessite {}, {} libres",
+    "Not enough disk space": "Espace disque insuffisant",
+    "Reclaim space": "Libérer de l'espace",
+    "Nothing to reclaim": "Rien à libérer",
+    "Total: {}": "Total : {}",
+    "No old DaVinci Resolve or opencl-amd packages were found.": "Aucun ancien paquet DaVinci Resolve ou opencl-amd n'a été trouvé.",
+    "Removing old packages...": "Suppression des anciens paquets...",
+    "Old packages removed": "Anciens paquets supprimés",
+    "The offline bundle in {} lacks: {}": "Le paquet hors ligne dans {} ne contient pas : {}",
+    "Step {}: Building DaVinci Resolve...": "Étape {} : Construction de DaVinci Resolve...",
+    "makepkg did not produce a package": "makepkg n'a produit aucun paquet",
+    "The disk ran out of space": "Le disque est plein",
+    "Free up space or choose a build directory on a larger drive, then try again.": "Libérez de l'espace ou choisissez un répertoire de construction sur un disque plus grand, puis réessayez.",
+    "The package database is locked": "La base de données des paquets est verrouillée",
+    "Another package manager is running. Wait for it to finish; if none is running, remove /var/lib/pacman/db.lck.": "Un autre gestionnaire de paquets est en cours d'exécution. Attendez qu'il se termine ; s'il n'y en a aucun, supprimez /var/lib/pacman/db.lck.",
+    "A PGP signature could not be verified": "Une signature PGP n'a pas pu être vérifiée",
+    "Import the missing key with 'gpg --recv-keys {0}' and try again.": "Importez la clé manquante avec 'gpg --recv-keys {0}' puis réessayez.",
+    "A package signature is not trusted": "La signature d'un paquet n'est pas approuvée",
+    "Update the keyring with 'sudo pacman -Sy archlinux-keyring' and run 'sudo pacman-key --populate'.": "Mettez à jour le trousseau avec 'sudo pacman -Sy archlinux-keyring' et exécutez 'sudo pacman-key --populate'.",
+    "Files of {0} already exist on the system": "Des fichiers de {0} existent déjà sur le système",
+    "Another package owns these files. Remove the conflicting package or, if the files are leftovers, delete them and try again.": "Ces fichiers appartiennent à un autre paquet. Supprimez le paquet en conflit ou, s'il s'agit de restes, effacez-les et réessayez.",
+    "{0} conflicts with an installed package": "{0} est en conflit avec un paquet installé",
+    "Remove the conflicting package, then run the installation again.": "Supprimez le paquet en conflit, puis relancez l'installation.",
+    "The package {0} could not be found": "Le paquet {0} est introuvable",
+    "Update the package databases with 'sudo pacman -Syu' and check that the [extra] repository is enabled in /etc/pacman.conf.": "Mettez à jour les bases de paquets avec 'sudo pacman -Syu' et vérifiez que le dépôt [extra] est activé dans /etc/pacman.conf.",
+    "A download failed": "Un téléchargement a échoué",
+    "Check the network connection, or install from an offline bundle.": "Vérifiez la connexion réseau ou installez depuis un paquet hors ligne.",
+    "A downloaded package is corrupted": "Un paquet téléchargé est corrompu",
+    "Remove it from /var/cache/pacman/pkg and try again.": "Supprimez-le de /var/cache/pacman/pkg et réessayez.",
+    "Administrator authentication failed": "L'authentification administrateur a échoué",
+    "Check the password and try again.": "Vérifiez le mot de passe et réessayez.",
+    "Building the package failed in {0}()": "La construction du paquet a échoué dans {0}()",
+    "See the log excerpt below; the installer file may be incomplete or damaged.": "Voir l'extrait du journal ci-dessous ; le fichier d'installation est peut-être incomplet ou endommagé.",
+    "About {} left, based on earlier installs": "Environ {} restantes, d'après les installations précédentes",
+    "Show progress": "Afficher la progression",
+    "Hide progress": "Masquer la progression",
+    "Search the log": "Rechercher dans le journal",
+    "Previous match": "Résultat précédent",
+    "Next match": "Résultat suivant",
+    "Follow new output": "Suivre la nouvelle sortie",
+    "View previous logs": "Voir les journaux précédents",
+    "View log": "Voir le journal",
+    "Installation": "Installation",
+    "Build": "Construction",
+    "Removal": "Suppression",
+    "succeeded": "réussi",
+    "failed": "échoué",
+    "interrupted": "interrompu",
+    "No logs yet": "Aucun journal pour l'instant",
+    "Logs are kept for every install and removal from now on.": "Désormais, un journal est conservé pour chaque installation et suppression.",
+    "Install logs": "Journaux d'installation",
+    "Full speed": "Pleine vitesse",
+    "In the background": "En arrière-plan",
+    "Only when idle": "Uniquement au repos",
+    "Install priority": "Priorité d'installation",
+    "Verify installation": "Vérifier l'installation",
+    "Verifying installation": "Vérification de l'installation",
+    "Checking the installed files against the package...": "Comparaison des fichiers installés avec le paquet...",
+    "Close": "Fermer",
+    "Verification failed": "La vérification a échoué",
+    "{} files don't match the package": "{} fichiers ne correspondent pas au paquet",
+    "Reinstall DaVinci Resolve to repair them.": "Réinstallez DaVinci Resolve pour les réparer.",
+    "All installed files are intact": "Tous les fichiers installés sont intacts",
+    "Step {}: Verifying installed files...": "Étape {} : Vérification des fichiers installés...",
+    "{} installed files don't match the package:": "{} fichiers installés ne correspondent pas au paquet :",
+    "Install {} {} ({}) from {}": "Installer {} {} ({}) depuis {}",
+    "Priority: {}": "Priorité : {}",
+    "Space:": "Espace :",
+    "Staging in {}": "Préparation dans {}",
+    "The installer is moved there": "L'installateur y est déplacé",
+    "The installer extracted by an earlier attempt is reused": "L'installateur extrait lors d'une tentative précédente est réutilisé",
+    "The installer extracted next to the zip is reused": "L'installateur extrait à côté du zip est réutilisé",
+    "The installer is extracted from the zip": "L'installateur est extrait du zip",
+    "Payload unpacked with {}": "Contenu décompressé avec {}",
+    "Unchanged files are shared with {}": "Les fichiers inchangés sont partagés avec {}",
+    "{} is kept next to the new version": "{} est conservé à côté de la nouvelle version",
+    "Dependencies:": "Dépendances :",
+    "From the offline bundle in {}": "Depuis le paquet hors ligne dans {}",
+    "Missing from the bundle: {}": "Absents du paquet : {}",
+    "Could not ask pacman which are installed": "Impossible de demander à pacman lesquels sont installés",
+    "To install: {}": "À installer : {}",
+    "All installed already": "Toutes déjà installées",
+    "opencl-amd is built from AUR": "opencl-amd est compilé depuis l'AUR",
+    "Added to IgnorePkg: {}": "Ajoutés à IgnorePkg : {}",
+    "Stages:": "Étapes :",
+    "total": "total",
+    "No earlier install to predict the duration from": "Aucune installation précédente pour prévoir la durée",
+    "Preview": "Aperçu",
+    "Install plan": "Plan d'installation",
+    "Working out the install plan...": "Élaboration du plan d'installation...",
+    "Back": "Retour",
+    "Copy as JSON": "Copier en JSON",
+    "Could not plan the install": "Impossible de planifier l'installation",
+    "another install": "une autre installation",
+    "Waiting for {} to finish ({} in the queue before this one)...": "En attente de la fin de {} ({} dans la file avant celle-ci)...",
+    "Waiting for the package manager...": "En attente du gestionnaire de paquets...",
+    "{} is not a valid package version": "{} n'est pas une version de paquet valide",
+    "Unknown placeholder in the recipe: {}": "Espace réservé inconnu dans la recette : {}",
+    "No value for recipe placeholder: {}": "Aucune valeur pour l'espace réservé de la recette : {}",
+    "Checking the recipe took longer than {} seconds": "La vérification de la recette a pris plus de {} secondes",
+    "The recipe has a syntax error: {}": "La recette contient une erreur de syntaxe : {}",
+    "The recipe could not be read: {}": "Impossible de lire la recette : {}",
+    "The recipe declares {} as {!r} instead of {!r}": "La recette déclare {} comme {!r} au lieu de {!r}",
+    "The recipe doesn't depend on {}": "La recette ne dépend pas de {}",
+    "Import the missing key with 'gpg --recv-keys' (makepkg lists its ID above the error) and try again.": "Importez la clé manquante avec 'gpg --recv-keys' (makepkg affiche son identifiant au-dessus de l'erreur) et réessayez.",
+    "Could not create a staging directory on {}": "Impossible de créer un répertoire de préparation sur {}",
 }
@@ -28,4 +28,134 @@ translations = {
     "Authentication Failed": "प्रमाणीकरण विफल",
     "Incorrect password.": "गलत पासवर्ड।",
     "Installation failed": "इंस्टॉलेशन विफल",
+    "Check GPU readiness": "GPU तैयारी जाँचें",
+    "Resolve is ready to launch": "Resolve लॉन्च के लिए तैयार है",
+    "OpenCL setup needs attention": "OpenCL सेटअप पर ध्यान देने की आवश्यकता है",
+    "Removal in progress. Do NOT close the app.": "हटाना जारी है। ऐप को बंद न करें।",
+    "Removing {}...": "{} हटाया जा रहा है...",
+    "Removal failed": "हटाना विफल रहा",
+    "{} removed": "{} हटा दिया गया",
+    "Reclaimed {} in {:.0f} s.": "{1:.0f} s में {0} खाली किया गया।",
+    "DaVinci Resolve is not installed as a package.": "DaVinci Resolve पैकेज के रूप में स्थापित नहीं है।",
+    "Active version": "सक्रिय संस्करण",
+    "Remove old versions": "पुराने संस्करण हटाएँ",
+    "Remove old versions?": "पुराने संस्करण हटाएँ?",
+    "Removing old versions...": "पुराने संस्करण हटाए जा रहे हैं...",
+    "Old versions removed": "पुराने संस्करण हटा दिए गए",
+    "Could not switch version": "संस्करण नहीं बदला जा सका",
+    "Install": "इंस्टॉल करें",
+    "{} {} is ready to install": "{} {} इंस्टॉल के लिए तैयार है",
+    "DaVinci Resolve Installer (*.run, *.zip)": "DaVinci Resolve इंस्टॉलर (*.run, *.zip)",
+    "Extracting {}...": "{} निकाला जा रहा है...",
+    "Step {}: Extracting DaVinci Resolve...": "चरण {}: दा विंची रिज़ॉल्व निकाला जा रहा है...",
+    "Installer (.run)": "इंस्टॉलर (.run)",
+    "Extracted payload": "निकाली गई सामग्री",
+    "Built package": "बनाया गया पैकेज",
+    "Installed files": "इंस्टॉल की गई फ़ाइलें",
+    "{} {}: needs {}, {} free": "{} {}: {} चाहिए, {} खाली",
+    "Not enough disk space": "पर्याप्त डिस्क स्थान नहीं है",
+    "Reclaim space": "स्थान खाली करें",
+    "Nothing to reclaim": "खाली करने के लिए कुछ नहीं",
+    "Total: {}": "कुल: {}",
+    "No old DaVinci Resolve or opencl-amd packages were found.": "कोई पुराना DaVinci Resolve या opencl-amd पैकेज नहीं मिला।",
+    "Removing old packages...": "पुराने पैकेज हटाए जा रहे हैं...",
+    "Old packages removed": "पुराने पैकेज हटा दिए गए",
+    "The offline bundle in {} lacks: {}": "{} में ऑफ़लाइन बंडल में यह नहीं है: {}",
+    "Step {}: Building DaVinci Resolve...": "चरण {}: दा विंची रिज़ॉल्व बनाया जा रहा है...",
+    "makepkg did not produce a package": "makepkg ने कोई पैकेज नहीं बनाया",
+    "The disk ran out of space": "डिस्क में जगह खत्म हो गई",
+    "Free up space or choose a build directory on a larger drive, then try again.": "जगह खाली करें या बड़ी ड्राइव पर बिल्ड फ़ोल्डर चुनें, फिर दोबारा प्रयास करें।",
+    "The package database is locked": "पैकेज डेटाबेस लॉक है",
+    "Another package manager is running. Wait for it to finish; if none is running, remove /var/lib/pacman/db.lck.": "कोई अन्य पैकेज मैनेजर चल रहा है। उसके पूरा होने तक प्रतीक्षा करें; यदि कोई नहीं चल रहा है, तो /var/lib/pacman/db.lck हटाएँ।",
+    "A PGP signature could not be verified": "एक PGP हस्ताक्षर सत्यापित नहीं हो सका",
+    "Import the missing key with 'gpg --recv-keys {0}' and try again.": "'gpg --recv-keys {0}' से गायब कुंजी आयात करें और दोबारा प्रयास करें।",
+    "A package signature is not trusted": "एक पैकेज हस्ताक्षर विश्वसनीय नहीं है",
+    "Update the keyring with 'sudo pacman -Sy archlinux-keyring' and run 'sudo pacman-key --populate'.": "'sudo pacman -Sy archlinux-keyring' से कीरिंग अपडेट करें और 'sudo pacman-key --populate' चलाएँ।",
+    "Files of {0} already exist on the system": "{0} की फ़ाइलें सिस्टम पर पहले से मौजूद हैं",
+    "Another package owns these files. Remove the conflicting package or, if the files are leftovers, delete them and try again.": "ये फ़ाइलें किसी अन्य पैकेज की हैं। टकराव वाला पैकेज हटाएँ, या यदि ये बची हुई फ़ाइलें हैं तो उन्हें मिटाकर दोबारा प्रयास करें।",
+    "{0} conflicts with an installed package": "{0} एक इंस्टॉल किए गए पैकेज से टकराता है",
+    "Remove the conflicting package, then run the installation again.": "टकराव वाला पैकेज हटाएँ, फिर इंस्टॉलेशन दोबारा चलाएँ।",
+    "The package {0} could not be found": "पैकेज {0} नहीं मिला",
+    "Update the package databases with 'sudo pacman -Syu' and check that the [extra] repository is enabled in /etc/pacman.conf.": "'sudo pacman -Syu' से पैकेज डेटाबेस अपडेट करें और जाँचें कि /etc/pacman.conf में [extra] रिपॉज़िटरी सक्षम है।",
+    "A download failed": "एक डाउनलोड विफल हुआ",
+    "Check the network connection, or install from an offline bundle.": "नेटवर्क कनेक्शन जाँचें, या ऑफ़लाइन बंडल से इंस्टॉल करें।",
+    "A downloaded package is corrupted": "एक डाउनलोड किया गया पैकेज खराब है",
+    "Remove it from /var/cache/pacman/pkg and try again.": "इसे /var/cache/pacman/pkg से हटाएँ और दोबारा प्रयास करें।",
+    "Administrator authentication failed": "व्यवस्थापक प्रमाणीकरण विफल हुआ",
+    "Check the password and try again.": "पासवर्ड जाँचें और दोबारा प्रयास करें।",
+    "Building the package failed in {0}()": "पैकेज बनाना {0}() में विफल हुआ",
+    "See the log excerpt below; the installer file may be incomplete or damaged.": "नीचे लॉग अंश देखें; इंस्टॉलर फ़ाइल अधूरी या खराब हो सकती है।",
+    "About {} left, based on earlier installs": "पिछले इंस्टॉलेशन के आधार पर लगभग {} बाकी",
+    "Show progress": "प्रगति दिखाएँ",
+    "Hide progress": "प्रगति छिपाएँ",
+    "Search the log": "लॉग में खोजें",
+    "Previous match": "पिछला मिलान",
+    "Next match": "अगला मिलान",
+    "Follow new output": "नया आउटपुट फ़ॉलो करें",
+    "View previous logs": "पिछले लॉग देखें",
+    "View log": "लॉग देखें",
+    "Installation": "इंस्टॉलेशन",
+    "Build": "बिल्ड",
+    "Removal": "हटाना",
+    "succeeded": "सफल",
+    "failed": "विफल",
+    "interrupted": "बाधित",
+    "No logs yet": "अभी कोई लॉग नहीं",
+    "Logs are kept for every install and removal from now on.": "अब से हर इंस्टॉलेशन और हटाने का लॉग रखा जाएगा।",
+    "Install logs": "इंस्टॉल लॉग",
+    "Full speed": "पूरी गति",
+    "In the background": "पृष्ठभूमि में",
+    "Only when idle": "केवल निष्क्रिय होने पर",
+    "Install priority": "इंस्टॉल प्राथमिकता",
+    "Verify installation": "इंस्टॉलेशन सत्यापित करें",
+    "Verifying installation": "इंस्टॉलेशन सत्यापित किया जा रहा है",
+    "Checking the installed files against the package...": "इंस्टॉल की गई फ़ाइलों की पैकेज से तुलना की जा रही है...",
+    "Close": "बंद करें",
+    "Verification failed": "सत्यापन विफल रहा",
+    "{} files don't match the package": "{} फ़ाइलें पैकेज से मेल नहीं खातीं",
+    "Reinstall DaVinci Resolve to repair them.": "उन्हें ठीक करने के लिए DaVinci Resolve को फिर से इंस्टॉल करें।",
+    "All installed files are intact": "सभी इंस्टॉल की गई फ़ाइलें सही हैं",
+    "Step {}: Verifying installed files...": "चरण {}: इंस्टॉल की गई फ़ाइलें सत्यापित की जा रही हैं...",
+    "{} installed files don't match the package:": "{} इंस्टॉल की गई फ़ाइलें पैकेज से मेल नहीं खातीं:",
+    "Install {} {} ({}) from {}": "{} से {} {} ({}) इंस्टॉल करें",
+    "Priority: {}": "प्राथमिकता: {}",
+    "Space:": "स्थान:",
+    "Staging in {}": "{} में तैयारी",
+    "The installer is moved there": "इंस्टॉलर वहाँ ले जाया जाता है",
+    "The installer extracted by an earlier attempt is reused": "पिछले प्रयास में निकाला गया इंस्टॉलर फिर से उपयोग होता है",
+    "The installer extracted next to the zip is reused": "zip के पास निकाला गया इंस्टॉलर फिर से उपयोग होता है",
+    "The installer is extracted from the zip": "इंस्टॉलर zip से निकाला जाता है",
+    "Payload unpacked with {}": "पेलोड {} से खोला जाता है",
+    "Unchanged files are shared with {}": "अपरिवर्तित फ़ाइलें {} के साथ साझा होती हैं",
+    "{} is kept next to the new version": "{} नए संस्करण के साथ रखा जाता है",
+    "Dependencies:": "निर्भरताएँ:",
+    "From the offline bundle in {}": "{} के ऑफ़लाइन बंडल से",
+    "Missing from the bundle: {}": "बंडल में नहीं हैं: {}",
+    "Could not ask pacman which are installed": "pacman से पूछा नहीं जा सका कि कौन से इंस्टॉल हैं",
+    "To install: {}": "इंस्टॉल करने हैं: {}",
+    "All installed already": "सभी पहले से इंस्टॉल हैं",
+    "opencl-amd is built from AUR": "opencl-amd AUR से बनाया जाता है",
+    "Added to IgnorePkg: {}": "IgnorePkg में जोड़े गए: {}",
+    "Stages:": "चरण:",
+    "total": "कुल",
+    "No earlier install to predict the duration from": "अवधि का अनुमान लगाने के लिए कोई पिछला इंस्टॉल नहीं",
+    "Preview": "पूर्वावलोकन",
+    "Install plan": "इंस्टॉल योजना",
+    "Working out the install plan...": "इंस्टॉल योजना बनाई जा रही है...",
+    "Back": "वापस",
+    "Copy as JSON": "JSON के रूप में कॉपी करें",
+    "Could not plan the install": "इंस्टॉल की योजना नहीं बन सकी",
+    "another install": "दूसरा इंस्टॉल",
+    "Waiting for {} to finish ({} in the queue before this one)...": "{} के पूरा होने की प्रतीक्षा ({} इससे पहले कतार में)...",
+    "Waiting for the package manager...": "पैकेज मैनेजर की प्रतीक्षा...",
+    "{} is not a valid package version": "{} मान्य पैकेज संस्करण नहीं है",
+    "Unknown placeholder in the recipe: {}": "रेसिपी में अज्ञात प्लेसहोल्डर: {}",
+    "No value for recipe placeholder: {}": "रेसिपी प्लेसहोल्डर के लिए कोई मान नहीं: {}",
+    "Checking the recipe took longer than {} seconds": "रेसिपी की जाँच में {} सेकंड से अधिक लगे",
+    "The recipe has a syntax error: {}": "रेसिपी में सिंटैक्स त्रुटि है: {}",
+    "The recipe could not be read: {}": "रेसिपी पढ़ी नहीं जा सकी: {}",
+    "The recipe declares {} as {!r} instead of {!r}": "रेसिपी {} को {!r} घोषित करती है, {!r} के बजाय",
+    "The recipe doesn't depend on {}": "रेसिपी {} पर निर्भर नहीं है",
+    "Import the missing key with 'gpg --recv-keys' (makepkg lists its ID above the error) and try again.": "'gpg --recv-keys' से गायब कुंजी आयात करें (makepkg त्रुटि के ऊपर उसकी ID दिखाता है) और फिर से प्रयास करें।",
+    "Could not create a staging directory on {}": "{} पर स्टेजिंग निर्देशिका नहीं बनाई जा सकी",
 }
@@ -28,4 +28,134 @@ translations = {
     "Authentication Failed": "Uwierzytelnienie nie powiodło się",
     "Incorrect password.": "Nieprawidłowe hasło.",
     "Installation failed": "Instalacja nie powiodła się",
+    "Check GPU readiness": "Sprawdź gotowość GPU",
+    "Resolve is ready to launch": "Resolve jest gotowy do uruchomienia",
+    "OpenCL setup needs attention": "Konfiguracja OpenCL wymaga uwagi",
+    "Removal in progress. Do NOT close the app.": "Trwa usuwanie. NIE zamykaj aplikacji.",
+    "Removing {}...": "Usuwanie {}...",
+    "Removal failed": "Usuwanie nie powiodło się",
+    "{} removed": "Usunięto {}",
+    "Reclaimed {} in {:.0f} s.": "Odzyskano {} w {:.0f} s.",
+    "DaVinci Resolve is not installed as a package.": "DaVinci Resolve nie jest zainstalowany jako pakiet.",
+    "Active version": "Aktywna wersja",
+    "Remove old versions": "Usuń stare wersje",
+    "Remove old versions?": "Usunąć stare wersje?",
+    "Removing old versions...": "Usuwanie starych wersji...",
+    "Old versions removed": "Usunięto stare wersje",
+    "Could not switch version": "Nie udało się przełączyć wersji",
+    "Install": "Zainstaluj",
+    "{} {} is ready to install": "{} {} jest gotowy do instalacji",
+    "DaVinci Resolve Installer (*.run, *.zip)": "Instalator DaVinci Resolve (*.run, *.zip)",
+    "Extracting {}...": "Wypakowywanie {}...",
+    "Step {}: Extracting DaVinci Resolve...": "Krok {}: Wypakowywanie DaVinci Resolve...",
+    "Installer (.run)": "Instalator (.run)",
+    "Extracted payload": "Rozpakowana zawartość",
+    "Built package": "Zbudowany pakiet",
+    "Installed files": "Zainstalowane pliki",
+    "{} {}: needs {}, {} free": "{} {}: wymaga {}, wolne {}",
+    "Not enough disk space": "Za mało miejsca na dysku",
+    "Reclaim space": "Odzyskaj miejsce",
+    "Nothing to reclaim": "Nie ma czego odzyskać",
+    "Total: {}": "Razem: {}",
+    "No old DaVinci Resolve or opencl-amd packages were found.": "Nie znaleziono starych pakietów DaVinci Resolve ani opencl-amd.",
+    "Removing old packages...": "Usuwanie starych pakietów...",
+    "Old packages removed": "Usunięto stare pakiety",
+    "The offline bundle in {} lacks: {}": "W pakiecie offline w {} brakuje: {}",
+    "Step {}: Building DaVinci Resolve...": "Krok {}: Budowanie DaVinci Resolve...",
+    "makepkg did not produce a package": "makepkg nie utworzył pakietu",
+    "The disk ran out of space": "Na dysku zabrakło miejsca",
+    "Free up space or choose a build directory on a larger drive, then try again.": "Zwolnij miejsce lub wybierz katalog budowania na większym dysku, a następnie spróbuj ponownie.",
+    "The package database is locked": "Baza danych pakietów jest zablokowana",
+    "Another package manager is running. Wait for it to finish; if none is running, remove /var/lib/pacman/db.lck.": "Działa inny menedżer pakietów. Poczekaj, aż skończy; jeśli żaden nie działa, usuń /var/lib/pacman/db.lck.",
+    "A PGP signature could not be verified": "Nie można zweryfikować podpisu PGP",
+    "Import the missing key with 'gpg --recv-keys {0}' and try again.": "Zaimportuj brakujący klucz poleceniem 'gpg --recv-keys {0}' i spróbuj ponownie.",
+    "A package signature is not trusted": "Podpis pakietu nie jest zaufany",
+    "Update the keyring with 'sudo pacman -Sy archlinux-keyring' and run 'sudo pacman-key --populate'.": "Zaktualizuj pęk kluczy poleceniem 'sudo pacman -Sy archlinux-keyring' i uruchom 'sudo pacman-key --populate'.",
+    "Files of {0} already exist on the system": "Pliki pakietu {0} już istnieją w systemie",
+    "Another package owns these files. Remove the conflicting package or, if the files are leftovers, delete them and try again.": "Te pliki należą do innego pakietu. Usuń kolidujący pakiet lub, jeśli to pozostałości, skasuj je i spróbuj ponownie.",
+    "{0} conflicts with an installed package": "{0} koliduje z zainstalowanym pakietem",
+    "Remove the conflicting package, then run the installation again.": "Usuń kolidujący pakiet, a następnie uruchom instalację ponownie.",
+    "The package {0} could not be found": "Nie znaleziono pakietu {0}",
+    "Update the package databases with 'sudo pacman -Syu' and check that the [extra] repository is enabled in /etc/pacman.conf.": "Zaktualizuj bazy pakietów poleceniem 'sudo pacman -Syu' i sprawdź, czy repozytorium [extra] jest włączone w /etc/pacman.conf.",
+    "A download failed": "Pobieranie nie powiodło się",
+    "Check the network connection, or install from an offline bundle.": "Sprawdź połączenie sieciowe lub zainstaluj z pakietu offline.",
+    "A downloaded package is corrupted": "Pobrany pakiet jest uszkodzony",
+    "Remove it from /var/cache/pacman/pkg and try again.": "Usuń go z /var/cache/pacman/pkg i spróbuj ponownie.",
+    "Administrator authentication failed": "Uwierzytelnianie administratora nie powiodło się",
+    "Check the password and try again.": "Sprawdź hasło i spróbuj ponownie.",
+    "Building the package failed in {0}()": "Budowanie pakietu nie powiodło się w {0}()",
+    "See the log excerpt below; the installer file may be incomplete or damaged.": "Zobacz fragment dziennika poniżej; plik instalatora może być niekompletny lub uszkodzony.",
+    "About {} left, based on earlier installs": "Pozostało około {}, na podstawie wcześniejszych instalacji",
+    "Show progress": "Pokaż postęp",
+    "Hide progress": "Ukryj postęp",
+    "Search the log": "Szukaj w dzienniku",
+    "Previous match": "Poprzednie dopasowanie",
+    "Next match": "Następne dopasowanie",
+    "Follow new output": "Śledź nowe dane wyjściowe",
+    "View previous logs": "Pokaż poprzednie dzienniki",
+    "View log": "Pokaż dziennik",
+    "Installation": "Instalacja",
+    "Build": "Budowanie",
+    "Removal": "Usuwanie",
+    "succeeded": "zakończono",
+    "failed": "niepowodzenie",
+    "interrupted": "przerwano",
+    "No logs yet": "Brak dzienników",
+    "Logs are kept for every install and removal from now on.": "Od teraz dziennik każdej instalacji i usunięcia jest zachowywany.",
+    "Install logs": "Dzienniki instalacji",
+    "Full speed": "Pełna prędkość",
+    "In the background": "W tle",
+    "Only when idle": "Tylko w bezczynności",
+    "Install priority": "Priorytet instalacji",
+    "Verify installation": "Sprawdź instalację",
+    "Verifying installation": "Sprawdzanie instalacji",
+    "Checking the installed files against the package...": "Porównywanie zainstalowanych plików z pakietem...",
+    "Close": "Zamknij",
+    "Verification failed": "Sprawdzanie nie powiodło się",
+    "{} files don't match the package": "{} plików nie zgadza się z pakietem",
+    "Reinstall DaVinci Resolve to repair them.": "Zainstaluj ponownie DaVinci Resolve, aby je naprawić.",
+    "All installed files are intact": "Wszystkie zainstalowane pliki są nienaruszone",
+    "Step {}: Verifying installed files...": "Krok {}: Sprawdzanie zainstalowanych plików...",
+    "{} installed files don't match the package:": "{} zainstalowanych plików nie zgadza się z pakietem:",
+    "Install {} {} ({}) from {}": "Instalacja {} {} ({}) z {}",
+    "Priority: {}": "Priorytet: {}",
+    "Space:": "Miejsce:",
+    "Staging in {}": "Przygotowanie w {}",
+    "The installer is moved there": "Instalator zostanie tam przeniesiony",
+    "The installer extracted by an earlier attempt is reused": "Instalator rozpakowany przy wcześniejszej próbie zostanie użyty ponownie",
+    "The installer extracted next to the zip is reused": "Instalator rozpakowany obok pliku zip zostanie użyty ponownie",
+    "The installer is extracted from the zip": "Instalator zostanie rozpakowany z pliku zip",
+    "Payload unpacked with {}": "Zawartość rozpakowywana przez {}",
+    "Unchanged files are shared with {}": "Niezmienione pliki są współdzielone z {}",
+    "{} is kept next to the new version": "{} zostaje zachowany obok nowej wersji",
+    "Dependencies:": "Zależności:",
+    "From the offline bundle in {}": "Z pakietu offline w {}",
+    "Missing from the bundle: {}": "Brakuje w pakiecie: {}",
+    "Could not ask pacman which are installed": "Nie udało się sprawdzić w pacmanie, które są zainstalowane",
+    "To install: {}": "Do zainstalowania: {}",
+    "All installed already": "Wszystkie już zainstalowane",
+    "opencl-amd is built from AUR": "opencl-amd zostanie zbudowany z AUR",
+    "Added to IgnorePkg: {}": "Dodane do IgnorePkg: {}",
+    "Stages:": "Etapy:",
+    "total": "razem",
+    "No earlier install to predict the duration from": "Brak wcześniejszych instalacji do oszacowania czasu",
+    "Preview": "Podgląd",
+    "Install plan": "Plan instalacji",
+    "Working out the install plan...": "Przygotowywanie planu instalacji...",
+    "Back": "Wstecz",
+    "Copy as JSON": "Kopiuj jako JSON",
+    "Could not plan the install": "Nie udało się zaplanować instalacji",
+    "another install": "inna instalacja",
+    "Waiting for {} to finish ({} in the queue before this one)...": "Oczekiwanie na zakończenie {} ({} w kolejce przed tą)...",
+    "Waiting for the package manager...": "Oczekiwanie na menedżer pakietów...",
+    "{} is not a valid package version": "{} nie jest prawidłową wersją pakietu",
+    "Unknown placeholder in the recipe: {}": "Nieznany symbol zastępczy w przepisie: {}",
+    "No value for recipe placeholder: {}": "Brak wartości dla symbolu zastępczego przepisu: {}",
+    "Checking the recipe took longer than {} seconds": "Sprawdzanie przepisu trwało dłużej niż {} s",
+    "The recipe has a syntax error: {}": "Przepis zawiera błąd składni: {}",
+    "The recipe could not be read: {}": "Nie można odczytać przepisu: {}",
+    "The recipe declares {} as {!r} instead of {!r}": "Przepis deklaruje {} jako {!r} zamiast {!r}",
+    "The recipe doesn't depend on {}": "Przepis nie zależy od {}",
+    "Import the missing key with 'gpg --recv-keys' (makepkg lists its ID above the error) and try again.": "Zaimportuj brakujący klucz poleceniem 'gpg --recv-keys' (makepkg podaje jego ID nad błędem) i spróbuj ponownie.",
+    "Could not create a staging directory on {}": "Nie można utworzyć katalogu tymczasowego na {}",
 }
@@ -28,4 +28,134 @@ translations = {
     "Authentication Failed": "Falha na autenticação",
     "Incorrect password.": "Palavra-passe incorreta.",
     "Installation failed": "Falha na instalação",
+    "Check GPU readiness": "Verificar prontidão da GPU",
+    "Resolve is ready to launch": "O Resolve está pronto a iniciar",
+    "OpenCL setup needs attention": "A configuração do OpenCL precisa de atenção",
+    "Removal in progress. Do NOT close the app.": "Remoção em curso. NÃO feche a aplicação.",
+    "Removing {}...": "A remover {}...",
+    "Removal failed": "A remoção falhou",
+    "{} removed": "{} removido",
+    "Reclaimed {} in {:.0f} s.": "{} libertados em {:.0f} s.",
+    "DaVinci Resolve is not installed as a package.": "O DaVinci Resolve não está instalado como pacote.",
+    "Active version": "Versão ativa",
+    "Remove old versions": "Remover versões antigas",
+    "Remove old versions?": "Remover versões antigas?",
+    "Removing old versions...": "A remover versões antigas...",
+    "Old versions removed": "Versões antigas removidas",
+    "Could not switch version": "Não foi possível mudar de versão",
+    "Install": "Instalar",
+    "{} {} is ready to install": "{} {} está pronto a instalar",
+    "DaVinci Resolve Installer (*.run, *.zip)": "Instalador do DaVinci Resolve (*.run, *.zip)",
+    "Extracting {}...": "A extrair {}...",
+    "Step {}: Extracting DaVinci Resolve...": "Passo {}: A extrair o DaVinci Resolve...",
+    "Installer (.run)": "Instalador (.run)",
+    "Extracted payload": "Conteúdo extraído",
+    "Built package": "Pacote compilado",
+    "Installed files": "Ficheiros instalados",
+    "{} {}: needs {}, {} free": "{} {}: precisa de {}, {} livres",
+    "Not enough disk space": "Espaço em disco insuficiente",
+    "Reclaim space": "Libertar espaço",
+    "Nothing to reclaim": "Nada para libertar",
+    "Total: {}": "Total: {}",
+    "No old DaVinci Resolve or opencl-amd packages were found.": "Não foram encontrados pacotes antigos do DaVinci Resolve ou opencl-amd.",
+    "Removing old packages...": "A remover pacotes antigos...",
+    "Old packages removed": "Pacotes antigos removidos",
+    "The offline bundle in {} lacks: {}": "O pacote offline em {} não contém: {}",
+    "Step {}: Building DaVinci Resolve...": "Passo {}: A compilar o DaVinci Resolve...",
+    "makepkg did not produce a package": "O makepkg não gerou nenhum pacote",
+    "The disk ran out of space": "O disco ficou sem espaço",
+    "Free up space or choose a build directory on a larger drive, then try again.": "Liberte espaço ou escolha um diretório de compilação numa unidade maior e tente novamente.",
+    "The package database is locked": "A base de dados de pacotes está bloqueada",
+    "Another package manager is running. Wait for it to finish; if none is running, remove /var/lib/pacman/db.lck.": "Outro gestor de pacotes está em execução. Aguarde que termine; se nenhum estiver em execução, remova /var/lib/pacman/db.lck.",
+    "A PGP signature could not be verified": "Não foi possível verificar uma assinatura PGP",
+    "Import the missing key with 'gpg --recv-keys {0}' and try again.": "Importe a chave em falta com 'gpg --recv-keys {0}' e tente novamente.",
+    "A package signature is not trusted": "A assinatura de um pacote não é fidedigna",
+    "Update the keyring with 'sudo pacman -Sy archlinux-keyring' and run 'sudo pacman-key --populate'.": "Atualize o porta-chaves com 'sudo pacman -Sy archlinux-keyring' e execute 'sudo pacman-key --populate'.",
+    "Files of {0} already exist on the system": "Ficheiros de {0} já existem no sistema",
+    "Another package owns these files. Remove the conflicting package or, if the files are leftovers, delete them and try again.": "Outro pacote é dono destes ficheiros. Remova o pacote em conflito ou, se forem restos, apague-os e tente novamente.",
+    "{0} conflicts with an installed package": "{0} entra em conflito com um pacote instalado",
+    "Remove the conflicting package, then run the installation again.": "Remova o pacote em conflito e execute a instalação novamente.",
+    "The package {0} could not be found": "O pacote {0} não foi encontrado",
+    "Update the package databases with 'sudo pacman -Syu' and check that the [extra] repository is enabled in /etc/pacman.conf.": "Atualize as bases de dados com 'sudo pacman -Syu' e verifique se o repositório [extra] está ativado em /etc/pacman.conf.",
+    "A download failed": "Uma transferência falhou",
+    "Check the network connection, or install from an offline bundle.": "Verifique a ligação de rede ou instale a partir de um pacote offline.",
+    "A downloaded package is corrupted": "Um pacote transferido está corrompido",
+    "Remove it from /var/cache/pacman/pkg and try again.": "Remova-o de /var/cache/pacman/pkg e tente novamente.",
+    "Administrator authentication failed": "Falha na autenticação de administrador",
+    "Check the password and try again.": "Verifique a palavra-passe e tente novamente.",
+    "Building the package failed in {0}()": "A compilação do pacote falhou em {0}()",
+    "See the log excerpt below; the installer file may be incomplete or damaged.": "Veja o excerto do registo abaixo; o ficheiro do instalador pode estar incompleto ou danificado.",
+    "About {} left, based on earlier installs": "Cerca de {} restantes, com base em instalações anteriores",
+    "Show progress": "Mostrar progresso",
+    "Hide progress": "Ocultar progresso",
+    "Search the log": "Pesquisar no registo",
+    "Previous match": "Resultado anterior",
+    "Next match": "Resultado seguinte",
+    "Follow new output": "Acompanhar nova saída",
+    "View previous logs": "Ver registos anteriores",
+    "View log": "Ver registo",
+    "Installation": "Instalação",
+    "Build": "Compilação",
+    "Removal": "Remoção",
+    "succeeded": "concluído",
+    "failed": "falhou",
+    "interrupted": "interrompido",
+    "No logs yet": "Ainda sem registos",
+    "Logs are kept for every install and removal from now on.": "A partir de agora, é mantido um registo de cada instalação e remoção.",
+    "Install logs": "Registos de instalação",
+    "Full speed": "Velocidade máxima",
+    "In the background": "Em segundo plano",
+    "Only when idle": "Apenas quando inativo",
+    "Install priority": "Prioridade de instalação",
+    "Verify installation": "Verificar instalação",
+    "Verifying installation": "A verificar a instalação",
+    "Checking the installed files against the package...": "A comparar os ficheiros instalados com o pacote...",
+    "Close": "Fechar",
+    "Verification failed": "A verificação falhou",
+    "{} files don't match the package": "{} ficheiros não correspondem ao pacote",
+    "Reinstall DaVinci Resolve to repair them.": "Reinstale o DaVinci Resolve para os reparar.",
+    "All installed files are intact": "Todos os ficheiros instalados estão intactos",
+    "Step {}: Verifying installed files...": "Passo {}: A verificar os ficheiros instalados...",
+    "{} installed files don't match the package:": "{} ficheiros instalados não correspondem ao pacote:",
+    "Install {} {} ({}) from {}": "Instalar {} {} ({}) a partir de {}",
+    "Priority: {}": "Prioridade: {}",
+    "Space:": "Espaço:",
+    "Staging in {}": "Preparação em {}",
+    "The installer is moved there": "O instalador é movido para lá",
+    "The installer extracted by an earlier attempt is reused": "O instalador extraído numa tentativa anterior é reutilizado",
+    "The installer extracted next to the zip is reused": "O instalador extraído ao lado do zip é reutilizado",
+    "The installer is extracted from the zip": "O instalador é extraído do zip",
+    "Payload unpacked with {}": "Conteúdo descompactado com {}",
+    "Unchanged files are shared with {}": "Ficheiros inalterados são partilhados com {}",
+    "{} is kept next to the new version": "{} é mantido ao lado da nova versão",
+    "Dependencies:": "Dependências:",
+    "From the offline bundle in {}": "Do pacote offline em {}",
+    "Missing from the bundle: {}": "Em falta no pacote: {}",
+    "Could not ask pacman which are installed": "Não foi possível consultar o pacman sobre quais estão instalados",
+    "To install: {}": "A instalar: {}",
+    "All installed already": "Todas já instaladas",
+    "opencl-amd is built from AUR": "opencl-amd é compilado a partir do AUR",
+    "Added to IgnorePkg: {}": "Adicionados ao IgnorePkg: {}",
+    "Stages:": "Etapas:",
+    "total": "total",
+    "No earlier install to predict the duration from": "Nenhuma instalação anterior para prever a duração",
+    "Preview": "Pré-visualizar",
+    "Install plan": "Plano de instalação",
+    "Working out the install plan...": "A elaborar o plano de instalação...",
+    "Back": "Voltar",
+    "Copy as JSON": "Copiar como JSON",
+    "Could not plan the install": "Não foi possível planear a instalação",
+    "another install": "outra instalação",
+    "Waiting for {} to finish ({} in the queue before this one)...": "A aguardar que {} termine ({} na fila antes desta)...",
+    "Waiting for the package manager...": "A aguardar o gestor de pacotes...",
+    "{} is not a valid package version": "{} não é uma versão de pacote válida",
+    "Unknown placeholder in the recipe: {}": "Marcador desconhecido na receita: {}",
+    "No value for recipe placeholder: {}": "Nenhum valor para o marcador da receita: {}",
+    "Checking the recipe took longer than {} seconds": "A verificação da receita demorou mais de {} segundos",
+    "The recipe has a syntax error: {}": "A receita tem um erro de sintaxe: {}",
+    "The recipe could not be read: {}": "Não foi possível ler a receita: {}",
+    "The recipe declares {} as {!r} instead of {!r}": "A receita declara {} como {!r} em vez de {!r}",
+    "The recipe doesn't depend on {}": "A receita não depende de {}",
+    "Import the missing key with 'gpg --recv-keys' (makepkg lists its ID above the error) and try again.": "Importe a chave em falta com 'gpg --recv-keys' (o makepkg mostra o ID acima do erro) e tente novamente.",
+    "Could not create a staging directory on {}": "Não foi possível criar um diretório temporário em {}",
 }
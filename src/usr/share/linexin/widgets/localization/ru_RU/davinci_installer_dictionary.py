@@ -28,4 +28,134 @@ translations = {
     "Authentication Failed": "Ошибка аутентификации",
     "Incorrect password.": "Неверный пароль.",
     "Installation failed": "Ошибка установки",
+    "Check GPU readiness": "Проверить готовность GPU",
+    "Resolve is ready to launch": "Resolve готов к запуску",
+    "OpenCL setup needs attention": "Настройка OpenCL требует внимания",
+    "Removal in progress. Do NOT close the app.": "Идёт удаление. НЕ закрывайте приложение.",
+    "Removing {}...": "Удаление {}...",
+    "Removal failed": "Удаление не удалось",
+    "{} removed": "{} удалён",
+    "Reclaimed {} in {:.0f} s.": "Освобождено {} за {:.0f} с.",
+    "DaVinci Resolve is not installed as a package.": "DaVinci Resolve не установлен как пакет.",
+    "Active version": "Активная версия",
+    "Remove old versions": "Удалить старые версии",
+    "Remove old versions?": "Удалить старые версии?",
+    "Removing old versions...": "Удаление старых версий...",
+    "Old versions removed": "Старые версии удалены",
+    "Could not switch version": "Не удалось переключить версию",
+    "Install": "Установить",
+    "{} {} is ready to install": "{} {} готов к установке",
+    "DaVinci Resolve Installer (*.run, *.zip)": "Установщик DaVinci Resolve (*.run, *.zip)",
+    "Extracting {}...": "Извлечение {}...",
+    "Step {}: Extracting DaVinci Resolve...": "Шаг {}: Извлечение DaVinci Resolve...",
+    "Installer (.run)": "Установщик (.run)",
+    "Extracted payload": "Распакованное содержимое",
+    "Built package": "Собранный пакет",
+    "Installed files": "Установленные файлы",
+    "{} {}: needs {}, {} free": "{} {}: требуется {}, свободно {}",
+    "Not enough disk space": "Недостаточно места на диске",
+    "Reclaim space": "Освободить место",
+    "Nothing to reclaim": "Нечего освобождать",
+    "Total: {}": "Всего: {}",
+    "No old DaVinci Resolve or opencl-amd packages were found.": "Старые пакеты DaVinci Resolve или opencl-amd не найдены.",
+    "Removing old packages...": "Удаление старых пакетов...",
+    "Old packages removed": "Старые пакеты удалены",
+    "The offline bundle in {} lacks: {}": "В офлайн-наборе в {} отсутствует: {}",
+    "Step {}: Building DaVinci Resolve...": "Шаг {}: Сборка DaVinci Resolve...",
+    "makepkg did not produce a package": "makepkg не создал пакет",
+    "The disk ran out of space": "На диске закончилось место",
+    "Free up space or choose a build directory on a larger drive, then try again.": "Освободите место или выберите каталог сборки на диске побольше, затем повторите попытку.",
+    "The package database is locked": "База данных пакетов заблокирована",
+    "Another package manager is running. Wait for it to finish; if none is running, remove /var/lib/pacman/db.lck.": "Запущен другой менеджер пакетов. Дождитесь его завершения; если ни один не запущен, удалите /var/lib/pacman/db.lck.",
+    "A PGP signature could not be verified": "Не удалось проверить подпись PGP",
+    "Import the missing key with 'gpg --recv-keys {0}' and try again.": "Импортируйте недостающий ключ командой 'gpg --recv-keys {0}' и повторите попытку.",
+    "A package signature is not trusted": "Подпись пакета не является доверенной",
+    "Update the keyring with 'sudo pacman -Sy archlinux-keyring' and run 'sudo pacman-key --populate'.": "Обновите связку ключей командой 'sudo pacman -Sy archlinux-keyring' и выполните 'sudo pacman-key --populate'.",
+    "Files of {0} already exist on the system": "Файлы {0} уже существуют в системе",
+    "Another package owns these files. Remove the conflicting package or, if the files are leftovers, delete them and try again.": "Эти файлы принадлежат другому пакету. Удалите конфликтующий пакет или, если это остатки, удалите файлы и повторите попытку.",
+    "{0} conflicts with an installed package": "{0} конфликтует с установленным пакетом",
+    "Remove the conflicting package, then run the installation again.": "Удалите конфликтующий пакет и запустите установку снова.",
+    "The package {0} could not be found": "Пакет {0} не найден",
+    "Update the package databases with 'sudo pacman -Syu' and check that the [extra] repository is enabled in /etc/pacman.conf.": "Обновите базы пакетов командой 'sudo pacman -Syu' и убедитесь, что репозиторий [extra] включён в /etc/pacman.conf.",
+    "A download failed": "Не удалось выполнить загрузку",
+    "Check the network connection, or install from an offline bundle.": "Проверьте сетевое подключение или выполните установку из офлайн-набора.",
+    "A downloaded package is corrupted": "Загруженный пакет повреждён",
+    "Remove it from /var/cache/pacman/pkg and try again.": "Удалите его из /var/cache/pacman/pkg и повторите попытку.",
+    "Administrator authentication failed": "Ошибка аутентификации администратора",
+    "Check the password and try again.": "Проверьте пароль и повторите попытку.",
+    "Building the package failed in {0}()": "Сборка пакета завершилась ошибкой в {0}()",
+    "See the log excerpt below; the installer file may be incomplete or damaged.": "См. фрагмент журнала ниже; файл установщика может быть неполным или повреждённым.",
+    "About {} left, based on earlier installs": "Осталось около {} (по данным прошлых установок)",
+    "Show progress": "Показать ход выполнения",
+    "Hide progress": "Скрыть ход выполнения",
+    "Search the log": "Поиск в журнале",
+    "Previous match": "Предыдущее совпадение",
+    "Next match": "Следующее совпадение",
+    "Follow new output": "Следить за новым выводом",
+    "View previous logs": "Просмотреть прошлые журналы",
+    "View log": "Открыть журнал",
+    "Installation": "Установка",
+    "Build": "Сборка",
+    "Removal": "Удаление",
+    "succeeded": "успешно",
+    "failed": "ошибка",
+    "interrupted": "прервано",
+    "No logs yet": "Журналов пока нет",
+    "Logs are kept for every install and removal from now on.": "Теперь журнал сохраняется для каждой установки и удаления.",
+    "Install logs": "Журналы установки",
+    "Full speed": "Полная скорость",
+    "In the background": "В фоновом режиме",
+    "Only when idle": "Только в простое",
+    "Install priority": "Приоритет установки",
+    "Verify installation": "Проверить установку",
+    "Verifying installation": "Проверка установки",
+    "Checking the installed files against the package...": "Сравнение установленных файлов с пакетом...",
+    "Close": "Закрыть",
+    "Verification failed": "Проверка не удалась",
+    "{} files don't match the package": "Файлов, не совпадающих с пакетом: {}",
+    "Reinstall DaVinci Resolve to repair them.": "Переустановите DaVinci Resolve, чтобы исправить их.",
+    "All installed files are intact": "Все установленные файлы в порядке",
+    "Step {}: Verifying installed files...": "Шаг {}: Проверка установленных файлов...",
+    "{} installed files don't match the package:": "Установленных файлов, не совпадающих с пакетом: {}",
+    "Install {} {} ({}) from {}": "Установка {} {} ({}) из {}",
+    "Priority: {}": "Приоритет: {}",
+    "Space:": "Место:",
+    "Staging in {}": "Подготовка в {}",
+    "The installer is moved there": "Установщик перемещается туда",
+    "The installer extracted by an earlier attempt is reused": "Используется установщик, извлечённый при прошлой попытке",
+    "The installer extracted next to the zip is reused": "Используется установщик, извлечённый рядом с zip",
+    "The installer is extracted from the zip": "Установщик извлекается из zip",
+    "Payload unpacked with {}": "Содержимое распаковывается через {}",
+    "Unchanged files are shared with {}": "Неизменённые файлы общие с {}",
+    "{} is kept next to the new version": "{} сохраняется рядом с новой версией",
+    "Dependencies:": "Зависимости:",
+    "From the offline bundle in {}": "Из офлайн-набора в {}",
+    "Missing from the bundle: {}": "Нет в наборе: {}",
+    "Could not ask pacman which are installed": "Не удалось узнать у pacman, что установлено",
+    "To install: {}": "Будут установлены: {}",
+    "All installed already": "Все уже установлены",
+    "opencl-amd is built from AUR": "opencl-amd собирается из AUR",
+    "Added to IgnorePkg: {}": "Добавлено в IgnorePkg: {}",
+    "Stages:": "Этапы:",
+    "total": "всего",
+    "No earlier install to predict the duration from": "Нет прошлых установок для оценки длительности",
+    "Preview": "Предпросмотр",
+    "Install plan": "План установки",
+    "Working out the install plan...": "Составление плана установки...",
+    "Back": "Назад",
+    "Copy as JSON": "Копировать как JSON",
+    "Could not plan the install": "Не удалось составить план установки",
+    "another install": "другая установка",
+    "Waiting for {} to finish ({} in the queue before this one)...": "Ожидание завершения {} (в очереди перед этой: {})...",
+    "Waiting for the package manager...": "Ожидание менеджера пакетов...",
+    "{} is not a valid package version": "{} не является допустимой версией пакета",
+    "Unknown placeholder in the recipe: {}": "Неизвестный заполнитель в рецепте: {}",
+    "No value for recipe placeholder: {}": "Нет значения для заполнителя рецепта: {}",
+    "Checking the recipe took longer than {} seconds": "Проверка рецепта заняла больше {} секунд",
+    "The recipe has a syntax error: {}": "В рецепте синтаксическая ошибка: {}",
+    "The recipe could not be read: {}": "Не удалось прочитать рецепт: {}",
+    "The recipe declares {} as {!r} instead of {!r}": "Рецепт объявляет {} как {!r} вместо {!r}",
+    "The recipe doesn't depend on {}": "Рецепт не зависит от {}",
+    "Import the missing key with 'gpg --recv-keys' (makepkg lists its ID above the error) and try again.": "Импортируйте недостающий ключ командой 'gpg --recv-keys' (makepkg выводит его ID над ошибкой) и повторите попытку.",
+    "Could not create a staging directory on {}": "Не удалось создать временный каталог на {}",
 }
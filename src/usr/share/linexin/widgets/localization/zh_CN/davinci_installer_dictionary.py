@@ -28,4 +28,134 @@ translations = {
     "Authentication Failed": "身份验证失败",
     "Incorrect password.": "密码错误。",
     "Installation failed": "安装失败",
+    "Check GPU readiness": "检查 GPU 就绪状态",
+    "Resolve is ready to launch": "Resolve 已准备好启动",
+    "OpenCL setup needs attention": "OpenCL 设置需要注意",
+    "Removal in progress. Do NOT close the app.": "正在卸载。请勿关闭应用。",
+    "Removing {}...": "正在卸载 {}...",
+    "Removal failed": "卸载失败",
+    "{} removed": "{} 已卸载",
+    "Reclaimed {} in {:.0f} s.": "在 {1:.0f} 秒内释放了 {0}。",
+    "DaVinci Resolve is not installed as a package.": "DaVinci Resolve 未以软件包形式安装。",
+    "Active version": "当前版本",
+    "Remove old versions": "删除旧版本",
+    "Remove old versions?": "删除旧版本？",
+    "Removing old versions...": "正在删除旧版本...",
+    "Old versions removed": "旧版本已删除",
+    "Could not switch version": "无法切换版本",
+    "Install": "安装",
+    "{} {} is ready to install": "{} {} 已可安装",
+    "DaVinci Resolve Installer (*.run, *.zip)": "DaVinci Resolve 安装程序 (*.run, *.zip)",
+    "Extracting {}...": "正在解压 {}...",
+    "Step {}: Extracting DaVinci Resolve...": "步骤 {}：正在解压 DaVinci Resolve...",
+    "Installer (.run)": "安装程序 (.run)",
+    "Extracted payload": "解压后的内容",
+    "Built package": "构建的软件包",
+    "Installed files": "已安装的文件",
+    "{} {}: needs {}, {} free": "{} {}：需要 {}，可用 {}",
+    "Not enough disk space": "磁盘空间不足",
+    "Reclaim space": "回收空间",
+    "Nothing to reclaim": "没有可回收的空间",
+    "Total: {}": "总计：{}",
+    "No old DaVinci Resolve or opencl-amd packages were found.": "未找到旧的 DaVinci Resolve 或 opencl-amd 软件包。",
+    "Removing old packages...": "正在删除旧软件包...",
+    "Old packages removed": "旧软件包已删除",
+    "The offline bundle in {} lacks: {}": "{} 中的离线包缺少：{}",
+    "Step {}: Building DaVinci Resolve...": "第 {} 步：正在构建 DaVinci Resolve...",
+    "makepkg did not produce a package": "makepkg 未生成软件包",
+    "The disk ran out of space": "磁盘空间已用尽",
+    "Free up space or choose a build directory on a larger drive, then try again.": "请释放空间或选择更大磁盘上的构建目录，然后重试。",
+    "The package database is locked": "软件包数据库已被锁定",
+    "Another package manager is running. Wait for it to finish; if none is running, remove /var/lib/pacman/db.lck.": "另一个软件包管理器正在运行。请等待其完成；如果没有正在运行的，请删除 /var/lib/pacman/db.lck。",
+    "A PGP signature could not be verified": "无法验证 PGP 签名",
+    "Import the missing key with 'gpg --recv-keys {0}' and try again.": "请使用 'gpg --recv-keys {0}' 导入缺失的密钥，然后重试。",
+    "A package signature is not trusted": "软件包签名不受信任",
+    "Update the keyring with 'sudo pacman -Sy archlinux-keyring' and run 'sudo pacman-key --populate'.": "请使用 'sudo pacman -Sy archlinux-keyring' 更新密钥环，然后运行 'sudo pacman-key --populate'。",
+    "Files of {0} already exist on the system": "{0} 的文件已存在于系统中",
+    "Another package owns these files. Remove the conflicting package or, if the files are leftovers, delete them and try again.": "这些文件属于另一个软件包。请移除冲突的软件包；如果是残留文件，请删除后重试。",
+    "{0} conflicts with an installed package": "{0} 与已安装的软件包冲突",
+    "Remove the conflicting package, then run the installation again.": "请移除冲突的软件包，然后重新运行安装。",
+    "The package {0} could not be found": "找不到软件包 {0}",
+    "Update the package databases with 'sudo pacman -Syu' and check that the [extra] repository is enabled in /etc/pacman.conf.": "请使用 'sudo pacman -Syu' 更新软件包数据库，并确认 /etc/pacman.conf 中已启用 [extra] 仓库。",
+    "A download failed": "下载失败",
+    "Check the network connection, or install from an offline bundle.": "请检查网络连接，或使用离线包安装。",
+    "A downloaded package is corrupted": "下载的软件包已损坏",
+    "Remove it from /var/cache/pacman/pkg and try again.": "请将其从 /var/cache/pacman/pkg 中删除后重试。",
+    "Administrator authentication failed": "管理员身份验证失败",
+    "Check the password and try again.": "请检查密码后重试。",
+    "Building the package failed in {0}()": "构建软件包在 {0}() 中失败",
+    "See the log excerpt below; the installer file may be incomplete or damaged.": "请参阅下方的日志摘录；安装程序文件可能不完整或已损坏。",
+    "About {} left, based on earlier installs": "根据以往的安装，大约还需 {}",
+    "Show progress": "显示进度",
+    "Hide progress": "隐藏进度",
+    "Search the log": "搜索日志",
+    "Previous match": "上一个匹配",
+    "Next match": "下一个匹配",
+    "Follow new output": "跟随新输出",
+    "View previous logs": "查看以前的日志",
+    "View log": "查看日志",
+    "Installation": "安装",
+    "Build": "构建",
+    "Removal": "移除",
+    "succeeded": "成功",
+    "failed": "失败",
+    "interrupted": "已中断",
+    "No logs yet": "暂无日志",
+    "Logs are kept for every install and removal from now on.": "从现在起，每次安装和移除都会保留日志。",
+    "Install logs": "安装日志",
+    "Full speed": "全速",
+    "In the background": "在后台",
+    "Only when idle": "仅在空闲时",
+    "Install priority": "安装优先级",
+    "Verify installation": "验证安装",
+    "Verifying installation": "正在验证安装",
+    "Checking the installed files against the package...": "正在将已安装的文件与软件包比对...",
+    "Close": "关闭",
+    "Verification failed": "验证失败",
+    "{} files don't match the package": "{} 个文件与软件包不一致",
+    "Reinstall DaVinci Resolve to repair them.": "请重新安装 DaVinci Resolve 以修复它们。",
+    "All installed files are intact": "所有已安装的文件均完好",
+    "Step {}: Verifying installed files...": "第 {} 步：正在验证已安装的文件...",
+    "{} installed files don't match the package:": "{} 个已安装的文件与软件包不一致：",
+    "Install {} {} ({}) from {}": "从 {3} 安装 {0} {1}（{2}）",
+    "Priority: {}": "优先级：{}",
+    "Space:": "空间：",
+    "Staging in {}": "暂存于 {}",
+    "The installer is moved there": "安装程序将被移动到该处",
+    "The installer extracted by an earlier attempt is reused": "重用之前尝试时解压的安装程序",
+    "The installer extracted next to the zip is reused": "重用 zip 旁已解压的安装程序",
+    "The installer is extracted from the zip": "从 zip 中解压安装程序",
+    "Payload unpacked with {}": "使用 {} 解包负载",
+    "Unchanged files are shared with {}": "未更改的文件与 {} 共享",
+    "{} is kept next to the new version": "{} 将与新版本并存",
+    "Dependencies:": "依赖项：",
+    "From the offline bundle in {}": "来自 {} 中的离线包",
+    "Missing from the bundle: {}": "离线包中缺少：{}",
+    "Could not ask pacman which are installed": "无法向 pacman 查询已安装的软件包",
+    "To install: {}": "待安装：{}",
+    "All installed already": "均已安装",
+    "opencl-amd is built from AUR": "opencl-amd 将从 AUR 构建",
+    "Added to IgnorePkg: {}": "加入 IgnorePkg：{}",
+    "Stages:": "阶段：",
+    "total": "总计",
+    "No earlier install to predict the duration from": "没有以往的安装记录可用于预估时长",
+    "Preview": "预览",
+    "Install plan": "安装计划",
+    "Working out the install plan...": "正在生成安装计划...",
+    "Back": "返回",
+    "Copy as JSON": "复制为 JSON",
+    "Could not plan the install": "无法生成安装计划",
+    "another install": "另一个安装",
+    "Waiting for {} to finish ({} in the queue before this one)...": "正在等待 {} 完成（前面还有 {} 个排队）...",
+    "Waiting for the package manager...": "正在等待软件包管理器...",
+    "{} is not a valid package version": "{} 不是有效的软件包版本",
+    "Unknown placeholder in the recipe: {}": "配方中有未知的占位符：{}",
+    "No value for recipe placeholder: {}": "配方占位符没有值：{}",
+    "Checking the recipe took longer than {} seconds": "检查配方超过了 {} 秒",
+    "The recipe has a syntax error: {}": "配方存在语法错误：{}",
+    "The recipe could not be read: {}": "无法读取配方：{}",
+    "The recipe declares {} as {!r} instead of {!r}": "配方将 {} 声明为 {!r}，而不是 {!r}",
+    "The recipe doesn't depend on {}": "配方未依赖 {}",
+    "Import the missing key with 'gpg --recv-keys' (makepkg lists its ID above the error) and try again.": "使用 'gpg --recv-keys' 导入缺失的密钥（makepkg 会在错误上方列出其 ID），然后重试。",
+    "Could not create a staging directory on {}": "无法在 {} 上创建暂存目录",
 }
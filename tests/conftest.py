@@ -0,0 +1,28 @@
+import os
+import sys
+
+WIDGETS = os.path.join(os.path.dirname(__file__), "..", "src", "usr", "share", "linexin", "widgets")
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+sys.path.insert(0, os.path.abspath(WIDGETS))
+
+
+def write_repo_db(repo_dir, names, provides=None):
+    """A pacman repo database listing ``names``, written without repo-add; returns its path."""
+    import io
+    import tarfile
+
+    provides = provides or {}
+    os.makedirs(repo_dir, exist_ok=True)
+    path = os.path.join(repo_dir, "davinci-offline.db.tar.gz")
+    with tarfile.open(path, "w:gz") as tar:
+        for name in names:
+            lines = ["%NAME%", name, "", "%VERSION%", "1.0-1", ""]
+            if name in provides:
+                lines += ["%PROVIDES%"] + list(provides[name]) + [""]
+            data = "\n".join(lines).encode()
+            info = tarfile.TarInfo(f"{name}-1.0-1/desc")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    os.symlink(os.path.basename(path), os.path.join(repo_dir, "davinci-offline.db"))
+    return path
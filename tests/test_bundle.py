@@ -0,0 +1,197 @@
+"""Offline bundles end to end: a file:// repo built with repo-add, no network.
+
+The dummy packages carry only a .PKGINFO; root operations go to the
+privileged helper's fake backend, which journals them instead of
+touching the system. What needs no real repo runs without repo-add.
+"""
+import io
+import json
+import os
+import shutil
+import subprocess
+import tarfile
+
+import pytest
+
+from davinci_installer import bundle, deps, privhelper
+from davinci_installer.engine import InstallEngine
+
+needs_repo_add = pytest.mark.skipif(shutil.which("repo-add") is None, reason="repo-add is not installed")
+needs_pacman = pytest.mark.skipif(shutil.which("pacman") is None, reason="pacman is not installed")
+
+OPENCL = "opencl-nvidia"
+# Virtual dependencies are satisfied through provides
+PROVIDERS = {"java-runtime": "jre-openjdk"}
+
+
+def _package(directory, name, provides=()):
+    lines = [f"pkgname = {name}", "pkgbase = " + name, "pkgver = 1.0-1",
+             f"pkgdesc = dummy {name}", "arch = any", "size = 0"]
+    lines += [f"provides = {p}" for p in provides]
+    data = ("\n".join(lines) + "\n").encode()
+    path = os.path.join(directory, f"{name}-1.0-1-any.pkg.tar.gz")
+    with tarfile.open(path, "w:gz") as tar:
+        info = tarfile.TarInfo(".PKGINFO")
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+    return path
+
+
+def _make_repo(repo_dir, leave_out=()):
+    os.makedirs(repo_dir)
+    files = []
+    for name in deps.AUR_DEPS + deps.REPO_DEPS + deps.LIBCXX + (OPENCL,):
+        if name in leave_out:
+            continue
+        if name in PROVIDERS:
+            files.append(_package(repo_dir, PROVIDERS[name], provides=[f"{name}=21"]))
+        else:
+            files.append(_package(repo_dir, name))
+    subprocess.run(
+        ["repo-add", "-q", os.path.join(repo_dir, bundle.REPO_NAME + ".db.tar.gz")] + files,
+        check=True, capture_output=True,
+    )
+    return repo_dir
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return _make_repo(str(tmp_path / bundle.BUNDLE_DIRNAME))
+
+
+@pytest.fixture
+def helper(tmp_path):
+    with privhelper.PrivilegedHelper.spawn(fake_root=str(tmp_path / "root")) as h:
+        yield h
+
+
+# ── Without a real repo ─────────────────────────────────────────────
+
+def test_is_bundle_and_find_bundle(tmp_path):
+    installer = str(tmp_path / "DaVinci_Resolve_20.0.1_Linux.run")
+    assert not bundle.is_bundle(str(tmp_path))
+    assert bundle.find_bundle(installer, {}) is None
+    repo = tmp_path / bundle.BUNDLE_DIRNAME
+    repo.mkdir()
+    (repo / (bundle.REPO_NAME + ".db")).write_bytes(b"")
+    assert bundle.is_bundle(str(repo))
+    assert bundle.find_bundle(installer, {}) == str(repo)
+    # A configured bundle wins, and is only used if it is one
+    assert bundle.find_bundle(installer, {"bundle_dir": str(tmp_path / "elsewhere")}) is None
+
+
+def test_pacman_conf_lists_only_the_bundle(tmp_path):
+    conf = bundle.pacman_conf(str(tmp_path / "repo"))
+    assert f"[{bundle.REPO_NAME}]" in conf
+    assert f"Server = file://{tmp_path / 'repo'}" in conf
+    # No other repository, so nothing is fetched from the network
+    assert conf.count("Server =") == 1 and "Include" not in conf
+
+
+def test_install_command_and_ops(tmp_path):
+    conf = str(tmp_path / "offline.conf")
+    command = bundle.install_command(conf, [OPENCL], "sudo -n")
+    assert command.count(f"sudo -n pacman --config {conf}") == 2
+    assert f" {OPENCL} " in command and "--overwrite '*' libc++ libc++abi" in command
+
+    repo_op, libs_op, forget_op = bundle.install_ops(conf, [OPENCL])
+    assert repo_op["config"] == conf and repo_op["refresh"] and repo_op["needed"]
+    assert repo_op["packages"] == list(deps.AUR_DEPS + deps.REPO_DEPS) + [OPENCL]
+    assert libs_op == privhelper.install_repo(
+        deps.LIBCXX, config=conf, refresh=False, needed=False, overwrite=["*"],
+    )
+    assert forget_op["op"] == "script"
+    assert os.path.join(bundle.SYNC_DIR, bundle.REPO_NAME + ".db") in forget_op["script"]
+    assert all(privhelper.validate(op) is None for op in (repo_op, libs_op, forget_op))
+
+
+def test_export_splits_a_multi_word_sudo(tmp_path):
+    commands = []
+
+    def _run(argv, env=None, cwd=None, on_line=None):
+        commands.append(argv)
+
+    bundle.export(str(tmp_path / "out"), [OPENCL], sudo="sudo -n", on_line=None, run=_run)
+    privileged = [argv for argv in commands if argv[0] == "sudo"]
+    assert [argv[:3] for argv in privileged] == [
+        ["sudo", "-n", "pacman"], ["sudo", "-n", "chown"], ["sudo", "-n", "rm"],
+    ]
+    assert next(a for a in commands if a[0] == "makepkg")
+
+
+# ── Against a repo built with repo-add ──────────────────────────────
+
+@needs_repo_add
+def test_bundle_is_recognised_and_complete(repo, tmp_path):
+    installer = str(tmp_path / "DaVinci_Resolve_20.0.1_Linux.run")
+    assert bundle.is_bundle(repo)
+    assert bundle.find_bundle(installer, {}) == repo
+    assert "java-runtime" in bundle.package_names(repo)
+    wanted = list(deps.AUR_DEPS + deps.REPO_DEPS + deps.LIBCXX) + [OPENCL]
+    assert bundle.missing_packages(repo, wanted) == []
+
+
+@needs_repo_add
+def test_missing_packages_lists_what_the_repo_lacks(tmp_path):
+    repo = _make_repo(str(tmp_path / "partial"), leave_out=("libc++abi", "gtk2"))
+    assert bundle.missing_packages(repo, ["glu", "gtk2", "libc++", "libc++abi"]) == ["gtk2", "libc++abi"]
+
+
+@needs_repo_add
+@needs_pacman
+def test_pacman_resolves_everything_from_the_bundle(repo, tmp_path):
+    conf = tmp_path / "offline.conf"
+    conf.write_text(bundle.pacman_conf(repo))
+    # A private database, so nothing here needs root: -Sp only prints
+    sync = tmp_path / "db" / "sync"
+    sync.mkdir(parents=True)
+    shutil.copy(os.path.join(repo, bundle.REPO_NAME + ".db"), sync / (bundle.REPO_NAME + ".db"))
+    wanted = list(deps.AUR_DEPS + deps.REPO_DEPS + deps.LIBCXX) + [OPENCL]
+    r = subprocess.run(
+        ["pacman", "--config", str(conf), "--dbpath", str(tmp_path / "db"),
+         "--gpgdir", str(tmp_path / "gnupg"), "--logfile", os.devnull,
+         "-Sp", "--print-format", "%n %r %l"] + wanted,
+        capture_output=True, text=True,
+    )
+    assert r.returncode == 0, r.stderr
+    printed = [line.split() for line in r.stdout.splitlines()]
+    names = {PROVIDERS.get(n, n) for n in wanted}
+    assert {p[0] for p in printed} == names
+    assert all(p[1] == bundle.REPO_NAME and p[2].startswith(f"file://{repo}/") for p in printed)
+
+
+@needs_repo_add
+def test_engine_installs_dependencies_from_the_bundle(repo, tmp_path, helper):
+    installer = str(tmp_path / "DaVinci_Resolve_20.0.1_Linux.run")
+    engine = InstallEngine({"build_dir": str(tmp_path / "build")}, helper=helper,
+                           echo=False, record_history=False)
+    engine.opencl_pkg = OPENCL
+    os.makedirs(engine.build_dir_for(installer))
+
+    plan = engine.dependency_plan(installer)
+    assert plan["bundle_dir"] == repo
+    assert plan["commands"] == [] and plan["opencl_amd"] is False
+    assert all(op.get("config") == plan["offline_conf"] for op in plan["root_ops"][:2])
+
+    engine.install_dependencies(1, installer)
+    with open(plan["offline_conf"]) as f:
+        assert f"file://{repo}" in f.read()
+    with open(tmp_path / "root" / "journal.jsonl") as f:
+        journal = [json.loads(line) for line in f]
+    assert [op["op"] for op in journal] == ["install_repo", "install_repo", "script"]
+    assert journal[0]["config"] == plan["offline_conf"]
+    assert journal[1]["packages"] == list(deps.LIBCXX) and journal[1]["overwrite"] == ["*"]
+    with open(tmp_path / "root" / "installed.json") as f:
+        installed = json.load(f)
+    assert set(deps.REPO_DEPS + deps.LIBCXX + (OPENCL,)) <= set(installed)
+
+
+@needs_repo_add
+def test_engine_refuses_an_incomplete_bundle(tmp_path, helper):
+    _make_repo(str(tmp_path / bundle.BUNDLE_DIRNAME), leave_out=("xmlsec",))
+    installer = str(tmp_path / "DaVinci_Resolve_20.0.1_Linux.run")
+    engine = InstallEngine({"build_dir": str(tmp_path / "build")}, helper=helper,
+                           echo=False, record_history=False)
+    engine.opencl_pkg = OPENCL
+    with pytest.raises(RuntimeError, match="lacks: xmlsec"):
+        engine.install_dependencies(1, installer)
@@ -0,0 +1,115 @@
+"""FleetDriver against stand-ins for ssh and scp that act on this machine.
+
+Every "host" is the local machine: the ssh stand-in runs the command here
+and logs it, the scp stand-in copies. The helper runs on its fake backend.
+"""
+import json
+import os
+import stat
+
+import pytest
+
+from conftest import write_repo_db
+from davinci_installer import deps, fleet, removal, versions
+
+PACKAGE = "davinci-resolve-20.0.1-1-x86_64.pkg.tar.zst"
+OPENCL = "opencl-nvidia"
+
+SSH = """#!/bin/sh
+host=$1; shift
+printf '%s\\t%s\\n' "$host" "$*" >> "$FLEET_SSH_LOG"
+case "$host $*" in
+    "no-helper "*privhelper.py*) echo "sudo: a password is required" >&2; exit 1 ;;
+esac
+exec sh -c "$*"
+"""
+
+SCP = """#!/bin/sh
+# scp FILE... HOST:DIR/
+for last; do :; done
+while [ "$#" -gt 1 ]; do
+    cp -r "$1" "${last#*:}"
+    shift
+done
+"""
+
+
+def _script(path, text):
+    path.write_text(text)
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    monkeypatch.setenv("FLEET_SSH_LOG", str(tmp_path / "ssh.log"))
+    monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state"))
+    monkeypatch.setattr(versions, "OPT_DIR", str(tmp_path / "opt"))
+    os.makedirs(tmp_path / "opt" / "resolve-20.0.1")
+    (tmp_path / "remote").mkdir()
+    package = tmp_path / PACKAGE
+    package.write_bytes(b"package")
+    repo = str(tmp_path / "davinci-offline-repo")
+    wanted = deps.AUR_DEPS + deps.REPO_DEPS + deps.LIBCXX + (OPENCL,)
+    write_repo_db(repo, [n for n in wanted if n != "java-runtime"] + ["jre-openjdk"],
+                  provides={"jre-openjdk": ["java-runtime=21"]})
+
+    def driver(hosts, **kwargs):
+        return fleet.FleetDriver(
+            hosts, str(package), repo, parallel=1,
+            ssh=[_script(tmp_path / "ssh", SSH)], scp=[_script(tmp_path / "scp", SCP)],
+            remote_tmp=str(tmp_path / "remote"), opencl=[OPENCL],
+            fake_root=str(tmp_path / "root"), **kwargs
+        )
+    return driver
+
+
+def _ssh_log(tmp_path):
+    with open(tmp_path / "ssh.log") as f:
+        return [line.rstrip("\n").split("\t", 1) for line in f]
+
+
+def test_installs_every_host_through_the_helper(setup, tmp_path):
+    events = []
+    summary = setup(["bay1", "bay2"], on_event=events.append).run()
+
+    assert summary["succeeded"] == 2 and summary["failed"] == 0
+    for result in summary["hosts"]:
+        assert result["ok"] and result["cleaned_up"]
+        assert list(result["timings"]) == list(fleet.STAGES)
+    # The engine's operations, host after host
+    with open(tmp_path / "root" / "journal.jsonl") as f:
+        journal = [json.loads(line) for line in f]
+    per_host = ["install_repo", "install_repo", "script", "install_files",
+                "chown", "script", "ignore"]
+    assert [op["op"] for op in journal] == per_host * 2
+    first = journal[:len(per_host)]
+    assert first[4]["uid"] == os.getuid() and first[4]["gid"] == os.getgid()
+    assert first[4]["path"] == str(tmp_path / "opt" / "resolve-20.0.1")
+    assert first[6]["packages"] == list(deps.LIBCXX) + ["davinci-resolve"]
+    # Only the first host changed IgnorePkg (both share the fake pacman.conf)
+    assert removal.added_ignores() == list(deps.LIBCXX) + ["davinci-resolve"]
+    assert any(e["stage"] == "install" and e["status"] == "output"
+               and e["line"].startswith(":: install_files " + PACKAGE) for e in events)
+
+
+def test_each_run_gets_its_own_private_directory(setup, tmp_path):
+    setup(["bay1", "bay2"]).run()
+    made = [cmd for _host, cmd in _ssh_log(tmp_path) if cmd.startswith("mktemp -d ")]
+    assert len(made) == 2
+    helpers = {cmd.split()[2] for _host, cmd in _ssh_log(tmp_path) if "privhelper.py" in cmd}
+    assert len(helpers) == 2
+    for path in helpers:
+        assert path.startswith(str(tmp_path / "remote" / "davinci-fleet."))
+    # Cleaned up afterwards
+    assert os.listdir(tmp_path / "remote") == []
+
+
+def test_a_failed_host_is_cleaned_up_too(setup, tmp_path):
+    summary = setup(["no-helper", "bay2"]).run()
+    failed, ok = summary["hosts"]
+    assert not failed["ok"] and failed["failed_stage"] == "dependencies"
+    assert "did not start" in failed["error"]
+    assert failed["cleaned_up"]
+    assert ok["ok"]
+    assert os.listdir(tmp_path / "remote") == []
@@ -0,0 +1,52 @@
+"""Waiting on pacman's database lock."""
+import os
+
+import pytest
+
+from davinci_installer import diagnose, locking
+
+
+def _proc(tmp_path, processes):
+    proc = tmp_path / "proc"
+    for pid, comm in processes.items():
+        (proc / str(pid)).mkdir(parents=True)
+        (proc / str(pid) / "comm").write_text(comm + "\n")
+    (proc / "self").mkdir(parents=True, exist_ok=True)
+    return str(proc)
+
+
+def test_package_manager_running(tmp_path):
+    assert locking.package_manager_running(_proc(tmp_path / "a", {1: "systemd", 812: "pacman"}))
+    assert not locking.package_manager_running(_proc(tmp_path / "b", {1: "systemd", 90: "bash"}))
+    # Without pid 1 the process list is hidden, so nothing can be ruled out
+    assert locking.package_manager_running(_proc(tmp_path / "c", {90: "bash"}))
+
+
+def test_waits_while_a_package_manager_holds_the_lock(tmp_path):
+    lock = tmp_path / "db.lck"
+    lock.touch()
+    pauses = []
+
+    def _sleep(seconds):
+        pauses.append(seconds)
+        if len(pauses) == 6:
+            os.unlink(lock)
+
+    waited = locking.wait_for_pacman(db_lock=str(lock), sleep=_sleep, running=lambda: True)
+    assert pauses == [1.0, 2.0, 4.0, 8.0, 15.0, 15.0]
+    assert waited == sum(pauses)
+
+
+def test_stale_lock_fails_with_the_db_locked_diagnosis(tmp_path):
+    lock = tmp_path / "db.lck"
+    lock.touch()
+    pauses = []
+    with pytest.raises(locking.StaleLockError) as info:
+        locking.wait_for_pacman(db_lock=str(lock), sleep=pauses.append, running=lambda: False)
+    assert sum(pauses) >= locking.STALE_AFTER
+    assert diagnose.diagnose(info.value.text)["rule"] == "db-locked"
+    assert str(lock) in str(info.value)
+
+
+def test_no_lock_no_wait(tmp_path):
+    assert locking.wait_for_pacman(db_lock=str(tmp_path / "db.lck"), sleep=None) == 0.0
@@ -0,0 +1,54 @@
+"""LogWriter: a search in the log view must not hold up the install's writes."""
+import threading
+
+from davinci_installer import logarchive
+
+
+def test_find_and_lines_across_chunks(tmp_path):
+    writer = logarchive.LogWriter(str(tmp_path / "run.log"), chunk_bytes=64)
+    for i in range(200):
+        writer.write(f"line {i}\n")
+    writer.write("partial")
+    assert writer.chunk_count() > 1
+    assert writer.find("LINE 150") == 150
+    assert writer.find("line 3", start=199, backwards=True) == 39
+    assert writer.find("partial") == 200
+    assert writer.lines(198, 5) == ["line 198", "line 199", "partial"]
+    assert writer.text().endswith("line 199\npartial\n")
+    writer.close()
+
+
+def test_search_does_not_block_writes(tmp_path):
+    writer = logarchive.LogWriter(str(tmp_path / "run.log"), chunk_bytes=64)
+    for i in range(200):
+        writer.write(f"line {i}\n")
+    reading = threading.Event()
+    release = threading.Event()
+    chunk_lines = writer._chunk_lines
+
+    def _slow_chunk(index):
+        reading.set()
+        release.wait(5)
+        return chunk_lines(index)
+
+    writer._chunk_lines = _slow_chunk
+    found = []
+    search = threading.Thread(target=lambda: found.append(writer.find("nowhere")))
+    search.start()
+    assert reading.wait(5)
+
+    def _write_more():
+        # Enough to publish another chunk while the search is inside one
+        for i in range(20):
+            writer.write(f"more {i}\n")
+
+    writes = threading.Thread(target=_write_more)
+    writes.start()
+    writes.join(2)
+    blocked = writes.is_alive()
+    release.set()
+    writes.join()
+    search.join()
+    assert not blocked
+    assert found == [None]
+    writer.close()
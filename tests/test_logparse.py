@@ -0,0 +1,90 @@
+"""LogParser against recorded paru/pacman/makepkg transcripts.
+
+The transcripts are kept as the terminal received them: colour escapes
+and ``\\r`` progress redraws included.
+"""
+import os
+
+from conftest import FIXTURES
+from davinci_installer import logparse
+
+TRANSCRIPTS = os.path.join(FIXTURES, "transcripts")
+
+
+def _lines(name):
+    # Split on \n only, so a line's \r redraws stay in it
+    with open(os.path.join(TRANSCRIPTS, name), newline="\n") as f:
+        return list(f)
+
+
+def _events(name):
+    parser = logparse.LogParser()
+    return [e for line in _lines(name) for e in parser.feed(line)]
+
+
+def test_paru_dependency_run():
+    events = _events("paru-deps.log")
+    assert [e["type"] for e in events] == [
+        "sync", "sync", "sync", "download", "download", "making", "warning", "built",
+        "installed", "installed",
+    ]
+    assert [e["repo"] for e in events[:3]] == ["core", "extra", "linexin-repo"]
+    assert events[3] == {"type": "download", "package": "xmlsec", "version": "1.3.7-1"}
+    # Only the last redraw of the progress bar counts
+    assert events[4]["percent"] == 100
+    assert events[5] == {"type": "making", "package": "qt5-location", "version": "5.15.16-1"}
+    assert events[6]["message"] == "Skipping verification of source file PGP signatures."
+    assert [(e["index"], e["total"], e["package"]) for e in events[8:]] == [
+        (1, 2, "xmlsec"), (2, 2, "qt5-location"),
+    ]
+
+
+def test_pacman_conflicts():
+    events = _events("pacman-conflict.log")
+    assert [e["type"] for e in events] == [
+        "conflict", "error", "error", "conflict", "error", "conflict", "conflict",
+    ]
+    assert events[0] == {"type": "conflict", "package": "davinci-resolve", "other": "davinci-resolve-studio"}
+    assert events[5] == {"type": "conflict", "package": "libc++", "path": "/usr/lib/libc++.so.1",
+                         "other": "libc++-git"}
+    assert events[6] == {"type": "conflict", "package": "libc++abi", "path": "/usr/lib/libc++abi.so.1"}
+
+
+def test_error_context_is_the_cleaned_lines_before_it():
+    events = _events("pacman-conflict.log")
+    commit = events[4]
+    assert commit["message"] == "failed to commit transaction (conflicting files)"
+    # Eight lines of context, blank lines skipped, escapes stripped
+    assert len(commit["context"]) == 8
+    assert commit["context"][-1] == "checking for file conflicts..."
+    assert commit["context"][4] == ":: davinci-resolve-20.0.1-1 and davinci-resolve-studio-20.0.1-1 are in conflict"
+    assert not any("\x1b" in line for line in commit["context"])
+
+
+def test_makepkg_failure():
+    events = _events("makepkg-error.log")
+    assert [e["type"] for e in events] == ["making", "error"]
+    assert events[0]["version"] == "20.1beta2-1"
+    assert events[1]["message"] == "A failure occurred in prepare()."
+    assert events[1]["context"][-1].startswith("chmod: cannot access './DaVinci_Resolve_20.1b2_Linux.run'")
+
+
+def test_clean_strips_ansi_and_keeps_last_redraw():
+    raw = _lines("paru-deps.log")[11]
+    assert "\r" in raw
+    assert logparse.clean(raw).startswith(" xmlsec-1.3.7-1-x86_64   240.0 KiB")
+    assert logparse.clean("\x1b[1;31merror:\x1b[0m boom\n") == "error: boom"
+    assert logparse.severity(logparse.clean("\x1b[1;33m==> WARNING:\x1b[0m x")) == logparse.WARNING
+
+
+def test_redraws_read_as_separate_lines():
+    # Popen(text=True) splits \r into lines of its own; the result is the same
+    # apart from the intermediate progress states
+    parser = logparse.LogParser()
+    events = []
+    for raw in _lines("paru-deps.log"):
+        for part in raw.replace("\r", "\n").splitlines():
+            events.extend(parser.feed(part + "\n"))
+    installed = [e for e in events if e["type"] == "installed"]
+    assert [e["package"] for e in installed] == ["xmlsec", "xmlsec", "qt5-location"]
+    assert [e["percent"] for e in events if e.get("percent") is not None] == [30, 100]
@@ -0,0 +1,63 @@
+"""OpenCL readiness on a GPU-less box: fixture vendor files, no driver loaded."""
+import os
+
+from conftest import FIXTURES
+from davinci_installer import opencl
+
+VENDORS = os.path.join(FIXTURES, "opencl")
+
+
+def _installed(*packages):
+    return lambda pkg: pkg in packages
+
+
+def test_enumerate_reads_library_and_vendor():
+    icds = opencl.enumerate_icds(os.path.join(VENDORS, "mixed"))
+    found = {os.path.basename(i["icd"]): (i["library"], i["vendor"], i["present"]) for i in icds}
+    assert found == {
+        "amdocl64.icd": ("/opt/rocm/lib/libamdocl64.so", "amd", False),
+        "intel.icd": ("/usr/lib/intel-opencl/libigdrcl.so", "intel", False),
+        # Bare sonames are left to the loader
+        "rusticl.icd": ("libRusticlOpenCL.so.1", "mesa", None),
+    }
+
+
+def test_ready_with_matching_icd_and_package():
+    report = opencl.check_readiness(
+        ["opencl-nvidia"], vendors_dir=os.path.join(VENDORS, "nvidia"),
+        is_installed=_installed("opencl-nvidia"), probe=None,
+    )
+    assert report["ready"], report["problems"]
+    assert report["devices"] is None
+    assert "probe" not in report["timings"]
+
+
+def test_missing_package_and_icd_are_reported():
+    report = opencl.check_readiness(
+        ["opencl-amd"], vendors_dir=os.path.join(VENDORS, "empty"),
+        is_installed=_installed(), probe=None,
+    )
+    assert not report["ready"]
+    assert report["problems"][0] == "Package opencl-amd is not installed"
+    assert report["problems"][1].startswith("No OpenCL ICD for opencl-amd found in ")
+
+
+def test_icd_pointing_at_missing_library():
+    report = opencl.check_readiness(
+        ["opencl-amd"], vendors_dir=os.path.join(VENDORS, "mixed"),
+        is_installed=_installed("opencl-amd"), probe=None,
+    )
+    assert report["problems"] == [
+        "amdocl64.icd points at missing library /opt/rocm/lib/libamdocl64.so",
+        "intel.icd points at missing library /usr/lib/intel-opencl/libigdrcl.so",
+    ]
+
+
+def test_probe_without_devices():
+    report = opencl.check_readiness(
+        ["opencl-nvidia"], vendors_dir=os.path.join(VENDORS, "nvidia"),
+        is_installed=_installed("opencl-nvidia"),
+        probe=lambda: {"platforms": 1, "devices": 0},
+    )
+    assert report["problems"] == ["The OpenCL loader reports no devices"]
+    assert "1 platform(s), 0 device(s)" in opencl.format_summary(report)
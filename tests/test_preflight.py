@@ -0,0 +1,78 @@
+"""Disk-space preflight against a fake filesystem.
+
+/ and /opt are one filesystem, /home is another; /mnt doesn't exist.
+"""
+import os
+from types import SimpleNamespace
+
+from davinci_installer import preflight
+
+GiB = 1024 ** 3
+DEVICES = {"/": 1, "/opt": 1, "/home": 2, "/home/user": 2, "/home/user/build": 2}
+FREE = {"/": 20 * GiB, "/home": 100 * GiB}
+
+
+def _stat(path):
+    if path not in DEVICES:
+        raise FileNotFoundError(path)
+    return SimpleNamespace(st_dev=DEVICES[path])
+
+
+def _statvfs(path):
+    return SimpleNamespace(f_bavail=FREE[path] // 4096, f_frsize=4096)
+
+
+def _check(stages):
+    return preflight.check(stages, statvfs=_statvfs, stat=_stat)
+
+
+def _stage(path, gib):
+    return {"stage": os.path.basename(path) or path, "path": path, "bytes": int(gib * GiB)}
+
+
+def test_stages_on_one_mount_are_summed():
+    report = _check([_stage("/home/user/build", 30), _stage("/home/user/build", 40)])
+    (home,) = report["mounts"]
+    assert home["mount"] == "/home"
+    assert home["required"] == int(70 * GiB * preflight.MARGIN)
+    assert len(home["stages"]) == 2
+    assert report["ok"]
+
+
+def test_each_mount_is_checked_on_its_own():
+    report = _check([_stage("/home/user/build", 60), _stage("/opt", 19.5)])
+    root, home = report["mounts"]
+    assert (root["mount"], home["mount"]) == ("/", "/home")
+    assert root["available"] == 20 * GiB and home["available"] == 100 * GiB
+    # 19.5 GiB plus the margin doesn't fit in 20 GiB, 60 GiB fits in 100
+    assert not root["ok"] and home["ok"]
+    assert not report["ok"]
+
+
+def test_not_enough_space_is_reported():
+    report = _check([_stage("/home/user/build", 99), _stage("/opt", 5)])
+    assert not report["ok"]
+    lines = preflight.format_report(report).splitlines()
+    assert lines[0].startswith("✓ /: needs ")
+    assert lines[2].startswith("✗ /home: needs ")
+    assert lines[2].endswith(" free")
+    assert lines[3].strip().startswith("build: ")
+
+
+def test_a_missing_path_counts_against_its_nearest_existing_parent():
+    assert preflight.existing_ancestor("/home/user/new/davinci_tmp", _stat) == "/home/user"
+    assert preflight.mount_point("/mnt/usb/build", _stat) == ("/", 1)
+    report = _check([_stage("/mnt/usb/build", 1), _stage("/home/user/new/davinci_tmp", 1),
+                     _stage("/opt", 0)])
+    assert [(m["mount"], len(m["stages"])) for m in report["mounts"]] == [("/", 1), ("/home", 1)]
+
+
+def test_a_run_on_the_build_filesystem_is_moved_not_copied():
+    same = preflight.plan_stages("/home/user/DaVinci_Resolve_20.0.1_Linux.run", 3 * GiB,
+                                 "/home/user/build", stat=_stat)
+    other = preflight.plan_stages("/mnt/usb/DaVinci_Resolve_20.0.1_Linux.run", 3 * GiB,
+                                  "/home/user/build", stat=_stat)
+    assert same[0]["bytes"] == 0
+    assert other[0]["bytes"] == 3 * GiB
+    assert same[-1] == {"stage": same[-1]["stage"], "path": "/opt",
+                        "bytes": preflight.estimate_payload(3 * GiB)}
@@ -0,0 +1,111 @@
+"""The privileged helper over its pipe, with the unprivileged fake backend."""
+import io
+import json
+
+import pytest
+
+from davinci_installer import privhelper
+
+
+@pytest.fixture
+def root(tmp_path):
+    return tmp_path / "root"
+
+
+@pytest.fixture
+def helper(root):
+    with privhelper.PrivilegedHelper.spawn(fake_root=str(root)) as h:
+        yield h
+
+
+def _journal(root):
+    with open(root / "journal.jsonl") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_starts_on_the_fake_backend(helper):
+    assert helper.backend == "fake"
+    assert helper.proc.poll() is None
+
+
+def test_runs_a_queue_and_reports_every_operation(helper, root, tmp_path):
+    target = tmp_path / "opt" / "resolve-20.0.1"
+    (target / "bin").mkdir(parents=True)
+    (target / "bin" / "resolve").write_text("")
+    lines = []
+    result = helper.run([
+        privhelper.install_repo(["glu", "gtk2"]),
+        privhelper.chown(str(target), 1000, 1000),
+        privhelper.ignore("add", ["libc++", "davinci-resolve"]),
+        privhelper.script("true", name="activate"),
+    ], on_line=lines.append)
+
+    assert result["ok"] and result["error"] is None
+    assert [r["index"] for r in result["results"]] == [0, 1, 2, 3]
+    assert all(r["ok"] for r in result["results"])
+    assert result["results"][2]["changed"] == ["libc++", "davinci-resolve"]
+    assert ":: install_repo glu gtk2\n" in lines
+    assert "(2/2) installing gtk2\n" in lines
+    assert "changed ownership of 3 entries\n" in lines
+    assert ":: script activate\n" in lines
+    assert [op["op"] for op in _journal(root)] == ["install_repo", "chown", "ignore", "script"]
+    with open(root / "installed.json") as f:
+        assert json.load(f) == {"glu": "repo", "gtk2": "repo"}
+    with open(root / "etc" / "pacman.conf") as f:
+        assert "IgnorePkg = libc++ davinci-resolve" in f.read()
+
+
+def test_a_failing_operation_stops_the_queue(helper, tmp_path):
+    result = helper.run([
+        privhelper.ignore("add", ["a"]),
+        privhelper.install_files([str(tmp_path / "missing-1.0-1-x86_64.pkg.tar.zst")]),
+        privhelper.ignore("add", ["b"], optional=True),
+    ])
+    assert not result["ok"]
+    assert result["error"] == "pacman exited with status 1"
+    first, failed, skipped = result["results"]
+    assert first["ok"]
+    assert not failed["ok"] and failed["error"] == result["error"]
+    assert skipped["skipped"] and not skipped["ok"]
+
+
+def test_an_optional_failure_lets_the_queue_go_on(helper):
+    result = helper.run([
+        {"op": "ignore", "action": "toggle", "packages": ["a"], "optional": True},
+        privhelper.remove(["never-installed"]),
+    ])
+    assert not result["ok"]
+    bad, removed = result["results"]
+    assert bad["error"] == "ignore: unknown action 'toggle'"
+    assert not removed.get("skipped") and removed["error"] == "pacman exited with status 1"
+
+
+def test_the_helper_outlives_bad_operations(helper, tmp_path):
+    result = helper.run([{"op": "format_disk"}, privhelper.chown(str(tmp_path / "gone"), 0, 0)])
+    assert not result["ok"] and result["error"] == "unknown operation: 'format_disk'"
+    # An argument of the wrong type fails inside the backend
+    result = helper.run([{"op": "ignore", "action": "add", "packages": 5}])
+    assert not result["ok"] and result["error"].startswith("ignore: TypeError")
+    assert helper.proc.poll() is None
+    assert helper.run([privhelper.ignore("add", ["a"])])["ok"]
+
+
+def test_malformed_requests_get_an_answer(root):
+    requests = io.StringIO(
+        "not json\n"
+        + json.dumps({"id": 7, "ops": None}) + "\n"
+        + json.dumps({"id": 8, "ops": []}) + "\n"
+    )
+    out = io.StringIO()
+    privhelper.serve(privhelper.FakeBackend(str(root)), stdin=requests, stdout=out)
+    events = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [(e["event"], e.get("id"), e.get("ok")) for e in events] == [
+        ("ready", None, None), ("done", None, False), ("done", 7, False), ("done", 8, True),
+    ]
+    assert events[1]["error"].startswith("malformed request")
+
+
+def test_the_client_stops_on_an_unattributable_answer(helper):
+    helper.proc.stdin.write("not json\n")
+    with pytest.raises(privhelper.HelperError, match="malformed request"):
+        helper.run([privhelper.ignore("add", ["a"])])